@@ -3,7 +3,7 @@
 
 # author        :   Juno Park
 # created date  :   2024.03.03
-# modified date :   2024.03.23
+# modified date :   2026.10.18
 # description   :   Nuke_player에 필요한 기능을 모아둔 유틸리티 클래스
 
 # ffmpeg-python :   pip install ffmpeg-python
@@ -14,6 +14,8 @@ import subprocess
 import shutil
 import mimetypes
 import re
+import tempfile
+from concurrent import futures
 
 sys.path.append("/home/rapa/libs_nuke")  # ffmpeg path
 import ffmpeg
@@ -21,6 +23,8 @@ from PySide2 import QtWidgets, QtGui
 
 # sys.path.append("/home/rapa/workspace/python/Nuke_player")
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+from NP_libs.system import cache as cache_lib
+from NP_libs.system import sequence as sequence_lib
 
 
 class NP_Utils:
@@ -53,6 +57,143 @@ class NP_Utils:
             print(f"\033[31m\nERROR: 썸네일을 추출하는 동안 오류가 발생했습니다:\033[0m", err)
             return False
 
+    @staticmethod
+    def media_input(file_path: str, seek: float = 0.0, **kwargs):
+        """
+        :param file_path: 영상 경로 또는 printf 형식의 시퀀스 경로
+        :param seek: 읽기 시작할 위치(초)
+        :param kwargs: ffmpeg 입력 옵션
+        :return: ffmpeg 입력 스트림
+        시퀀스는 첫 프레임 번호와 기본 fps를 지정하고, 짧은 시퀀스에서도 프레임을 얻을 수 있도록
+        seek이 마지막 프레임을 넘지 않게 조정함
+        """
+        if sequence_lib.is_pattern(file_path):
+            seq = sequence_lib.find_sequence(file_path)
+            if seq is None:
+                raise FileNotFoundError(f"Sequence {file_path} not found.")
+            fps = sequence_lib.DEFAULT_FPS
+            seek = min(seek, (len(seq) - 1) / fps)
+            kwargs.setdefault("framerate", fps)
+            kwargs.setdefault("start_number", seq.first)
+            if seq.ext.lower() == ".exr":
+                # 선형 EXR을 sRGB로 변환하여 디코딩
+                kwargs.setdefault("apply_trc", "iec61966_2_1")
+        elif not os.path.exists(file_path):
+            raise FileNotFoundError(f"File {file_path} not found.")
+        if seek:
+            kwargs["ss"] = seek
+        return ffmpeg.input(file_path, **kwargs)
+
+    @staticmethod
+    def extract_thumbnail_levels(video_path: str, output_paths: dict) -> bool:
+        """
+        :param video_path: 썸네일을 추출하고자 하는 영상 경로
+        :param output_paths: {썸네일의 너비: 저장할 경로}
+        :return: 썸네일이 정상적으로 추출되면 True, 그렇지 않으면 False
+        한 번의 디코딩으로 프레임을 나눈 뒤 각각의 너비로 축소하여 여러 해상도의 썸네일을 추출
+        """
+        levels = sorted(output_paths.items())
+        try:
+            split = NP_Utils.media_input(video_path, seek=1).filter_multi_output(
+                "split", len(levels)
+            )
+            outputs = [
+                split.stream(idx).filter("scale", width, -2).output(path, vframes=1)
+                for idx, (width, path) in enumerate(levels)
+            ]
+            ffmpeg.merge_outputs(*outputs).run(capture_stdout=True, capture_stderr=True)
+            return True
+        except ffmpeg.Error as err:
+            print("FFMPEG error:", err.stderr.decode("utf8"))
+            return False
+        except Exception as err:
+            print(f"\033[31m\nERROR: 썸네일을 추출하는 동안 오류가 발생했습니다:\033[0m", err)
+            return False
+
+    @staticmethod
+    def extract_thumbnail_image(video_path: str, width: int) -> QtGui.QImage or None:
+        """
+        :param video_path: 썸네일을 추출하고자 하는 영상 경로
+        :param width: 썸네일의 너비 (높이는 비율에 맞춰 짝수로 계산됨)
+        :return: 추출된 프레임의 QImage, 추출에 실패하면 None
+        jpg로 인코딩하여 파일로 저장하지 않고, rgb24 프레임을 stdout으로 받아 바로 QImage로 만듦
+        """
+        try:
+            out, _ = (
+                NP_Utils.media_input(video_path, seek=1)
+                .filter("scale", width, -2)
+                .output("pipe:", vframes=1, format="rawvideo", pix_fmt="rgb24")
+                .run(capture_stdout=True, capture_stderr=True)
+            )
+        except ffmpeg.Error as err:
+            print("FFMPEG error:", err.stderr.decode("utf8"))
+            return None
+        except Exception as err:
+            print(f"\033[31m\nERROR: 썸네일을 추출하는 동안 오류가 발생했습니다:\033[0m", err)
+            return None
+
+        # 출력된 바이트 수로 높이를 계산 (픽셀당 3바이트)
+        height = len(out) // (width * 3)
+        if height == 0:
+            return None
+        image = QtGui.QImage(out, width, height, width * 3, QtGui.QImage.Format_RGB888)
+        # QImage는 버퍼를 복사하지 않으므로 out이 해제되기 전에 복사본을 반환
+        return image.copy()
+
+    @staticmethod
+    def read_frame_image(image_path: str, width: int = None) -> QtGui.QImage or None:
+        """
+        :param image_path: Qt가 읽을 수 없는 형식(exr, dpx 등)의 이미지 경로
+        :param width: 축소할 너비, None이면 원본 크기
+        :return: ffmpeg로 디코딩한 QImage, 실패하면 None
+        ppm으로 stdout에 출력하여 헤더에 담긴 크기로 바로 QImage를 만듦
+        """
+        kwargs = dict()
+        if image_path.lower().endswith(".exr"):
+            kwargs["apply_trc"] = "iec61966_2_1"
+        stream = ffmpeg.input(image_path, **kwargs)
+        if width:
+            stream = stream.filter("scale", width, -2)
+        try:
+            out, _ = stream.output(
+                "pipe:", vframes=1, format="image2pipe", vcodec="ppm"
+            ).run(capture_stdout=True, capture_stderr=True)
+        except ffmpeg.Error as err:
+            print("FFMPEG error:", err.stderr.decode("utf8"))
+            return None
+        image = QtGui.QImage.fromData(out, "PPM")
+        return None if image.isNull() else image
+
+    @staticmethod
+    def extract_filmstrip(
+        video_path: str, output_path: str, frames: int, width: int
+    ) -> bool:
+        """
+        :param video_path: 필름스트립을 추출하고자 하는 영상 경로
+        :param output_path: 필름스트립을 저장할 경로
+        :param frames: 추출할 프레임 수
+        :param width: 프레임 하나의 너비
+        :return: 필름스트립이 정상적으로 추출되면 True, 그렇지 않으면 False
+        영상 전체에서 일정한 간격으로 frames개의 프레임을 뽑아 가로로 이어 붙인 한 장의 이미지로 저장
+        """
+        try:
+            duration = NP_Utils.get_media_info(video_path).duration
+            (
+                NP_Utils.media_input(video_path)
+                .filter("fps", fps=frames / duration)
+                .filter("scale", width, -2)
+                .filter("tile", f"{frames}x1")
+                .output(output_path, vframes=1)
+                .run(capture_stdout=True, capture_stderr=True)
+            )
+            return True
+        except ffmpeg.Error as err:
+            print("FFMPEG error:", err.stderr.decode("utf8"))
+            return False
+        except Exception as err:
+            print(f"\033[31m\nERROR: 필름스트립을 추출하는 동안 오류가 발생했습니다:\033[0m", err)
+            return False
+
     @staticmethod
     def extract_thumbnail_subprocess(
         video_path: str, output_path: str, size: str
@@ -87,35 +228,118 @@ class NP_Utils:
             return False
 
     @staticmethod
-    def get_video_fps(file_path: str) -> int:
+    def probe_media_info(file_path: str) -> cache_lib.MediaInfo:
         """
-        :param file_path: fps를 추출할 파일의 경로
-        :return: numerator와 denominator를 추출하여 fps값을 반환
+        :param file_path: 정보를 추출할 영상 경로
+        :return: ffprobe를 한 번 실행하여 얻은 영상 정보
+        시퀀스는 첫 프레임을 probe하고 프레임 수와 기본 fps로 길이를 계산
         """
-        probe = ffmpeg.probe(file_path)
-        video_info = next(
-            stream for stream in probe["streams"] if stream["codec_type"] == "video"
+        if sequence_lib.is_pattern(file_path):
+            seq = sequence_lib.find_sequence(file_path)
+            if seq is None:
+                raise FileNotFoundError(f"Sequence {file_path} not found.")
+            info = cache_lib.MediaInfo.from_probe(
+                ffmpeg.probe(seq.frame_path(seq.first))
+            )
+            return info.for_sequence(len(seq), sequence_lib.DEFAULT_FPS)
+        return cache_lib.MediaInfo.from_probe(ffmpeg.probe(file_path))
+
+    @staticmethod
+    def get_media_info(file_path: str) -> cache_lib.MediaInfo:
+        """
+        :param file_path: 정보를 얻을 영상 경로
+        :return: 캐시에 저장된 영상 정보, 없으면 한 번만 ffprobe를 실행하여 저장한 뒤 반환
+        경로, 크기, 수정 시간이 같으면 프로세스가 달라도(뷰어) 다시 probe하지 않음
+        """
+        media_cache = cache_lib.SingletonMediaCache()
+        key = media_cache.make_key(file_path)
+        info = media_cache.get_media_info(key)
+        if info is None:
+            info = NP_Utils.probe_media_info(file_path)
+            media_cache.put_media_info(key, info)
+        return info
+
+    @staticmethod
+    def get_cached_media_info(file_path: str) -> cache_lib.MediaInfo or None:
+        """
+        :param file_path: 정보를 얻을 영상 경로
+        :return: 캐시에 저장된 영상 정보, 없으면 ffprobe를 실행하지 않고 None
+        GUI 스레드에서 probe로 멈추지 않도록 워커 스레드에서 미리 읽은 정보만 사용할 때 사용
+        """
+        media_cache = cache_lib.SingletonMediaCache()
+        try:
+            key = media_cache.make_key(file_path)
+        except OSError:
+            return None
+        return media_cache.get_media_info(key)
+
+    @staticmethod
+    def probe_frame_index(file_path: str) -> cache_lib.FrameIndex:
+        """
+        :param file_path: 인덱스를 만들 영상 경로
+        :return: 비디오 스트림의 패킷을 한 번 읽어(디코딩 없음) 만든 프레임 인덱스
+        """
+        probe = ffmpeg.probe(
+            file_path, select_streams="v:0", show_entries="packet=pts_time,flags"
         )
-        fps_str = video_info["avg_frame_rate"]
-        numerator, denominator = map(int, fps_str.split("/"))
-        return numerator / denominator
+        return cache_lib.FrameIndex.from_packets(probe.get("packets", []))
+
+    @staticmethod
+    def get_frame_index(
+        file_path: str, build: bool = True
+    ) -> cache_lib.FrameIndex or None:
+        """
+        :param file_path: 영상 경로 (시퀀스는 프레임 번호가 정확하므로 인덱스가 없음)
+        :param build: False이면 캐시에 있는 인덱스만 반환 (GUI 스레드에서 사용)
+        :return: 캐시에 저장된 프레임 인덱스, 없으면 ffprobe로 만들어 저장한 뒤 반환
+        """
+        if sequence_lib.is_pattern(file_path):
+            return None
+        media_cache = cache_lib.SingletonMediaCache()
+        try:
+            key = media_cache.make_key(file_path)
+        except OSError:
+            return None
+        index = media_cache.get_frame_index(key)
+        if index is None and build:
+            index = NP_Utils.probe_frame_index(file_path)
+            media_cache.put_frame_index(key, index)
+        return index
+
+    @staticmethod
+    def get_proxy(
+        video_path: str, width: int = cache_lib.MediaCache.PROXY_WIDTH
+    ) -> str or None:
+        """
+        :param video_path: 원본 영상 경로
+        :param width: 프록시의 너비
+        :return: 캐시에 저장된 프록시 경로, 없으면 None
+        """
+        if sequence_lib.is_pattern(video_path):
+            return None
+        proxy_cache = cache_lib.SingletonProxyCache()
+        try:
+            key = proxy_cache.make_key(video_path)
+        except OSError:
+            return None
+        return proxy_cache.get(key, proxy_cache.proxy_name(width))
+
+    @staticmethod
+    def get_video_fps(file_path: str) -> float:
+        """
+        :param file_path: fps를 추출할 파일의 경로
+        :return: 캐시된 영상 정보의 fps값을 반환
+        """
+        return NP_Utils.get_media_info(file_path).fps
 
     @staticmethod
     def get_video_resolution(file_path: str) -> tuple:
         """
         :param file_path: 해상도를 추출할 파일의 경로
-        :return: 해상도를 width와 heiget 형태로 추출하여 pixel, width, height값을 튜플로 반환
+        :return: 캐시된 영상 정보의 pixel, width, height값을 튜플로 반환
         """
-        probe = ffmpeg.probe(file_path)
-        video_stream = next(
-            (stream for stream in probe["streams"] if stream["codec_type"] == "video"),
-            None,
-        )
-        width = int(video_stream["width"])
-        height = int(video_stream["height"])
-        pixel = width * height
-        result = (pixel, width, height)
-        return result
+        info = NP_Utils.get_media_info(file_path)
+        return info.pixel, info.width, info.height
 
     @staticmethod
     def make_dirs(dir_path: str) -> bool:
@@ -241,6 +465,118 @@ class NP_Utils:
             print("ffmpeg error\n", e.stderr)
         return output
 
+    @staticmethod
+    def sequence_to_video(
+        pattern: str, start_number: int, output_path: str, fps=24
+    ) -> bool:
+        """
+        :param pattern: printf 형식의 시퀀스 경로 ex) /plates/shot.%04d.exr
+        :param start_number: 시퀀스의 첫 프레임 번호
+        :param output_path: 결과물을 출력할 파일 경로
+        :param fps: 변환할 영상의 fps
+        :return: 정상적으로 변환되면 True, 그렇지 않으면 False
+        glob 대신 패턴을 사용하므로 한 디렉토리에 여러 시퀀스가 있어도 해당 시퀀스만 변환됨
+        청크로 나누어 변환하는 경우와 같은 색 변환을 적용하도록 media_input을 사용
+        """
+        try:
+            NP_Utils.media_input(pattern, framerate=fps, start_number=start_number).output(
+                output_path, codec="libx264", pix_fmt="yuv420p", r=fps
+            ).run(capture_stdout=True, capture_stderr=True, overwrite_output=True)
+            return True
+        except FileNotFoundError as err:
+            print(f"\033[31mERROR: {err}\033[0m")
+            return False
+        except ffmpeg.Error as e:
+            print("ffmpeg error\n", e.stderr)
+            return False
+
+    @staticmethod
+    def chunk_size(first: int, last: int, max_workers: int = None, min_chunk: int = 48) -> int:
+        """
+        :param first: 시퀀스의 첫 프레임 번호
+        :param last: 시퀀스의 마지막 프레임 번호
+        :param max_workers: 동시에 실행할 ffmpeg 프로세스 수 (기본값: CPU 코어 수)
+        :param min_chunk: 청크 하나의 최소 프레임 수
+        :return: sequence_to_video_chunked가 나누는 청크 하나의 프레임 수
+        청크 수는 len(range(first, last + 1, size)), 진행 상황을 미리 계산할 때 사용
+        """
+        max_workers = max(1, max_workers or os.cpu_count() or 1)
+        return max(min_chunk, -(-(last - first + 1) // max_workers))
+
+    @staticmethod
+    def sequence_to_video_chunked(
+        pattern: str,
+        first: int,
+        last: int,
+        output_path: str,
+        fps=24,
+        max_workers: int = None,
+        min_chunk: int = 48,
+        progress=None,
+    ) -> bool:
+        """
+        :param pattern: printf 형식의 시퀀스 경로 ex) /plates/shot.%04d.exr
+        :param first: 시퀀스의 첫 프레임 번호
+        :param last: 시퀀스의 마지막 프레임 번호
+        :param output_path: 결과물을 출력할 파일 경로
+        :param fps: 변환할 영상의 fps
+        :param max_workers: 동시에 실행할 ffmpeg 프로세스 수 (기본값: CPU 코어 수)
+        :param min_chunk: 청크 하나의 최소 프레임 수
+        :param progress: 청크 하나의 인코딩이 끝날 때마다 (완료된 청크 수, 전체 청크 수)로 호출
+        :return: 정상적으로 변환되면 True, 그렇지 않으면 False
+        프레임 범위를 청크로 나누어 각각의 ffmpeg 프로세스로 동시에 인코딩한 뒤,
+        재인코딩 없이(concat, -c copy) 하나의 영상으로 이어 붙임
+        """
+        cpu_count = os.cpu_count() or 1
+        max_workers = max(1, max_workers or cpu_count)
+        size = NP_Utils.chunk_size(first, last, max_workers, min_chunk)
+        starts = list(range(first, last + 1, size))
+        # 청크가 하나면 기존 방식으로 변환
+        if len(starts) == 1:
+            result = NP_Utils.sequence_to_video(pattern, first, output_path, fps)
+            if progress is not None:
+                progress(1, 1)
+            return result
+
+        # 프로세스끼리 코어를 나눠 쓰도록 프로세스당 스레드 수를 제한
+        threads = max(1, cpu_count // max_workers)
+        temp_dir = tempfile.mkdtemp(prefix=".chunks_", dir=os.path.dirname(output_path))
+
+        def encode(idx: int, start: int) -> str:
+            chunk = os.path.join(temp_dir, f"chunk_{idx:04d}.mp4")
+            NP_Utils.media_input(pattern, framerate=fps, start_number=start).output(
+                chunk,
+                vframes=min(size, last - start + 1),
+                codec="libx264",
+                pix_fmt="yuv420p",
+                r=fps,
+                threads=threads,
+            ).run(capture_stdout=True, capture_stderr=True)
+            return chunk
+
+        try:
+            with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                jobs = [executor.submit(encode, i, start) for i, start in enumerate(starts)]
+                for done, job in enumerate(futures.as_completed(jobs), 1):
+                    job.result()
+                    if progress is not None:
+                        progress(done, len(jobs))
+            # 각 청크는 키프레임으로 시작하므로 스트림 복사만으로 이어 붙일 수 있음
+            list_path = os.path.join(temp_dir, "chunks.txt")
+            with open(list_path, "w") as fp:
+                for job in jobs:
+                    chunk = job.result().replace("'", "'\\''")
+                    fp.write(f"file '{chunk}'\n")
+            ffmpeg.input(list_path, format="concat", safe=0).output(
+                output_path, c="copy"
+            ).run(capture_stdout=True, capture_stderr=True, overwrite_output=True)
+            return True
+        except ffmpeg.Error as e:
+            print("ffmpeg error\n", e.stderr)
+            return False
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
     @staticmethod
     def exist_missing_numbers(directory_path: str, extension: str) -> None or int:
         """
@@ -3,10 +3,12 @@
 
 # author        : Seongcheol Jeon
 # created date  : 2024.02.15
-# modified date : 2024.02.15
+# modified date : 2026.10.18
 # description   :
 
 import typing
+import threading
+import collections
 
 
 class _SingletonWrapper:
@@ -121,5 +123,86 @@ class Stack:
         return self.top is None
 
 
+class LRUCache:
+    """
+    용량(byte)을 기준으로 가장 오래 사용하지 않은 항목부터 삭제하는 캐시
+    여러 스레드에서 동시에 사용할 수 있음
+    """
+
+    def __init__(self, max_bytes: int):
+        self.__max_bytes = max_bytes
+        self.__items = collections.OrderedDict()  # {key: (value, nbytes)}
+        self.__total_bytes = 0
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __contains__(self, key) -> bool:
+        return key in self.__items
+
+    @property
+    def max_bytes(self) -> int:
+        return self.__max_bytes
+
+    @property
+    def total_bytes(self) -> int:
+        return self.__total_bytes
+
+    def keys(self) -> typing.List[typing.Any]:
+        with self.__lock:
+            return list(self.__items.keys())
+
+    def get(self, key, default=None) -> typing.Any:
+        with self.__lock:
+            item = self.__items.get(key)
+            if item is None:
+                return default
+            self.__items.move_to_end(key)
+            return item[0]
+
+    def put(self, key, value, nbytes: int) -> typing.List[typing.Tuple]:
+        """
+        :return: 용량을 넘어 삭제된 (key, value) 리스트
+        """
+        with self.__lock:
+            old = self.__items.pop(key, None)
+            if old is not None:
+                self.__total_bytes -= old[1]
+            self.__items[key] = (value, nbytes)
+            self.__total_bytes += nbytes
+            return self.__evict(keep=key)
+
+    def pop(self, key, default=None) -> typing.Any:
+        with self.__lock:
+            item = self.__items.pop(key, None)
+            if item is None:
+                return default
+            self.__total_bytes -= item[1]
+            return item[0]
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__items.clear()
+            self.__total_bytes = 0
+
+    def set_max_bytes(self, max_bytes: int) -> typing.List[typing.Tuple]:
+        with self.__lock:
+            self.__max_bytes = max_bytes
+            return self.__evict()
+
+    def __evict(self, keep=None) -> typing.List[typing.Tuple]:
+        evicted = list()
+        for key in list(self.__items.keys()):
+            if self.__total_bytes <= self.__max_bytes:
+                break
+            if key == keep:
+                continue
+            value, nbytes = self.__items.pop(key)
+            self.__total_bytes -= nbytes
+            evicted.append((key, value))
+        return evicted
+
+
 if __name__ == '__main__':
     pass
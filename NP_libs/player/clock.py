@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# encoding=utf-8
+
+# author        :   Juno Park
+# created date  :   2026.10.18
+# modified date :   2026.10.18
+# description   :   뷰어의 슬라이더와 시간 표시를 갱신하는 GUI 스레드의 공용 타이머
+#                   뷰어마다 폴링 스레드를 두지 않고, 하나의 타이머가 화면 주사율에 맞춰
+#                   등록된 뷰어 중 화면에 보이는 것만 호출함
+#                   재생 중인 뷰어가 없으면 타이머를 멈추어 대기 상태에서 CPU를 사용하지 않음
+
+from PySide2 import QtCore, QtGui
+from NP_libs.algorithm import library as algo_lib
+
+
+class PlaybackClock(QtCore.QObject):
+    def __init__(self, interval: int = None):
+        """
+        :param interval: 갱신 간격(ms), None이면 주 모니터의 주사율로 계산
+        """
+        super().__init__()
+        if interval is None:
+            screen = QtGui.QGuiApplication.primaryScreen()
+            rate = screen.refreshRate() if screen is not None else 60
+            interval = int(1000 / (rate or 60))
+        self.__clients = []
+        self.__timer = QtCore.QTimer(self)
+        self.__timer.setInterval(max(1, interval))
+        self.__timer.timeout.connect(self.__tick)
+
+    def register(self, client) -> None:
+        """
+        :param client: clock_tick() 메서드를 가진 위젯, clock_tick()은 계속 갱신이 필요하면 True를 반환
+        등록된 위젯이 생기면 타이머를 시작
+        """
+        if client in self.__clients:
+            return
+        self.__clients.append(client)
+        self.wake()
+
+    def wake(self) -> None:
+        """
+        재생을 시작한 위젯이 호출, 멈춰 있던 타이머를 다시 시작
+        """
+        if self.__clients and not self.__timer.isActive():
+            self.__timer.start()
+
+    def unregister(self, client) -> None:
+        """
+        등록된 위젯이 없으면 타이머를 정지
+        """
+        if client in self.__clients:
+            self.__clients.remove(client)
+        if not self.__clients:
+            self.__timer.stop()
+
+    def __tick(self) -> None:
+        busy = False
+        for client in list(self.__clients):
+            if client.isVisible() and client.clock_tick():
+                busy = True
+        if not busy:
+            self.__timer.stop()
+
+
+@algo_lib.singleton
+class SingletonPlaybackClock(PlaybackClock): ...
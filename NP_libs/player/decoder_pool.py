@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# encoding=utf-8
+
+# author        :   Juno Park
+# created date  :   2026.10.18
+# modified date :   2026.10.18
+# description   :   멀티 뷰어의 타일들이 함께 사용하는 디코더 풀
+#                   동시에 디코딩하는 타일의 수를 전역으로 제한하고,
+#                   디코더를 반환하면 기다리던 타일에 요청한 순서대로 넘겨줌
+
+import os
+import collections
+
+from NP_libs.algorithm import library as algo_lib
+
+
+class DecoderPool:
+    def __init__(self, max_decoders: int = None):
+        """
+        :param max_decoders: 동시에 사용할 수 있는 디코더 수, None이면 CPU 코어 수 (최소 4)
+        """
+        if max_decoders is None:
+            max_decoders = max(4, os.cpu_count() or 4)
+        self.__max = max(1, max_decoders)
+        self.__holders = list()  # -> 디코더를 가진 클라이언트
+        self.__waiting = collections.deque()  # -> 디코더를 기다리는 클라이언트 (요청 순서)
+
+    @property
+    def max_decoders(self) -> int:
+        return self.__max
+
+    @property
+    def active_count(self) -> int:
+        return len(self.__holders)
+
+    @property
+    def waiting_count(self) -> int:
+        return len(self.__waiting)
+
+    def set_max_decoders(self, max_decoders: int) -> None:
+        """
+        :param max_decoders: 동시에 사용할 수 있는 디코더 수, 늘린 경우 기다리던 클라이언트에 바로 넘겨줌
+        (줄인 경우 이미 가진 디코더는 반환할 때까지 유지)
+        """
+        self.__max = max(1, max_decoders)
+        self.__grant()
+
+    def holds(self, client) -> bool:
+        return client in self.__holders
+
+    def acquire(self, client) -> bool:
+        """
+        :param client: decoder_granted() 메서드를 가진 객체
+        :return: 디코더를 얻으면 True, 남은 디코더가 없으면 대기열에 추가하고 False
+        대기열의 클라이언트는 디코더가 반환되면 decoder_granted()가 호출됨
+        """
+        if client in self.__holders:
+            return True
+        if len(self.__holders) < self.__max and not self.__waiting:
+            self.__holders.append(client)
+            return True
+        if client not in self.__waiting:
+            self.__waiting.append(client)
+        return False
+
+    def release(self, client) -> None:
+        """
+        :param client: 디코더를 반환하거나 대기를 취소할 객체
+        """
+        if client in self.__waiting:
+            self.__waiting.remove(client)
+        if client in self.__holders:
+            self.__holders.remove(client)
+            self.__grant()
+
+    def __grant(self) -> None:
+        while self.__waiting and len(self.__holders) < self.__max:
+            client = self.__waiting.popleft()
+            self.__holders.append(client)
+            client.decoder_granted()
+
+
+@algo_lib.singleton
+class SingletonDecoderPool(DecoderPool): ...
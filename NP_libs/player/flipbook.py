@@ -0,0 +1,485 @@
+#!/usr/bin/env python
+# encoding=utf-8
+
+# author        :   Juno Park
+# created date  :   2026.10.18
+# modified date :   2026.10.18
+# description   :   영상을 한 번만 디코딩하여 메모리에 올려두고 재생하는 플립북 플레이어
+#                   ffmpeg의 rawvideo 출력을 NumPy 버퍼의 링에 그대로 읽어 들이므로,
+#                   용량 안에 들어오는 영상은 반복 재생, 탐색, 프레임 이동 시 다시 디코딩하지 않음
+#                   프레임 인덱스가 캐시에 있으면 VFR 영상의 시간을 정확히 변환하고 키프레임부터 디코딩함
+
+import threading
+
+import ffmpeg
+from PySide2 import QtCore, QtGui, QtMultimedia
+from NP_libs import NP_Utils
+
+try:
+    import numpy as np
+except ModuleNotFoundError as err:
+    np = None
+    print(f"\033[31mNumpy Import Error: {err}\033[0m")
+
+
+class FlipbookPlayer(QtCore.QObject):
+    # QMediaPlayer와 같은 이름의 시그널
+    stateChanged = QtCore.Signal(object)  # -> QMediaPlayer.State
+    positionChanged = QtCore.Signal("qint64")
+    durationChanged = QtCore.Signal("qint64")
+    frame_changed = QtCore.Signal(QtGui.QImage)
+    frame_loaded = QtCore.Signal(int)  # -> 디코딩이 끝난 프레임의 인덱스 (디코딩 스레드에서 발생)
+    finished = QtCore.Signal()  # -> 재생 중 마지막 프레임에 도달, 정지하기 직전에 발생
+
+    def __init__(
+        self,
+        file_path: str = None,
+        decode_width: int = None,
+        cache_bytes: int = 2 * 1024**3,
+        parent=None,
+    ):
+        """
+        :param file_path: 재생할 영상 경로
+        :param decode_width: 디코딩할 너비, None이면 원본 크기
+        :param cache_bytes: 디코딩한 프레임을 저장할 메모리의 최대 용량
+        영상 전체가 용량 안에 들어오지 않으면 재생 위치부터 용량만큼의 프레임을 링에 유지
+        """
+        super().__init__(parent)
+        self.__decode_width = decode_width
+        self.__cache_bytes = cache_bytes
+        self.__path = None
+        self.__fps = 0.0
+        self.__frame_count = 0
+        self.__size = (0, 0)  # -> 디코딩한 프레임의 (너비, 높이)
+        self.__frame_index = None  # -> 캐시에 저장된 FrameIndex
+        self.__scaled = False
+        self.__state = QtMultimedia.QMediaPlayer.StoppedState
+
+        # 링 버퍼, 인덱스 i의 프레임은 i % capacity 번째 칸에 저장
+        self.__ring = None
+        self.__capacity = 0
+        self.__low = 0  # -> 링에 남아 있는 가장 앞의 프레임
+        self.__decoded = 0  # -> 디코딩이 끝난 마지막 프레임 + 1
+        self.__base = 0  # -> 디코더가 읽기 시작한 프레임
+        self.__index = 0
+        self.__shown = -1
+        self.__limit = None  # -> 미리 열어둔 경우 이 프레임까지만 디코딩
+        self.__view = None
+
+        self.__generation = 0  # -> 디코더를 다시 시작하면 이전 디코더의 결과를 버림
+        self.__process = None
+        self.__thread = None
+        self.__cond = threading.Condition()
+
+        # 재생 시간은 타이머의 간격 대신 경과 시간으로 계산하여 누적 오차를 없앰
+        self.__clock = QtCore.QElapsedTimer()
+        self.__anchor = 0
+        self.__rate = 1.0
+        self.__timer = QtCore.QTimer(self)
+        self.__timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self.__timer.timeout.connect(self.__tick)
+        self.frame_loaded.connect(self.__slot_frame_loaded)
+
+        if file_path is not None:
+            self.setMedia(file_path)
+
+    @staticmethod
+    def available() -> bool:
+        """
+        :return: NumPy가 설치되어 플립북을 사용할 수 있으면 True
+        """
+        return np is not None
+
+    def setMedia(self, file_path: str, preload: int = None, position: int = 0) -> bool:
+        """
+        :param file_path: 재생할 영상 경로
+        :param preload: 재생, 탐색 전까지 디코딩할 프레임 수 (플레이리스트의 다음 항목을 미리 열 때 사용)
+        :param position: 디코딩을 시작할 위치(ms), 다시 열 때 처음부터 디코딩하지 않도록 함
+        :return: 영상 정보를 읽어 디코딩을 시작하면 True
+        """
+        self.clear()
+        self.__limit = preload
+        try:
+            info = NP_Utils.NP_Utils.get_media_info(file_path)
+        except (OSError, StopIteration, ffmpeg.Error) as err:
+            print(f"\033[31mERROR: 영상 정보를 읽을 수 없음 >> {file_path}: {err}\033[0m")
+            self.durationChanged.emit(0)
+            return False
+        if not info.frame_count or not info.fps:
+            self.durationChanged.emit(0)
+            return False
+
+        width, height = info.width, info.height
+        if self.__decode_width and width > self.__decode_width:
+            height = round(height * self.__decode_width / width / 2) * 2
+            width = self.__decode_width
+        self.__scaled = (width, height) != (info.width, info.height)
+        self.__size = (width, height)
+        self.__capacity = max(
+            2, min(info.frame_count, self.__cache_bytes // (width * height * 3))
+        )
+        # np.empty는 실제로 쓰기 전까지 메모리를 점유하지 않음
+        self.__ring = np.empty((self.__capacity, height, width, 3), dtype=np.uint8)
+        self.__path = file_path
+        self.__fps = info.fps
+        self.__frame_count = info.frame_count
+        # 인덱스는 ingest 시 만들어지므로 캐시에 있는 경우에만 사용 (GUI 스레드에서 ffprobe 실행 안 함)
+        self.__frame_index = NP_Utils.NP_Utils.get_frame_index(file_path, build=False)
+        if self.__frame_index is not None and self.__frame_index.frame_count:
+            self.__frame_count = self.__frame_index.frame_count
+        else:
+            self.__frame_index = None
+        self.__timer.setInterval(max(1, int(1000 / self.__fps / 4)))
+        self.durationChanged.emit(self.duration())
+        if self.__frame_index is not None:
+            start = self.__frame_index.frame_at_position(position)
+        else:
+            start = int(position * self.__fps / 1000)
+        start = max(0, min(start, self.__frame_count - 1))
+        self.__start_decoder(start)
+        self.__seek(start)
+        return True
+
+    def setVideoOutput(self, view) -> None:
+        """
+        :param view: set_image 슬롯을 가진 위젯 (sequence_player.FrameView), None이면 연결 해제
+        """
+        if self.__view is not None:
+            self.frame_changed.disconnect(self.__view.set_image)
+        self.__view = view
+        if view is not None:
+            self.frame_changed.connect(view.set_image)
+
+    @property
+    def fps(self) -> float:
+        return self.__fps
+
+    def playbackRate(self) -> float:
+        return self.__rate
+
+    def setPlaybackRate(self, rate: float) -> None:
+        """
+        :param rate: 재생 속도 (정방향만 지원, 0.25배 이상)
+        멀티 뷰어의 동기화 재생에서 fps가 다른 타일을 마스터 클럭의 속도에 맞출 때 사용
+        """
+        rate = max(0.25, rate)
+        if rate == self.__rate:
+            return
+        # 속도가 바뀐 시점부터 다시 시간을 계산
+        self.__rate = rate
+        self.__restart_clock()
+
+    @property
+    def decode_width(self) -> int or None:
+        return self.__decode_width
+
+    def set_decode_width(self, width: int or None) -> None:
+        """
+        :param width: 디코딩할 너비, None이면 원본 크기
+        열려 있는 영상은 현재 위치와 재생 상태를 유지한 채 새 크기로 다시 디코딩
+        """
+        if width == self.__decode_width:
+            return
+        self.__decode_width = width
+        if self.__path is None:
+            return
+        state = self.__state
+        self.setMedia(self.__path, position=self.position())
+        if state == QtMultimedia.QMediaPlayer.PlayingState:
+            self.play()
+        elif state == QtMultimedia.QMediaPlayer.PausedState:
+            self.pause()
+
+    @property
+    def frame_count(self) -> int:
+        return self.__frame_count
+
+    @property
+    def fully_cached(self) -> bool:
+        """
+        :return: 영상 전체가 링에 들어가면 True (한 번 디코딩한 뒤로는 디코딩하지 않음)
+        """
+        return self.__ring is not None and self.__capacity >= self.__frame_count
+
+    def state(self) -> QtMultimedia.QMediaPlayer.State:
+        return self.__state
+
+    def position(self) -> int:
+        """
+        :return: 현재 프레임의 위치(ms)
+        """
+        if not self.__fps:
+            return 0
+        if self.__frame_index is not None:
+            return self.__frame_index.position_of(self.__index)
+        return int(round(self.__index * 1000 / self.__fps))
+
+    def duration(self) -> int:
+        """
+        :return: 영상의 길이(ms)
+        """
+        if not self.__fps:
+            return 0
+        if self.__frame_index is not None:
+            last = self.__frame_index.time_of(self.__frame_count - 1)
+            return int(round((last + 1 / self.__fps) * 1000))
+        return int(round(self.__frame_count * 1000 / self.__fps))
+
+    def current_frame(self) -> int:
+        """
+        :return: 현재 프레임의 인덱스
+        """
+        return self.__index
+
+    def play(self) -> None:
+        if self.__ring is None:
+            return
+        self.__release_limit()
+        self.__restart_clock()
+        self.__timer.start()
+        self.__set_state(QtMultimedia.QMediaPlayer.PlayingState)
+
+    def pause(self) -> None:
+        if self.__ring is None:
+            return
+        self.__timer.stop()
+        self.__set_state(QtMultimedia.QMediaPlayer.PausedState)
+
+    def stop(self) -> None:
+        self.__timer.stop()
+        if self.__ring is not None and self.__index != 0:
+            self.__seek(0)
+        self.__set_state(QtMultimedia.QMediaPlayer.StoppedState)
+
+    def setPosition(self, position: int) -> None:
+        """
+        :param position: 이동할 위치(ms)
+        """
+        if self.__ring is None:
+            return
+        self.__release_limit()
+        if self.__frame_index is not None:
+            index = self.__frame_index.frame_at_position(position)
+        else:
+            index = int(position * self.__fps / 1000)
+        self.__seek(max(0, min(index, self.__frame_count - 1)))
+        self.__restart_clock()
+
+    def step(self, frames: int) -> None:
+        """
+        :param frames: 이동할 프레임 수, 음수이면 이전 프레임으로 이동
+        재생 중이면 일시정지한 뒤 이동
+        """
+        if self.__ring is None:
+            return
+        if self.__state == QtMultimedia.QMediaPlayer.PlayingState:
+            self.pause()
+        self.__release_limit()
+        self.__seek(max(0, min(self.__index + frames, self.__frame_count - 1)))
+
+    def clear(self) -> None:
+        """
+        디코더를 정지하고 링 버퍼를 해제 (다른 플레이어로 전환할 때 메모리를 돌려줌)
+        """
+        self.__timer.stop()
+        self.__stop_decoder()
+        self.__ring = None
+        self.__path = None
+        self.__frame_index = None
+        self.__frame_count = 0
+        self.__index = 0
+        self.__shown = -1
+        self.__set_state(QtMultimedia.QMediaPlayer.StoppedState)
+
+    def release(self) -> None:
+        self.clear()
+
+    def __set_state(self, state: QtMultimedia.QMediaPlayer.State) -> None:
+        if self.__state != state:
+            self.__state = state
+            self.stateChanged.emit(state)
+
+    def __release_limit(self) -> None:
+        """
+        미리 열어둔 영상을 재생, 탐색하면 나머지 프레임도 디코딩
+        """
+        with self.__cond:
+            self.__limit = None
+            self.__cond.notify_all()
+
+    def __restart_clock(self) -> None:
+        self.__anchor = self.__index
+        self.__clock.restart()
+
+    def __has(self, index: int) -> bool:
+        """
+        :return: 해당 프레임이 링에 있으면 True
+        """
+        with self.__cond:
+            return self.__low <= index < self.__decoded
+
+    def __decoder_alive(self) -> bool:
+        return self.__thread is not None and self.__thread.is_alive()
+
+    def __seek(self, index: int) -> None:
+        """
+        :param index: 이동할 프레임의 인덱스
+        링에 있으면 바로 표시하고, 디코더가 곧 도달할 위치면 기다리며,
+        그 외에는 해당 위치부터 디코더를 다시 시작
+        """
+        with self.__cond:
+            self.__index = index
+            low = self.__low
+            self.__cond.notify_all()
+        if self.__has(index):
+            self.__show(index)
+        elif not (
+            self.__decoder_alive()
+            # 링에서 이미 덮어쓴 프레임은 디코더가 다시 읽지 않으므로 새로 시작
+            and self.__base <= index
+            and index >= low
+            and (self.fully_cached or index < self.__decoded + self.__capacity // 2)
+        ):
+            self.__start_decoder(index)
+        self.positionChanged.emit(self.position())
+
+    def __show(self, index: int) -> None:
+        width, height = self.__size
+        frame = self.__ring[index % self.__capacity]
+        # 링의 칸은 다시 쓰이므로 QImage로 복사하여 전달
+        image = QtGui.QImage(
+            frame.data, width, height, width * 3, QtGui.QImage.Format_RGB888
+        ).copy()
+        self.__shown = index
+        self.frame_changed.emit(image)
+
+    def __tick(self) -> None:
+        """
+        표시할 시간이 된 프레임을 링에서 꺼내 표시
+        화면 갱신이 늦어진 경우 시간에 맞는 프레임으로 건너뛰고,
+        디코딩이 늦어진 경우 프레임을 유지한 뒤 그 시점부터 다시 시간을 계산
+        """
+        elapsed = self.__clock.elapsed() * self.__rate / 1000
+        if self.__frame_index is not None:
+            due = self.__frame_index.frame_at(
+                self.__frame_index.time_of(self.__anchor) + elapsed
+            )
+        else:
+            due = int(self.__anchor + elapsed * self.__fps)
+        if due <= self.__index:
+            return
+        if due >= self.__frame_count:
+            self.finished.emit()
+            if self.__state == QtMultimedia.QMediaPlayer.PlayingState:
+                self.stop()
+            return
+        if not self.__has(due):
+            due = self.__index + 1
+            if not self.__has(due):
+                self.__anchor = self.__index
+                self.__clock.restart()
+                return
+            self.__anchor = due
+            self.__clock.restart()
+        with self.__cond:
+            self.__index = due
+            self.__cond.notify_all()
+        self.__show(due)
+        self.positionChanged.emit(self.position())
+
+    def __start_decoder(self, start: int) -> None:
+        """
+        :param start: 디코딩을 시작할 프레임
+        인덱스가 있으면 가장 가까운 이전 키프레임부터 디코딩하여,
+        이동한 프레임과 같은 GOP의 이전 프레임도 링에 남도록 함 (역방향 프레임 이동)
+        """
+        self.__stop_decoder()
+        output_kwargs = dict()
+        if self.__frame_index is not None:
+            start = self.__frame_index.keyframe_before(start)
+            seek = self.__frame_index.time_of(start)
+            # 프레임을 복제, 삭제하지 않아 출력 프레임이 인덱스와 1:1로 대응
+            output_kwargs["vsync"] = "passthrough"
+        else:
+            seek = start / self.__fps
+        with self.__cond:
+            self.__base = self.__low = self.__decoded = start
+            generation = self.__generation
+        stream = NP_Utils.NP_Utils.media_input(self.__path, seek=seek)
+        if self.__scaled:
+            stream = stream.filter("scale", *self.__size)
+        self.__process = (
+            stream.output("pipe:", format="rawvideo", pix_fmt="rgb24", **output_kwargs)
+            .global_args("-loglevel", "error", "-nostdin")
+            .run_async(pipe_stdout=True)
+        )
+        self.__thread = threading.Thread(
+            target=self.__decode,
+            args=(self.__process, start, generation),
+            daemon=True,
+        )
+        self.__thread.start()
+
+    def __stop_decoder(self) -> None:
+        with self.__cond:
+            self.__generation += 1
+            self.__cond.notify_all()
+        if self.__process is not None:
+            self.__process.kill()
+            self.__process = None
+
+    def __decode(self, process, start: int, generation: int) -> None:
+        """
+        디코딩 스레드, ffmpeg의 출력을 링의 칸에 복사 없이 바로 읽어 들임
+        링이 가득 차면 재생 위치가 앞으로 이동할 때까지 기다림
+        """
+        ring, capacity = self.__ring, self.__capacity
+        index = start
+        try:
+            while index < self.__frame_count:
+                with self.__cond:
+                    while generation == self.__generation and (
+                        index >= self.__index + capacity
+                        or (self.__limit is not None and index >= self.__limit)
+                    ):
+                        self.__cond.wait()
+                    if generation != self.__generation:
+                        return
+                    # 지금 쓰는 칸에 있던 프레임은 더 이상 사용할 수 없음
+                    self.__low = max(self.__low, index + 1 - capacity)
+                buffer = memoryview(ring[index % capacity]).cast("B")
+                filled = 0
+                while filled < len(buffer):
+                    size = process.stdout.readinto(buffer[filled:])
+                    if not size:
+                        break
+                    filled += size
+                if filled < len(buffer):
+                    break
+                with self.__cond:
+                    if generation != self.__generation:
+                        return
+                    self.__decoded = index + 1
+                self.frame_loaded.emit(index)
+                index += 1
+            # 컨테이너에 기록된 프레임 수보다 일찍 끝난 경우 길이를 보정
+            with self.__cond:
+                shorter = generation == self.__generation and index < self.__frame_count
+                if shorter:
+                    self.__frame_count = max(1, index)
+            if shorter:
+                self.durationChanged.emit(self.duration())
+        finally:
+            process.stdout.close()
+            process.kill()
+            process.wait()
+
+    @QtCore.Slot(int)
+    def __slot_frame_loaded(self, index: int) -> None:
+        """
+        탐색, 정지 상태에서 기다리던 프레임의 디코딩이 끝나면 표시
+        """
+        if index != self.__index or self.__shown == index or self.__ring is None:
+            return
+        if self.__has(index):
+            self.__show(index)
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# encoding=utf-8
+
+# author        :   Juno Park
+# created date  :   2026.10.18
+# modified date :   2026.10.18
+# description   :   멀티 뷰어의 동기화 재생에서 모든 타일이 따라갈 기준 프레임을 계산하는 마스터 클럭
+#                   재생 시작 시점부터의 경과 시간으로 프레임을 계산하므로 타이머 간격에 따른 오차가 누적되지 않음
+
+import time
+
+
+class MasterClock:
+    def __init__(self, fps: float, frame_count: int):
+        """
+        :param fps: 기준 fps
+        :param frame_count: 전체 프레임 수 (가장 긴 영상 기준)
+        """
+        self.__fps = fps
+        self.__frame_count = max(1, frame_count)
+        self.__anchor_frame = 0  # -> 재생을 시작하거나 이동한 시점의 프레임
+        self.__anchor_time = 0.0
+        self.__playing = False
+
+    @property
+    def fps(self) -> float:
+        return self.__fps
+
+    @property
+    def frame_count(self) -> int:
+        return self.__frame_count
+
+    def set_frame_count(self, frame_count: int) -> None:
+        """
+        :param frame_count: 전체 프레임 수, 영상의 길이는 로딩이 끝난 뒤에 알 수 있으므로 갱신하여 사용
+        """
+        self.__frame_count = max(1, frame_count)
+
+    @property
+    def playing(self) -> bool:
+        return self.__playing
+
+    def frame(self) -> int:
+        """
+        :return: 현재 기준 프레임 (마지막 프레임을 넘을 수 있으며, 반복 여부는 호출한 쪽에서 처리)
+        """
+        if not self.__playing:
+            return self.__anchor_frame
+        elapsed = time.perf_counter() - self.__anchor_time
+        return self.__anchor_frame + int(elapsed * self.__fps)
+
+    def play(self) -> None:
+        if self.__playing:
+            return
+        self.__anchor_time = time.perf_counter()
+        self.__playing = True
+
+    def pause(self) -> None:
+        self.__anchor_frame = self.frame()
+        self.__playing = False
+
+    def stop(self) -> None:
+        self.__playing = False
+        self.__anchor_frame = 0
+
+    def seek(self, frame: int) -> None:
+        """
+        :param frame: 이동할 프레임, 재생 중이면 해당 프레임부터 이어서 재생
+        """
+        self.__anchor_frame = max(0, min(frame, self.__frame_count - 1))
+        self.__anchor_time = time.perf_counter()
+
+    def position_of(self, frame: int, fps: float) -> int:
+        """
+        :param frame: 기준 프레임
+        :param fps: 타일의 fps
+        :return: 타일에서 같은 프레임 번호에 해당하는 위치(ms)
+        """
+        return int(frame * 1000 / fps) if fps else 0
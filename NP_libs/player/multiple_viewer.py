@@ -3,24 +3,39 @@
 
 # author        :   Juno Park
 # created date  :   2024.03.05
-# modified date :   2024.03.23
+# modified date :   2026.10.18
 # description   :   Nuke_player에 삽입되는 Multiple_viewer 클래스
 
 
 import sys
 import os
+import time
 import importlib
 
 sys.path.append("/home/rapa/workspace/python/Nuke_player")
 from NP_libs.player import multiple_viewer_parent
+from NP_libs.player import master_clock
+from NP_libs.player import clock as clock_lib
+from NP_libs.player import flipbook
 from NP_libs.qt import library as qt_lib
+from NP_libs import NP_Utils
+from NP_libs.system import sequence as sequence_lib
 from PySide2 import QtWidgets, QtGui, QtCore
 
 importlib.reload(multiple_viewer_parent)
+importlib.reload(master_clock)
+importlib.reload(clock_lib)
+importlib.reload(flipbook)
 importlib.reload(qt_lib)
+importlib.reload(NP_Utils)
 
 
 class MultipleViewer(QtWidgets.QWidget):
+    # 동기화 재생에서 이 프레임 수보다 크게 어긋난 타일만 보정
+    SYNC_TOLERANCE = 2
+    # 같은 타일을 다시 탐색하기까지의 최소 간격(초), 탐색이 끝나기 전에 반복하여 탐색하는 것을 막음
+    SYNC_SEEK_INTERVAL = 0.5
+
     def __init__(self, parent=None):
         super().__init__(parent)
         home_dir = os.path.expanduser("~")
@@ -44,12 +59,23 @@ class MultipleViewer(QtWidgets.QWidget):
         # vars
         self.__play_lst = p
         self.__widget_data = dict()
+        self.__held = set()  # -> 마스터 클럭보다 앞서 대기 중인 타일의 id
+        self.__last_seek = dict()  # -> {타일 id: 마지막으로 보정한 시간}
 
         # btns
         self.__setup_widgets()
         self.__setup_ui()
         self.__connections()
 
+        # 모든 타일이 같은 프레임을 재생하도록 기준이 되는 마스터 클럭
+        fps_lst = [w.fps for w in self.__widget_data.values() if w.fps]
+        self.__master = master_clock.MasterClock(
+            max(fps_lst, default=sequence_lib.DEFAULT_FPS), 1
+        )
+        self.__apply_sync_rates(self.__btn_sync.isChecked())
+        self.__clock = clock_lib.SingletonPlaybackClock()
+        self.__clock.register(self)
+
     def __get_playlist(self):
         """
         :return: 임시 디렉토리 저장된 플레이리스트를 읽어와 변수에 전달
@@ -70,14 +96,12 @@ class MultipleViewer(QtWidgets.QWidget):
 
     def closeEvent(self, event) -> None:
         """
-        멀티 뷰어 종료 시 각 싱글 뷰어의 스레드 종료 후 창 닫음
+        멀티 뷰어 종료 시 각 뷰어의 플레이어를 정지하고 공용 타이머에서 등록 해제 후 창 닫음
         """
+        self.__clock.unregister(self)
         for w in self.__widget_data.values():
             w: multiple_viewer_parent.VideoWidget
-            if w.update_thread.isRunning():
-                w.slot_stop_video()
-                w.update_thread.stop()
-            print(f"\033[31m스레드 정상 종료: {w.wid}\033[0m")
+            w.release()
         event.accept()
 
     def keyPressEvent(self, event) -> None:
@@ -95,6 +119,10 @@ class MultipleViewer(QtWidgets.QWidget):
             self.__btn_mode.click()
         elif event.key() == QtCore.Qt.Key_P:
             self.__btn_loop.click()
+        elif event.key() == QtCore.Qt.Key_Comma:
+            self.__step_all(-1)
+        elif event.key() == QtCore.Qt.Key_Period:
+            self.__step_all(1)
 
     def __connections(self) -> None:
         """
@@ -105,6 +133,9 @@ class MultipleViewer(QtWidgets.QWidget):
         self.__btn_stop.clicked.connect(self.__slot_stop_all)
         self.__btn_mode.clicked.connect(self.__slot_change_dp)
         self.__btn_loop.clicked.connect(self.__slot_set_loop)
+        self.__btn_sync.toggled.connect(self.__slot_sync_toggled)
+        self.__btn_tile_res.toggled.connect(self.__slot_tile_decode_toggled)
+        self.__sync_slider.sliderMoved.connect(self.__slot_sync_seek)
 
     def __setup_ui(self) -> None:
         """
@@ -121,6 +152,8 @@ class MultipleViewer(QtWidgets.QWidget):
         self.__btn_stop = QtWidgets.QPushButton()
         self.__btn_mode = QtWidgets.QPushButton("tc")
         self.__btn_loop = QtWidgets.QPushButton()
+        self.__btn_sync = QtWidgets.QPushButton("sync")
+        self.__btn_tile_res = QtWidgets.QPushButton("res")
         self.__btn_play.setIcon(
             QtGui.QIcon(self.style().standardIcon(QtWidgets.QStyle.SP_MediaPlay))
         )
@@ -138,19 +171,39 @@ class MultipleViewer(QtWidgets.QWidget):
         self.__btn_stop.setFixedSize(100, 30)
         self.__btn_mode.setFixedSize(50, 30)
         self.__btn_loop.setFixedSize(50, 30)
+        self.__btn_sync.setFixedSize(50, 30)
+        self.__btn_tile_res.setFixedSize(50, 30)
         self.__btn_play.setToolTip("Play All Videos")
         self.__btn_pause.setToolTip("Pause All Videos")
         self.__btn_stop.setToolTip("Stop All Videos")
         self.__btn_mode.setToolTip("Change Display Format")
         self.__btn_loop.setToolTip("Set Loop")
+        self.__btn_sync.setToolTip("Synchronize All Videos To One Frame")
+        self.__btn_tile_res.setToolTip("Decode Videos At Tile Resolution")
         self.__btn_play.setFocusPolicy(QtCore.Qt.NoFocus)
         self.__btn_pause.setFocusPolicy(QtCore.Qt.NoFocus)
         self.__btn_stop.setFocusPolicy(QtCore.Qt.NoFocus)
         self.__btn_mode.setFocusPolicy(QtCore.Qt.NoFocus)
         self.__btn_loop.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.__btn_sync.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.__btn_tile_res.setFocusPolicy(QtCore.Qt.NoFocus)
 
         self.__btn_loop.setCheckable(True)
         self.__btn_loop.setChecked(False)
+        self.__btn_sync.setCheckable(True)
+        self.__btn_sync.setChecked(True)
+        # 타일 크기로 디코딩하려면 NumPy가 필요 (없으면 QMediaPlayer가 원본 크기로 디코딩)
+        self.__btn_tile_res.setCheckable(True)
+        self.__btn_tile_res.setChecked(flipbook.FlipbookPlayer.available())
+        self.__btn_tile_res.setEnabled(flipbook.FlipbookPlayer.available())
+
+        # 동기화 재생 시 모든 타일을 함께 이동하는 공용 슬라이더 (프레임 단위)
+        self.__sync_slider = QtWidgets.QSlider(QtCore.Qt.Horizontal)
+        self.__sync_slider.setRange(0, 0)
+        self.__sync_slider.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.__label_sync_frame = QtWidgets.QLabel("0")
+        self.__label_sync_frame.setFixedWidth(60)
+        self.__label_sync_frame.setAlignment(QtCore.Qt.AlignCenter)
 
         # spacer
         __h_spacer = QtWidgets.QSpacerItem(
@@ -168,9 +221,16 @@ class MultipleViewer(QtWidgets.QWidget):
         btn_hbox.addWidget(self.__btn_stop)
         btn_hbox.addWidget(self.__btn_mode)
         btn_hbox.addWidget(self.__btn_loop)
+        btn_hbox.addWidget(self.__btn_sync)
+        btn_hbox.addWidget(self.__btn_tile_res)
+
+        sync_hbox = QtWidgets.QHBoxLayout()
+        sync_hbox.addWidget(self.__sync_slider)
+        sync_hbox.addWidget(self.__label_sync_frame)
 
         self.__vbox_layout.addLayout(self.__grid_layout)
         self.__vbox_layout.addWidget(__h_line)
+        self.__vbox_layout.addLayout(sync_hbox)
         self.__vbox_layout.addLayout(btn_hbox)
 
         self.setLayout(self.__vbox_layout)
@@ -183,7 +243,9 @@ class MultipleViewer(QtWidgets.QWidget):
             print(f"NONE playlist")
             return
         for idx, v_path in enumerate(self.__play_lst):
-            self.widget = multiple_viewer_parent.VideoWidget(v_path)
+            # 고해상도 영상은 캐시에 프록시가 있으면 프록시를 재생
+            proxy = NP_Utils.NP_Utils.get_proxy(v_path)
+            self.widget = multiple_viewer_parent.VideoWidget(v_path, proxy)
             self.widget.setSizePolicy(
                 QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding
             )
@@ -229,6 +291,7 @@ class MultipleViewer(QtWidgets.QWidget):
                 self.widget.label_current_time.setFont(QtGui.QFont("Sans Serif", 6))
                 self.__grid_layout.addWidget(self.__frame, int(idx // 4), int(idx % 4))
                 self.setFixedSize(1452, 970)
+            self.widget.label_drift.setFont(self.widget.label_fps.font())
 
         # 각 행과 열의 간격을 동일하게 설정
         rows = self.__grid_layout.rowCount()
@@ -241,8 +304,13 @@ class MultipleViewer(QtWidgets.QWidget):
     def __slot_set_loop(self) -> None:
         """
         멀티 뷰어의 loop 버튼 클릭 시 모든 싱글 뷰어의 loop버튼 동작
+        동기화 재생 중에는 각 타일이 따로 반복하지 않도록 마스터 클럭에서만 반복
         """
-        if self.__btn_loop.isChecked():
+        if self.__btn_sync.isChecked():
+            for w in self.__widget_data.values():
+                w: multiple_viewer_parent.VideoWidget
+                w.btn_loop.setChecked(False)
+        elif self.__btn_loop.isChecked():
             for w in self.__widget_data.values():
                 w: multiple_viewer_parent.VideoWidget
                 w.btn_loop.setChecked(True)
@@ -266,30 +334,242 @@ class MultipleViewer(QtWidgets.QWidget):
                 w.btn_mode.setText("tc")
             elif self.__btn_mode.text() == "fps":
                 w.btn_mode.setText("fps")
+            w.refresh_time()
 
     def __slot_play_all(self) -> None:
         """
         멀티 뷰어의 play 버튼 클릭 시 모든 싱글 뷰어 재생
+        동기화 재생 중에는 모든 타일을 마스터 클럭의 프레임에 맞춘 뒤 함께 재생
         """
+        if self.__btn_sync.isChecked():
+            self.__update_frame_count()
+            if self.__master.frame() >= self.__master.frame_count - 1:
+                self.__master.seek(0)
+            self.__seek_all(self.__master.frame())
+            self.__master.play()
+            self.__clock.wake()
+            for w in self.__widget_data.values():
+                w: multiple_viewer_parent.VideoWidget
+                if self.__target_position(w) < w.duration():
+                    w.play()
+            return
         for w in self.__widget_data.values():
             w: multiple_viewer_parent.VideoWidget
-            w.player.play()
+            w.play()
 
     def __slot_pause_all(self) -> None:
         """
         멀티 뷰어의 pause 버튼 클릭 시 모든 싱글 뷰어 일시정지
+        동기화 재생 중에는 정지한 뒤 모든 타일을 마스터 클럭의 프레임으로 맞춤
         """
+        if self.__btn_sync.isChecked():
+            self.__master.pause()
         for w in self.__widget_data.values():
             w: multiple_viewer_parent.VideoWidget
-            w.player.pause()
+            w.pause()
+        if self.__btn_sync.isChecked():
+            self.__seek_all(self.__master.frame())
 
     def __slot_stop_all(self) -> None:
         """
         멀티 뷰어의 stop 버튼 클릭 시 모든 싱글 뷰어 정지
         """
+        self.__master.stop()
+        self.__held.clear()
+        for w in self.__widget_data.values():
+            w: multiple_viewer_parent.VideoWidget
+            w.stop()
+        self.__refresh_sync_slider(0)
+
+    def __step_all(self, frames: int) -> None:
+        """
+        :param frames: 이동할 프레임 수 (음수이면 뒤로)
+        모든 타일을 일시정지하고 프레임 단위로 이동, 동기화 재생 중에는 마스터 클럭을 기준으로 이동
+        """
+        if not self.__btn_sync.isChecked():
+            for w in self.__widget_data.values():
+                w: multiple_viewer_parent.VideoWidget
+                w.step_frame(frames)
+            return
+        self.__master.pause()
+        for w in self.__widget_data.values():
+            w: multiple_viewer_parent.VideoWidget
+            w.pause()
+        self.__master.seek(self.__master.frame() + frames)
+        frame = self.__master.frame()
+        self.__seek_all(frame)
+        self.__refresh_sync_slider(frame)
+
+    def clock_tick(self) -> bool:
+        """
+        공용 타이머가 호출, 동기화 재생 중이면 마스터 클럭의 프레임에 맞춰 각 타일을 보정하고
+        타일별 프레임 차이와 공용 슬라이더를 갱신
+        :return: 마스터 클럭이 재생 중이면 True
+        """
+        if not self.__btn_sync.isChecked():
+            return False
+        self.__update_frame_count()
+        frame = self.__master.frame()
+        if self.__master.playing and frame >= self.__master.frame_count:
+            if self.__btn_loop.isChecked():
+                self.__master.seek(0)
+                self.__seek_all(0)
+                for w in self.__widget_data.values():
+                    w: multiple_viewer_parent.VideoWidget
+                    w.play()
+                frame = 0
+            else:
+                self.__master.pause()
+                self.__master.seek(self.__master.frame_count - 1)
+                frame = self.__master.frame()
+        self.__sync_tiles(frame)
+        self.__refresh_sync_slider(frame)
+        return self.__master.playing
+
+    def __sync_tiles(self, frame: int) -> None:
+        """
+        :param frame: 마스터 클럭의 현재 프레임
+        뒤처진 타일은 마스터 클럭의 위치로 탐색하여 밀린 프레임을 버리고,
+        앞선 타일은 마스터 클럭이 따라올 때까지 일시정지하여 프레임을 유지
+        """
+        now = time.perf_counter()
+        for wid, w in self.__widget_data.items():
+            w: multiple_viewer_parent.VideoWidget
+            duration = w.duration()
+            if duration <= 0 or not w.fps:
+                w.set_drift(None)
+                continue
+            target = self.__master.position_of(frame, w.fps)
+            playing = w.is_playing()
+            if target >= duration:
+                # 다른 영상보다 짧은 타일은 마지막 프레임에서 대기
+                if playing:
+                    w.pause()
+                w.set_drift(None)
+                continue
+            drift = round((w.position() - target) * w.fps / 1000)
+            w.set_drift(drift)
+            if not self.__master.playing:
+                continue
+            if wid in self.__held:
+                if drift <= 0:
+                    self.__held.discard(wid)
+                    w.play()
+            elif playing and drift > self.SYNC_TOLERANCE:
+                self.__held.add(wid)
+                w.pause()
+            elif playing and drift < -self.SYNC_TOLERANCE:
+                if now - self.__last_seek.get(wid, 0) >= self.SYNC_SEEK_INTERVAL:
+                    self.__last_seek[wid] = now
+                    w.set_position(target)
+
+    def __apply_sync_rates(self, checked: bool) -> None:
+        """
+        :param checked: 동기화 재생 버튼의 체크 상태
+        마스터 클럭은 가장 높은 fps로 진행하므로, 동기화 재생 중에는 fps가 낮은 타일을
+        (마스터 fps / 타일 fps)배로 재생하여 같은 프레임 번호를 유지하고, 끄면 원래 속도로 되돌림
+        ex) 25fps 마스터 클럭에서 24fps 타일은 25 / 24배
+        """
+        for w in self.__widget_data.values():
+            w: multiple_viewer_parent.VideoWidget
+            rate = self.__master.fps / w.fps if checked and w.fps else 1.0
+            w.set_playback_rate(rate)
+
+    def __seek_all(self, frame: int) -> None:
+        """
+        :param frame: 이동할 프레임
+        모든 타일을 같은 프레임 번호로 이동 (디코더를 반환한 타일은 다시 얻어 해당 프레임을 표시)
+        """
+        self.__held.clear()
+        self.__last_seek.clear()
+        for w in self.__widget_data.values():
+            w: multiple_viewer_parent.VideoWidget
+            duration = w.duration()
+            if duration <= 0:
+                continue
+            w.set_position(min(self.__target_position(w, frame), duration - 1))
+
+    def __target_position(
+        self, w: multiple_viewer_parent.VideoWidget, frame: int = None
+    ) -> int:
+        """
+        :return: 마스터 클럭의 프레임에 해당하는 타일의 위치(ms)
+        """
+        if frame is None:
+            frame = self.__master.frame()
+        return self.__master.position_of(frame, w.fps)
+
+    def __update_frame_count(self) -> None:
+        """
+        가장 긴 영상의 프레임 수로 마스터 클럭과 공용 슬라이더의 범위를 갱신
+        """
+        count = max(
+            (
+                int(w.duration() * w.fps / 1000)
+                for w in self.__widget_data.values()
+                if w.fps
+            ),
+            default=0,
+        )
+        if count and count != self.__master.frame_count:
+            self.__master.set_frame_count(count)
+            self.__sync_slider.setRange(0, count - 1)
+
+    def __refresh_sync_slider(self, frame: int) -> None:
+        """
+        :param frame: 마스터 클럭의 현재 프레임
+        """
+        if not self.__sync_slider.isSliderDown():
+            self.__sync_slider.setValue(frame)
+        self.__label_sync_frame.setText(f"{frame}")
+
+    def __slot_sync_seek(self, frame: int) -> None:
+        """
+        :param frame: 공용 슬라이더의 값
+        공용 슬라이더를 조작하면 마스터 클럭과 모든 타일을 해당 프레임으로 이동
+        """
+        if not self.__btn_sync.isChecked():
+            self.__btn_sync.setChecked(True)
+        self.__master.seek(frame)
+        self.__seek_all(frame)
+        self.__label_sync_frame.setText(f"{frame}")
+
+    def __slot_tile_decode_toggled(self, checked: bool) -> None:
+        """
+        :param checked: 타일 크기 디코딩 버튼의 체크 상태
+        켜면 ffmpeg가 각 타일의 화면 크기로 축소하여 디코딩, 끄면 원본 크기로 디코딩
+        """
+        for w in self.__widget_data.values():
+            w: multiple_viewer_parent.VideoWidget
+            w.set_tile_decode(checked)
+
+    def __slot_sync_toggled(self, checked: bool) -> None:
+        """
+        :param checked: 동기화 재생 버튼의 체크 상태
+        동기화 재생을 켜면 모든 타일을 일시정지하고 첫 번째 타일의 프레임으로 맞추며,
+        끄면 프레임 차이 표시를 숨기고 각 타일의 반복 설정을 되돌림
+        """
+        self.__slot_set_loop()
+        self.__apply_sync_rates(checked)
+        if not checked:
+            self.__master.pause()
+            self.__held.clear()
+            for w in self.__widget_data.values():
+                w: multiple_viewer_parent.VideoWidget
+                w.set_drift(None)
+            return
+        frame = None
         for w in self.__widget_data.values():
             w: multiple_viewer_parent.VideoWidget
-            w.player.stop()
+            w.pause()
+            if frame is None and w.fps:
+                frame = int(w.position() * w.fps / 1000)
+        frame = frame or 0
+        self.__update_frame_count()
+        self.__master.pause()
+        self.__master.seek(frame)
+        self.__seek_all(frame)
+        self.__refresh_sync_slider(frame)
 
 
 # TEST
@@ -3,68 +3,67 @@
 
 # author        :   Juno Park
 # created date  :   2024.03.05
-# modified date :   2024.03.23
+# modified date :   2026.10.18
 # description   :   Nuke_player에 삽입되는 Multiple_viewer의 부모 클래스
 
 
 import sys
 import os
-import time
 import importlib
 
 # sys.path.append("/home/rapa/libs_nuke")
 import uuid
+import ffmpeg
 from PySide2 import QtWidgets, QtGui, QtMultimediaWidgets, QtCore, QtMultimedia
 from NP_libs import NP_Utils
 from NP_libs.qt import library as qt_lib
 from NP_libs.player import single_viewer
+from NP_libs.player import sequence_player
+from NP_libs.player import clock as clock_lib
+from NP_libs.player import decoder_pool as pool_lib
+from NP_libs.player import flipbook
+from NP_libs.system import sequence as sequence_lib
 
 importlib.reload(NP_Utils)
 importlib.reload(qt_lib)
 importlib.reload(single_viewer)
-
-
-class Thread_Updater(QtCore.QThread):
-    pos_updated = QtCore.Signal(int)
-    dur_updated = QtCore.Signal(int)
-
-    def __init__(self, player: QtMultimedia.QMediaPlayer, widget):
-        super().__init__()
-        self.player = player
-        self.widget = widget
-        self.running = True
-        self.mutex = QtCore.QMutex()
-
-    def run(self):
-        pos = 0
-        dur = 0
-        while self.running:
-            self.mutex.lock()
-            if self.player.state() == QtMultimedia.QMediaPlayer.PlayingState:
-                pos = self.player.position()
-                dur = self.player.duration()
-            self.mutex.unlock()
-            self.pos_updated.emit(pos)
-            self.dur_updated.emit(dur)
-            time.sleep(0.01)
-
-    def stop(self):
-        if self.running:
-            self.running = False
-            self.quit()
-            self.wait(10000)
+importlib.reload(sequence_player)
+importlib.reload(clock_lib)
+importlib.reload(pool_lib)
+importlib.reload(flipbook)
 
 
 class VideoWidget(QtWidgets.QWidget):
     mode_changed = QtCore.Signal(str)
     update_slider_pos = QtCore.Signal(int, int)
-
-    def __init__(self, video_path: str, parent=None):
+    # 타일에서 재생하는 시퀀스는 이 너비로 축소하여 디코딩
+    SEQUENCE_DECODE_WIDTH = 960
+    # 일시정지한 뒤 이 시간(ms) 동안 조작이 없으면 디코더를 반환
+    IDLE_RELEASE_MS = 2000
+    # 타일 크기로 디코딩하는 플립북들이 함께 사용할 메모리의 최대 용량
+    # 링 버퍼는 디코더를 가진 타일만 유지하므로 디코더 풀의 최대 디코더 수로 나누어 타일마다 할당
+    TILE_CACHE_TOTAL_BYTES = 1024**3
+    # 타일의 크기가 바뀐 뒤 이 시간(ms) 동안 더 바뀌지 않으면 새 크기로 다시 디코딩
+    RESIZE_DEBOUNCE_MS = 250
+
+    def __init__(
+        self,
+        video_path: str,
+        proxy_path: str = None,
+        tile_decode: bool = True,
+        parent=None,
+    ):
+        """
+        :param video_path: 원본 영상 경로
+        :param proxy_path: 원본 대신 재생할 프록시 경로 (경로 표시, 드래그, 분리 재생은 원본 사용)
+        :param tile_decode: True이면 ffmpeg가 타일의 화면 크기로 축소하여 디코딩 (set_tile_decode 참고)
+        """
         super().__init__(parent)
 
         # vars
         self.__wid = uuid.uuid4().hex
         self.__video_path = video_path
+        self.__play_path = proxy_path or video_path
         self.__NP_Util = NP_Utils
         self.__single_viewer = single_viewer
 
@@ -73,15 +72,48 @@ class VideoWidget(QtWidgets.QWidget):
         self.setAcceptDrops(True)
         qt_lib.QtLibs.center_on_screen(self)
 
+        self.__last_time = None  # -> 마지막으로 표시한 (포지션, 길이, 표시 형식)
+        self.__released = False
+        # 디코더는 재생, 탐색할 때만 풀에서 얻고, 숨김, 일시정지 상태에서는 반환
+        self.__pool = pool_lib.SingletonDecoderPool()
+        self.__has_decoder = False
+        self.__want_play = False  # -> 디코더를 반환한 동안에도 유지하는 재생 상태
+        self.__resume_pos = 0  # -> 디코더를 반환한 시점의 위치(ms), 다시 얻으면 이 위치부터 디코딩
+        self.__known_duration = 0
+        self.__suspending = False
+        self.__drift = None
+        self.__rate = 1.0  # -> 동기화 재생에서 마스터 클럭에 맞춘 재생 속도
+        self.__idle_timer = QtCore.QTimer(self)
+        self.__idle_timer.setSingleShot(True)
+        self.__idle_timer.setInterval(self.IDLE_RELEASE_MS)
+        self.__idle_timer.timeout.connect(self.__slot_idle)
+        self.__aspect = 16 / 9  # -> 원본 영상의 가로 세로 비율
+        self.__resize_timer = QtCore.QTimer(self)
+        self.__resize_timer.setSingleShot(True)
+        self.__resize_timer.setInterval(self.RESIZE_DEBOUNCE_MS)
+        self.__resize_timer.timeout.connect(self.__slot_renegotiate)
         self.__init_ui()
         self.__connections()
         self.__current_fps = self.__get_current_video_fps()
-
-        # Set Thread
-        self.update_thread = Thread_Updater(self.player, self)
-        self.update_thread.pos_updated.connect(self.__update_slider_position)
-        self.update_thread.dur_updated.connect(self.slot_label_info)
-        self.update_thread.start()
+        # ingest에서 만든 프레임 인덱스가 있으면 정확한 프레임 번호와 이동에 사용
+        self.__frame_index = None
+        if not self.__is_sequence:
+            self.__frame_index = self.__NP_Util.NP_Utils.get_frame_index(
+                self.__play_path, build=False
+            )
+            # 디코더를 얻기 전(QMediaPlayer가 영상을 읽기 전)에도 동기화 재생에서 길이를 사용
+            try:
+                info = self.__NP_Util.NP_Utils.get_media_info(self.__play_path)
+                self.__known_duration = int(info.duration * 1000)
+                if info.width and info.height:
+                    self.__aspect = info.width / info.height
+            except (OSError, StopIteration, ffmpeg.Error) as err:
+                print(f"\033[31mERROR: 영상 정보를 읽을 수 없음 >> {self.__play_path}: {err}\033[0m")
+
+        # 슬라이더와 시간 표시는 공용 타이머가 재생 중일 때만 갱신
+        self.__clock = clock_lib.SingletonPlaybackClock()
+        self.__clock.register(self)
+        self.set_tile_decode(tile_decode)
 
     def dragEnterEvent(self, event) -> None:
         """
@@ -123,13 +155,283 @@ class VideoWidget(QtWidgets.QWidget):
 
     def closeEvent(self, event) -> None:
         """
-        UI 종료 시 플레이어 정지 및 스레드 종료
+        UI 종료 시 플레이어 정지 및 공용 타이머에서 등록 해제
         """
-        self.player.stop()
-        self.update_thread.stop()
-        print(f"\033[31m스레드 정상 종료: {self.__wid}\033[0m")
+        self.release()
         event.accept()
 
+    def hideEvent(self, event) -> None:
+        """
+        타일이 숨겨지거나 창이 최소화되면 재생 상태를 유지한 채 디코더를 반환
+        """
+        super().hideEvent(event)
+        self.release_decoder()
+
+    def resizeEvent(self, event) -> None:
+        """
+        타일 크기로 디코딩하는 경우 크기 조절이 끝나면 새 크기로 다시 디코딩
+        """
+        super().resizeEvent(event)
+        if self.player is self.__flipbook:
+            self.__resize_timer.start()
+
+    def showEvent(self, event) -> None:
+        """
+        다시 표시되면 재생 중이었던 타일은 반환한 위치부터 이어서 재생
+        """
+        super().showEvent(event)
+        if self.__want_play:
+            self.play()
+
+    def release(self) -> None:
+        """
+        플레이어를 정지하고 공용 타이머에서 등록을 해제 (스레드를 기다리지 않으므로 바로 반환)
+        멀티 뷰어를 닫을 때 각 타일에서 호출
+        """
+        if self.__released:
+            return
+        self.__released = True
+        self.__idle_timer.stop()
+        self.__resize_timer.stop()
+        self.__want_play = False
+        self.player.stop()
+        self.__has_decoder = False
+        self.__pool.release(self)
+        self.__clock.unregister(self)
+        if self.__is_sequence or self.player is self.__flipbook:
+            self.player.release()
+        print(f"\033[31m뷰어 종료: {self.__wid}\033[0m")
+
+    def clock_tick(self) -> bool:
+        """
+        공용 타이머가 호출, 재생 중인 경우에만 슬라이더와 시간 표시를 갱신
+        :return: 재생 중이면 True
+        """
+        if not self.is_playing():
+            return False
+        self.refresh_time()
+        return True
+
+    def is_playing(self) -> bool:
+        return self.player.state() == QtMultimedia.QMediaPlayer.PlayingState
+
+    def position(self) -> int:
+        """
+        :return: 현재 위치(ms), 디코더를 반환한 동안에는 반환한 시점의 위치
+        """
+        if self.__is_sequence or self.__has_decoder:
+            return self.player.position()
+        return self.__resume_pos
+
+    def duration(self) -> int:
+        """
+        :return: 영상의 길이(ms), 디코더를 반환한 동안에는 마지막으로 알려진 길이
+        """
+        return self.player.duration() or self.__known_duration
+
+    def play(self) -> None:
+        """
+        디코더를 얻어 재생, 디코더가 모두 사용 중이면 반환되는 순서대로 얻은 뒤 재생
+        """
+        self.__want_play = True
+        self.__idle_timer.stop()
+        if self.__acquire():
+            self.player.play()
+
+    def pause(self) -> None:
+        """
+        일시정지, IDLE_RELEASE_MS 동안 다시 재생하거나 탐색하지 않으면 디코더를 반환
+        """
+        self.__want_play = False
+        if self.__has_decoder:
+            self.player.pause()
+            self.__idle_timer.start()
+        else:
+            self.__pool.release(self)
+
+    def stop(self) -> None:
+        """
+        정지 후 바로 디코더를 반환
+        """
+        self.__want_play = False
+        self.__idle_timer.stop()
+        self.__resume_pos = 0
+        if self.__has_decoder:
+            self.player.stop()
+        self.release_decoder()
+
+    def set_position(self, position: int) -> None:
+        """
+        :param position: 이동할 위치(ms)
+        디코더를 반환한 상태이면 다시 얻어 해당 위치의 프레임을 표시
+        """
+        self.__resume_pos = position
+        if not self.__acquire():
+            return
+        if not self.__is_sequence and (
+            self.player.state() == QtMultimedia.QMediaPlayer.StoppedState
+        ):
+            self.player.pause()
+        self.player.setPosition(position)
+        if not self.__want_play:
+            self.__idle_timer.start()
+
+    def release_decoder(self) -> None:
+        """
+        디코더를 풀에 반환 (재생 상태는 유지하므로 다시 표시되거나 play()를 호출하면 이어서 재생)
+        영상은 마지막 프레임을 화면에 남겨두고 플레이어를 정지하여 디코딩 파이프라인을 해제
+        """
+        self.__idle_timer.stop()
+        if not self.__has_decoder:
+            self.__pool.release(self)
+            return
+        if self.__is_sequence:
+            self.player.pause()
+        elif self.player is self.__flipbook:
+            # FrameView가 마지막 프레임을 유지하므로 디코더와 링 버퍼만 해제
+            self.__resume_pos = self.player.position()
+            self.__suspending = True
+            self.player.clear()
+            self.__suspending = False
+        else:
+            self.__resume_pos = self.player.position()
+            self.__frame_view.set_image(self.__v_widget.grab().toImage())
+            self.__stack.setCurrentWidget(self.__frame_view)
+            self.__suspending = True
+            self.player.stop()
+            self.__suspending = False
+        self.__has_decoder = False
+        self.__pool.release(self)
+
+    def decoder_granted(self) -> None:
+        """
+        풀이 호출, 기다리던 디코더를 얻으면 반환한 위치부터 이어서 재생하거나 프레임을 표시
+        """
+        if self.__released or not self.isVisible():
+            self.__pool.release(self)
+            return
+        self.__restore()
+        if self.__want_play:
+            self.player.play()
+        else:
+            self.__idle_timer.start()
+
+    def __acquire(self) -> bool:
+        """
+        :return: 디코더를 가지고 있거나 얻으면 True
+        숨겨진 타일은 디코더를 요청하지 않음 (다시 표시될 때 요청)
+        """
+        if self.__has_decoder:
+            return True
+        if self.__released or not self.isVisible():
+            return False
+        if not self.__pool.acquire(self):
+            return False
+        self.__restore()
+        return True
+
+    def __restore(self) -> None:
+        """
+        디코더를 얻은 뒤 반환한 위치로 이동, 첫 프레임이 표시될 때까지 남겨둔 프레임을 표시
+        """
+        self.__has_decoder = True
+        if self.__is_sequence:
+            return
+        if self.player is self.__flipbook:
+            # 반환한 위치의 프레임부터 디코딩 (처음부터 다시 디코딩하지 않음)
+            self.player.setMedia(self.__play_path, position=self.__resume_pos)
+            self.player.pause()
+            return
+        self.player.pause()
+        self.player.setPosition(self.__resume_pos)
+
+    def set_tile_decode(self, enabled: bool) -> None:
+        """
+        :param enabled: True이면 FlipbookPlayer로 ffmpeg의 파이프에서 타일의 화면 크기로 축소하여 디코딩,
+        False이면 QMediaPlayer가 원본 크기로 디코딩한 뒤 화면에서 축소
+        NumPy가 없으면 QMediaPlayer를 사용, 위치와 재생 상태는 유지
+        """
+        if self.__is_sequence or self.__released:
+            return
+        enabled = enabled and flipbook.FlipbookPlayer.available()
+        target = self.__flipbook if enabled else self.__media_player
+        if enabled and target is None:
+            target = self.__flipbook = flipbook.FlipbookPlayer(
+                decode_width=self.__tile_decode_width(),
+                cache_bytes=self.TILE_CACHE_TOTAL_BYTES // self.__pool.max_decoders,
+                parent=self,
+            )
+            target.setVideoOutput(self.__frame_view)
+            self.__connect_player(target)
+        if target is self.__media_player and self.__media_player.playlist() is None:
+            # 플레이리스트를 등록하면 QMediaPlayer가 영상을 열기 때문에 사용할 때 등록
+            self.__media_player.setPlaylist(self.__play_lst)
+        if target is self.player:
+            return
+
+        # 이전 플레이어의 디코더를 반환한 뒤 같은 위치에서 이어서 재생
+        want_play, position = self.__want_play, self.position()
+        self.release_decoder()
+        self.__resize_timer.stop()
+        self.player = target
+        self.player.setPlaybackRate(self.__rate)
+        self.__resume_pos = position
+        if target is self.__flipbook:
+            self.__stack.setCurrentWidget(self.__frame_view)
+        if want_play:
+            self.play()
+        elif position:
+            self.set_position(position)
+
+    def __tile_decode_width(self) -> int:
+        """
+        :return: 타일의 화면 크기(물리 픽셀)에 영상의 비율을 맞춘 디코딩 너비 (짝수)
+        """
+        ratio = self.__frame_view.devicePixelRatioF()
+        width = self.__frame_view.width() * ratio
+        height = self.__frame_view.height() * ratio
+        width = min(width, height * self.__aspect)
+        return max(16, int(width) // 2 * 2)
+
+    def __slot_renegotiate(self) -> None:
+        """
+        크기 조절이 끝나면 새 크기로 다시 디코딩, 디코더를 반환한 상태이면 다음에 얻을 때 적용
+        """
+        if self.__flipbook is None:
+            return
+        # 다시 여는 동안의 정지 상태는 재생이 끝난 것이 아님
+        self.__suspending = True
+        self.__flipbook.set_decode_width(self.__tile_decode_width())
+        self.__suspending = False
+
+    def __slot_idle(self) -> None:
+        if not self.__want_play and not self.is_playing():
+            self.release_decoder()
+
+    def __slot_media_status_changed(self, status) -> None:
+        """
+        :param status: QMediaPlayer의 미디어 상태
+        디코더를 다시 얻어 프레임을 표시할 수 있게 되면 남겨둔 프레임 대신 영상을 표시
+        """
+        if self.player is not self.__media_player:
+            return
+        if status in [
+            QtMultimedia.QMediaPlayer.LoadedMedia,
+            QtMultimedia.QMediaPlayer.BufferedMedia,
+        ] and self.__has_decoder:
+            self.__stack.setCurrentWidget(self.__v_widget)
+
+    def refresh_time(self) -> None:
+        """
+        포지션, 길이, 표시 형식 중 바뀐 값이 있을 때만 슬라이더와 시간 표시를 갱신
+        """
+        current = (self.position(), self.duration(), self.btn_mode.text())
+        if current == self.__last_time:
+            return
+        self.__last_time = current
+        self.__slider.setValue(current[0])
+        self.slot_label_info()
+
     def __init_ui(self) -> None:
         """
         UI 생성 및 메인 위젯 설정
@@ -138,19 +440,36 @@ class VideoWidget(QtWidgets.QWidget):
             "color: rgb(255, 255, 255);" "background-color: rgb(70, 70, 70);"
         )
 
-        # 플레이어 설정
-        self.player = QtMultimedia.QMediaPlayer(
-            None, QtMultimedia.QMediaPlayer.VideoSurface
-        )
+        # 플레이어 설정, 이미지 시퀀스는 변환하지 않고 디스크에서 바로 읽어 재생
+        self.__is_sequence = sequence_lib.is_pattern(self.__video_path)
+        if self.__is_sequence:
+            self.player = sequence_player.SequencePlayer(
+                self.__video_path,
+                decode_width=self.SEQUENCE_DECODE_WIDTH,
+                parent=self,
+            )
+            v_widget = sequence_player.FrameView()
+        else:
+            self.player = QtMultimedia.QMediaPlayer(
+                None, QtMultimedia.QMediaPlayer.VideoSurface
+            )
 
-        # 플레이 리스트 등록
-        self.__play_lst = QtMultimedia.QMediaPlaylist()
-        self.__add_play_lst()
-        self.player.setPlaylist(self.__play_lst)
+            # 플레이 리스트 등록 (플레이어에 등록은 set_tile_decode에서 QMediaPlayer를 사용할 때)
+            self.__play_lst = QtMultimedia.QMediaPlaylist()
+            self.__add_play_lst()
 
-        # 위젯 설정
-        v_widget = QtMultimediaWidgets.QVideoWidget()
+            # 위젯 설정
+            v_widget = QtMultimediaWidgets.QVideoWidget()
+        self.__media_player = None if self.__is_sequence else self.player
+        self.__flipbook = None  # -> 타일 크기로 디코딩하는 경우 생성
         v_widget.setStyleSheet("background-color: rgb(0, 0, 0);")
+        # 디코더를 반환한 동안 마지막 프레임을 표시하고, 플립북은 이 위젯에 프레임을 그림
+        # (시퀀스는 FrameView가 마지막 프레임을 유지)
+        self.__v_widget = v_widget
+        self.__frame_view = sequence_player.FrameView()
+        self.__stack = QtWidgets.QStackedWidget()
+        self.__stack.addWidget(v_widget)
+        self.__stack.addWidget(self.__frame_view)
 
         # fonts
         font = QtGui.QFont("Sans Serif", 8)
@@ -194,14 +513,20 @@ class VideoWidget(QtWidgets.QWidget):
         self.label_frame.setLayout(QtWidgets.QHBoxLayout())
         self.label_path = QtWidgets.QLabel()
         self.label_path.setText(f"{os.path.basename(self.__video_path)}")
+        if self.__play_path != self.__video_path:
+            self.label_path.setText(f"{self.label_path.text()} (proxy)")
         label_spacer = QtWidgets.QSpacerItem(
             200, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed
         )
         self.label_fps = QtWidgets.QLabel()
         self.label_fps.setText(f"{self.__get_current_video_fps()}fps")
+        # 동기화 재생 중 마스터 클럭과의 프레임 차이, 동기화 재생이 아니면 숨김
+        self.label_drift = QtWidgets.QLabel()
+        self.label_drift.setVisible(False)
 
         self.label_frame.layout().addWidget(self.label_path)
         self.label_frame.layout().addItem(label_spacer)
+        self.label_frame.layout().addWidget(self.label_drift)
         self.label_frame.layout().addWidget(self.label_fps)
 
         self.label_remain_time = QtWidgets.QLabel()
@@ -244,7 +569,7 @@ class VideoWidget(QtWidgets.QWidget):
         hbox.addWidget(self.btn_fullscreen)
         vbox = QtWidgets.QVBoxLayout()
         vbox.addWidget(self.label_frame)
-        vbox.addWidget(v_widget)
+        vbox.addWidget(self.__stack)
         vbox.addLayout(hbox)
 
         self.player.setVideoOutput(v_widget)
@@ -259,15 +584,25 @@ class VideoWidget(QtWidgets.QWidget):
         self.btn_mode.clicked.connect(self.slot_changed_mode)
         self.btn_fullscreen.clicked.connect(self.slot_detach_viewer)
         self.__slider.sliderMoved.connect(self.__slot_slider_moved)
-        self.player.stateChanged.connect(self.__slot_state_changed)
-        self.player.positionChanged.connect(self.__slot_pos_shanged)
-        self.player.durationChanged.connect(self.__slot_duration_changed)
+        self.__connect_player(self.player)
+        if not self.__is_sequence:
+            self.player.mediaStatusChanged.connect(self.__slot_media_status_changed)
+        # 시퀀스는 생성과 동시에 길이가 정해지므로 시그널을 연결하기 전의 값을 반영
+        self.__slider.setRange(0, self.player.duration())
+
+    def __connect_player(self, player) -> None:
+        """
+        :param player: 시그널을 연결할 플레이어 (QMediaPlayer와 같은 이름의 시그널)
+        """
+        player.stateChanged.connect(self.__slot_state_changed)
+        player.positionChanged.connect(self.__slot_pos_shanged)
+        player.durationChanged.connect(self.__slot_duration_changed)
 
     def slot_detach_viewer(self) -> None:
         """
         detach 버튼 클릭 시 영상을 싱글 뷰어에서 재생
         """
-        self.player.stop()
+        self.stop()
         vw = self.__single_viewer.VideoWidget([self.__video_path])
         vw.show()
 
@@ -275,17 +610,18 @@ class VideoWidget(QtWidgets.QWidget):
         """
         stop 버튼 클릭 시 플레이어 포지션 초기화 및 정지
         """
-        self.player.setPosition(0)
-        self.player.stop()
+        if self.__has_decoder:
+            self.player.setPosition(0)
+        self.stop()
 
     def slot_play_video(self) -> None:
         """
         play 버튼 클릭 시 재생 중이면 일시정지, 그렇지 않으면 재생
         """
-        if self.player.state() == QtMultimedia.QMediaPlayer.PlayingState:
-            self.player.pause()
+        if self.is_playing() or self.__want_play:
+            self.pause()
         else:
-            self.player.play()
+            self.play()
 
     def __slot_state_changed(self, ste: QtMultimedia.QMediaPlayer.state) -> None:
         """
@@ -293,35 +629,46 @@ class VideoWidget(QtWidgets.QWidget):
         플레이어의 상태가 변경될 경우 UI 갱신,
         loop버튼이 체크 상태일 때 플레이어가 정지되면 영상을 처음부터 다시 재생
         """
+        if self.sender() not in (None, self.player):
+            return
         if ste == QtMultimedia.QMediaPlayer.PlayingState:
+            self.__clock.wake()
             self.__btn_play.setIcon(
                 self.style().standardIcon(QtWidgets.QStyle.SP_MediaPause)
             )
-        else:
+        elif not self.__suspending:
             self.__btn_play.setIcon(
                 self.style().standardIcon(QtWidgets.QStyle.SP_MediaPlay)
             )
-        if ste == QtMultimedia.QMediaPlayer.StoppedState:
-            if self.btn_loop.isChecked():
+        # 디코더를 반환하기 위해 정지한 경우는 재생이 끝난 것이 아님
+        if ste == QtMultimedia.QMediaPlayer.StoppedState and not self.__suspending:
+            if self.btn_loop.isChecked() and self.__want_play:
                 self.player.setPosition(0)
                 self.player.play()
                 self.__btn_play.setIcon(
                     self.style().standardIcon(QtWidgets.QStyle.SP_MediaPause)
                 )
+            elif self.__has_decoder:
+                # 마지막 프레임까지 재생이 끝나면 디코더를 반환
+                self.__want_play = False
+                self.release_decoder()
 
     def __slot_slider_moved(self, pos: QtWidgets.QSlider.pos) -> None:
         """
         :param pos: 슬라이더의 position 값
         슬라이더를 조작할 경우 플레이어의 재생 구간을 업데이트
         """
-        self.player.setPosition(pos)
+        self.set_position(pos)
 
     def __slot_pos_shanged(self, pos: QtMultimedia.QMediaPlayer.position) -> None:
         """
         :param pos: 플레이어의 현재 재생 구간
-        플레이어의 재생 구간이 변경될 경우 슬라이더 업데이트
+        플레이어의 재생 구간이 변경될 경우 슬라이더 업데이트 (정지 상태에서 이동한 경우 포함)
         """
+        if self.sender() not in (None, self.player):
+            return
         self.__slider.setValue(pos)
+        self.refresh_time()
 
     def __slot_duration_changed(
         self, duration: QtMultimedia.QMediaPlayer.duration
@@ -330,13 +677,21 @@ class VideoWidget(QtWidgets.QWidget):
         :param duration: 현재 재생 중인 영상의 길이
         영상이 변경될 경우 슬라이더의 범위를 업데이트
         """
+        if self.sender() not in (None, self.player):
+            return
+        if duration > 0:
+            self.__known_duration = duration
+        elif self.__known_duration:
+            # 디코더를 반환하여 정지한 동안에도 슬라이더의 범위를 유지
+            return
         self.__slider.setRange(0, duration)
+        self.refresh_time()
 
     def __add_play_lst(self) -> None:
         """
         파일 경로가 유효한지 확인 후 플레이리스트에 추가
         """
-        v_path = self.__video_path
+        v_path = self.__play_path
         f_info = QtCore.QFileInfo(v_path)
         if not os.path.exists(v_path):
             print(f"\033[31mERROR: 존재하지 않는 파일 >> {v_path}")
@@ -355,15 +710,53 @@ class VideoWidget(QtWidgets.QWidget):
         """
         return self.__wid
 
-    @QtCore.Slot(int)
-    def __update_slider_position(
-        self, position: QtMultimedia.QMediaPlayer.position
-    ) -> None:
+    @property
+    def fps(self) -> float:
         """
-        :param position: 플레이어의 현재 재생 구간
-        :return: 스레드에서 정해진 간격으로 슬라이더를 업데이트
+        :return: 현재 재생 중인 파일의 fps
         """
-        self.__slider.setValue(position)
+        return self.__current_fps
+
+    def step_frame(self, frames: int) -> None:
+        """
+        일시 정지 후 프레임 단위로 이동
+        :param frames: 이동할 프레임 수 (음수이면 뒤로)
+        """
+        self.pause()
+        if self.__is_sequence:
+            self.player.step(frames)
+            return
+        if self.__frame_index is not None:
+            self.set_position(
+                self.__frame_index.step_position(self.position(), frames)
+            )
+        elif self.__current_fps:
+            pos = self.position() + round(frames * 1000 / self.__current_fps)
+            self.set_position(max(0, min(pos, self.duration())))
+
+    def set_playback_rate(self, rate: float) -> None:
+        """
+        :param rate: 재생 속도, 동기화 재생에서 fps가 낮은 타일이 마스터 클럭의 프레임 속도를 따라가도록 사용
+        타일 크기 디코딩을 켜고 끄며 플레이어가 바뀌어도 유지
+        """
+        self.__rate = rate
+        if self.player.playbackRate() != rate:
+            self.player.setPlaybackRate(rate)
+
+    def set_drift(self, frames: int or None) -> None:
+        """
+        :param frames: 마스터 클럭보다 앞선(+) 혹은 뒤처진(-) 프레임 수, None이면 표시하지 않음
+        """
+        if frames == self.__drift:
+            return
+        self.__drift = frames
+        if frames is None:
+            self.label_drift.setVisible(False)
+            return
+        color = "rgb(255, 255, 255)" if abs(frames) <= 1 else "rgb(255, 90, 90)"
+        self.label_drift.setStyleSheet(f"color: {color};")
+        self.label_drift.setText(f"{frames:+d}f")
+        self.label_drift.setVisible(True)
 
     def slot_changed_mode(self) -> None:
         """
@@ -373,15 +766,15 @@ class VideoWidget(QtWidgets.QWidget):
             self.btn_mode.setText("fps")
         elif self.btn_mode.text() == "fps":
             self.btn_mode.setText("tc")
+        self.refresh_time()
 
-    @QtCore.Slot(int)
     def slot_label_info(self) -> None:
         """
-        설정된 표시 형식에 따라 시간 혹은 fps를 스레드에서 정해진 간격으로 업데이트
+        설정된 표시 형식에 따라 시간 혹은 fps를 업데이트
         """
         # 플레이어의 포지션 값
-        total_pos = self.player.duration()
-        current_pos = self.player.position()
+        total_pos = self.duration()
+        current_pos = self.position()
         remain_pos = total_pos - current_pos + 1000
 
         # 포지션 값을 QTime으로 변환
@@ -389,9 +782,13 @@ class VideoWidget(QtWidgets.QWidget):
         current_time = QtCore.QTime(0, 0).addMSecs(current_pos)
         remain_time = QtCore.QTime(0, 0).addMSecs(remain_pos)
 
-        # 포지션 값을 프레임 단위로 변환
-        total_frames = int((total_pos / 1000) * self.__current_fps)
-        current_frames = int((current_pos / 1000) * self.__current_fps)
+        # 포지션 값을 프레임 단위로 변환, 프레임 인덱스가 있으면 정확한 프레임 번호를 사용
+        if self.__frame_index is not None:
+            total_frames = self.__frame_index.frame_count
+            current_frames = self.__frame_index.frame_at_position(current_pos)
+        else:
+            total_frames = int((total_pos / 1000) * self.__current_fps)
+            current_frames = int((current_pos / 1000) * self.__current_fps)
         remain_frames = total_frames - current_frames
 
         # QTime값을 시간:분:초 형식으로 변환
@@ -411,14 +808,14 @@ class VideoWidget(QtWidgets.QWidget):
         """
         현재 재생 중인 파일의 fps를 소수점 아래 3자리까지 반환
         """
-        current_media = self.player.currentMedia()
-        if current_media.isNull():
+        if self.__is_sequence:
+            return self.player.fps
+        # 플레이리스트를 등록하기 전에도 읽을 수 있도록 재생할 경로에서 직접 읽음
+        if self.__play_lst.isEmpty():
             print("\033[31mERROR: 현재 미디어가 없음\033[0m")
             return 0
-        else:
-            current_url = current_media.canonicalUrl().toLocalFile()
-            fps = round(self.__NP_Util.NP_Utils.get_video_fps(current_url), 3)
-            return fps
+        fps = round(self.__NP_Util.NP_Utils.get_video_fps(self.__play_path), 3)
+        return fps
 
 
 test_path = "/home/rapa/Downloads/test1.MOV"
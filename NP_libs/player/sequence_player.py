@@ -0,0 +1,382 @@
+#!/usr/bin/env python
+# encoding=utf-8
+
+# author        :   Juno Park
+# created date  :   2026.10.18
+# modified date :   2026.10.18
+# description   :   이미지 시퀀스를 영상으로 변환하지 않고 디스크에서 바로 읽어 재생하는 플레이어
+#                   QMediaPlayer와 같은 메서드, 시그널을 제공하므로 뷰어에서 그대로 교체하여 사용하며,
+#                   재생 위치 앞의 프레임을 스레드에서 미리 디코딩하여 공용 프레임 캐시에 저장함
+#                   프레임이 서로 독립적이므로 역재생, 배속 재생은 표시할 프레임만 디코딩함
+
+import math
+import threading
+from concurrent import futures
+
+from PySide2 import QtWidgets, QtCore, QtGui, QtMultimedia
+from NP_libs import NP_Utils
+from NP_libs.system import sequence as sequence_lib
+from NP_libs.system import frame_cache as frame_cache_lib
+from NP_libs.player import shuttle as shuttle_lib
+
+
+class FrameView(QtWidgets.QWidget):
+    # SequencePlayer의 프레임을 비율을 유지하여 그리는 위젯 (QVideoWidget 대신 사용)
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.__image = QtGui.QImage()
+        self.setAttribute(QtCore.Qt.WA_OpaquePaintEvent)
+
+    @QtCore.Slot(QtGui.QImage)
+    def set_image(self, image: QtGui.QImage) -> None:
+        self.__image = image
+        self.update()
+
+    def clear(self) -> None:
+        self.__image = QtGui.QImage()
+        self.update()
+
+    def paintEvent(self, event) -> None:
+        painter = QtGui.QPainter(self)
+        painter.fillRect(self.rect(), QtCore.Qt.black)
+        if self.__image.isNull():
+            return
+        size = self.__image.size().scaled(self.size(), QtCore.Qt.KeepAspectRatio)
+        rect = QtCore.QRect(QtCore.QPoint(0, 0), size)
+        rect.moveCenter(self.rect().center())
+        painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform)
+        painter.drawImage(rect, self.__image)
+
+
+class SequencePlayer(QtCore.QObject):
+    # QMediaPlayer와 같은 이름의 시그널
+    stateChanged = QtCore.Signal(object)  # -> QMediaPlayer.State
+    positionChanged = QtCore.Signal("qint64")
+    durationChanged = QtCore.Signal("qint64")
+    frame_changed = QtCore.Signal(QtGui.QImage)
+    frame_loaded = QtCore.Signal(int)  # -> 디코딩이 끝난 프레임의 인덱스 (워커 스레드에서 발생)
+    rate_measured = QtCore.Signal(float, float)  # -> (목표 속도, 실제 속도)
+
+    def __init__(
+        self,
+        pattern: str = None,
+        fps: float = sequence_lib.DEFAULT_FPS,
+        decode_width: int = None,
+        frame_cache: frame_cache_lib.FrameCache = None,
+        readahead: int = 48,
+        max_workers: int = 4,
+        parent=None,
+    ):
+        """
+        :param pattern: printf 형식의 시퀀스 경로 ex) /plates/shot.%04d.exr
+        :param fps: 재생할 fps
+        :param decode_width: 디코딩할 너비, None이면 원본 크기 (멀티 뷰어의 타일에서 사용)
+        :param frame_cache: 디코딩한 프레임을 저장할 캐시, None이면 뷰어들이 함께 사용하는 공용 캐시
+        :param readahead: 재생 위치 앞에서 미리 디코딩할 프레임 수
+        :param max_workers: 디코딩에 사용할 스레드 수
+        """
+        super().__init__(parent)
+        self.__fps = fps
+        self.__decode_width = decode_width
+        self.__readahead = readahead
+        self.__seq = None
+        self.__clip = None  # -> 프레임 캐시에서 현재 시퀀스를 구분하는 키
+        self.__qt_readable = False
+        self.__generation = 0  # -> 시퀀스가 바뀌면 이전 시퀀스의 디코딩 결과를 버림
+        self.__index = 0  # -> 현재 프레임의 인덱스 (프레임 번호가 아닌 순서)
+        self.__shown = -1
+        self.__frame_bytes = 0
+        self.__state = QtMultimedia.QMediaPlayer.StoppedState
+        self.__rate = 1.0  # -> 재생 속도, 음수이면 역재생
+        self.__meter = shuttle_lib.RateMeter()
+
+        # {(클립 키, 인덱스): QImage}, 같은 시퀀스를 다시 열거나 다른 뷰어에서 열어도 디코딩하지 않음
+        if frame_cache is None:
+            frame_cache = frame_cache_lib.SingletonFrameCache()
+        self.__cache = frame_cache
+        self.__executor = futures.ThreadPoolExecutor(max_workers=max(1, max_workers))
+        self.__futures = dict()  # -> {인덱스: 디코딩 중인 Future}
+        self.__lock = threading.Lock()
+
+        # 재생 시간은 타이머의 간격 대신 경과 시간으로 계산하여 누적 오차를 없앰
+        self.__clock = QtCore.QElapsedTimer()
+        self.__anchor = 0  # -> 경과 시간을 잰 기준 프레임
+        self.__timer = QtCore.QTimer(self)
+        self.__timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self.__timer.setInterval(max(1, int(1000 / self.__fps / 4)))
+        self.__timer.timeout.connect(self.__tick)
+        self.frame_loaded.connect(self.__slot_frame_loaded)
+
+        if pattern is not None:
+            self.setMedia(pattern)
+
+    def setMedia(self, pattern: str) -> bool:
+        """
+        :param pattern: printf 형식의 시퀀스 경로
+        :return: 시퀀스를 찾으면 True
+        첫 프레임만 먼저 디코딩하므로 시퀀스의 길이와 관계없이 바로 화면에 표시됨
+        """
+        self.stop()
+        self.__cancel_pending()
+        self.__generation += 1
+        self.__shown = -1
+        self.__frame_bytes = 0
+        self.__seq = sequence_lib.find_sequence(pattern)
+        if self.__seq is None:
+            print(f"\033[31mERROR: 존재하지 않는 시퀀스 >> {pattern}\033[0m")
+            self.durationChanged.emit(0)
+            return False
+        self.__clip = frame_cache_lib.FrameCache.clip_key(pattern, self.__decode_width)
+        supported = {
+            bytes(fmt).decode().lower()
+            for fmt in QtGui.QImageReader.supportedImageFormats()
+        }
+        self.__qt_readable = self.__seq.ext.lstrip(".").lower() in supported
+        self.durationChanged.emit(self.duration())
+        self.__seek(0)
+        return True
+
+    def setVideoOutput(self, view: FrameView) -> None:
+        self.frame_changed.connect(view.set_image)
+
+    @property
+    def sequence(self) -> sequence_lib.Sequence or None:
+        return self.__seq
+
+    @property
+    def fps(self) -> float:
+        return self.__fps
+
+    def state(self) -> QtMultimedia.QMediaPlayer.State:
+        return self.__state
+
+    def playbackRate(self) -> float:
+        return self.__rate
+
+    def setPlaybackRate(self, rate: float) -> None:
+        """
+        :param rate: 재생 속도, 음수이면 역재생 (0.25 ~ 4배)
+        """
+        rate = math.copysign(
+            max(0.25, min(abs(rate), shuttle_lib.ShuttlePlayer.MAX_RATE)), rate
+        )
+        if rate == self.__rate:
+            return
+        self.__rate = rate
+        self.__restart_clock()
+        if self.__seq is not None:
+            self.__prefetch()
+
+    def position(self) -> int:
+        """
+        :return: 현재 프레임의 위치(ms)
+        """
+        return int(round(self.__index * 1000 / self.__fps))
+
+    def duration(self) -> int:
+        """
+        :return: 시퀀스의 길이(ms)
+        """
+        if self.__seq is None:
+            return 0
+        return int(round(len(self.__seq) * 1000 / self.__fps))
+
+    def current_frame(self) -> int or None:
+        """
+        :return: 현재 프레임의 번호
+        """
+        if self.__seq is None:
+            return None
+        return self.__seq.frames[self.__index]
+
+    def play(self) -> None:
+        if self.__seq is None:
+            return
+        self.__restart_clock()
+        self.__timer.start()
+        self.__set_state(QtMultimedia.QMediaPlayer.PlayingState)
+
+    def pause(self) -> None:
+        if self.__seq is None:
+            return
+        self.__timer.stop()
+        self.__set_state(QtMultimedia.QMediaPlayer.PausedState)
+
+    def stop(self) -> None:
+        self.__timer.stop()
+        if self.__seq is not None and self.__index != 0:
+            self.__seek(0)
+        self.__set_state(QtMultimedia.QMediaPlayer.StoppedState)
+
+    def setPosition(self, position: int) -> None:
+        """
+        :param position: 이동할 위치(ms)
+        """
+        if self.__seq is None:
+            return
+        index = int(position * self.__fps / 1000)
+        self.__seek(max(0, min(index, len(self.__seq) - 1)))
+        self.__restart_clock()
+
+    def step(self, frames: int) -> None:
+        """
+        :param frames: 이동할 프레임 수, 음수이면 이전 프레임으로 이동
+        재생 중이면 일시정지한 뒤 이동
+        """
+        if self.__seq is None:
+            return
+        if self.__state == QtMultimedia.QMediaPlayer.PlayingState:
+            self.pause()
+        self.__seek(max(0, min(self.__index + frames, len(self.__seq) - 1)))
+
+    def release(self) -> None:
+        """
+        타이머와 디코딩 스레드를 정리 (캐시된 프레임은 다른 뷰어가 사용할 수 있도록 유지)
+        """
+        self.__timer.stop()
+        self.__cancel_pending()
+        self.__generation += 1
+        self.__executor.shutdown(wait=False)
+
+    def __set_state(self, state: QtMultimedia.QMediaPlayer.State) -> None:
+        if self.__state != state:
+            self.__state = state
+            self.stateChanged.emit(state)
+
+    def __restart_clock(self) -> None:
+        self.__anchor = self.__index
+        self.__clock.restart()
+        self.__meter.reset()
+
+    @property
+    def __step(self) -> int:
+        """
+        :return: 재생 방향으로 표시할 다음 프레임까지의 간격 (배속 재생은 사이의 프레임을 건너뜀)
+        """
+        return int(math.copysign(max(1, int(abs(self.__rate))), self.__rate))
+
+    def __seek(self, index: int) -> None:
+        """
+        :param index: 이동할 프레임의 인덱스
+        캐시에 프레임이 있으면 바로 표시하고, 없으면 디코딩이 끝날 때 표시
+        """
+        self.__index = index
+        image = self.__cache.get(self.__clip, index, spill=False)
+        if image is not None:
+            self.__show(image)
+        self.__prefetch()
+        self.positionChanged.emit(self.position())
+
+    def __show(self, image: QtGui.QImage) -> None:
+        self.__shown = self.__index
+        self.frame_changed.emit(image)
+
+    def __tick(self) -> None:
+        """
+        다음 프레임을 표시할 시간이 되면 캐시에서 꺼내 표시
+        디코딩이 늦어진 경우 프레임을 건너뛰지 않고 기다린 뒤, 그 시점부터 다시 시간을 계산
+        역재생은 첫 프레임에 도달하면 일시정지
+        """
+        due = self.__anchor + self.__clock.elapsed() * self.__fps * self.__rate / 1000
+        next_index = self.__index + self.__step
+        if (due - next_index) * self.__rate < 0:
+            return
+        if self.__rate < 0 and self.__index == 0:
+            self.pause()
+            return
+        if next_index >= len(self.__seq) and self.__index == len(self.__seq) - 1:
+            self.stop()
+            return
+        next_index = max(0, min(next_index, len(self.__seq) - 1))
+        image = self.__cache.get(self.__clip, next_index, spill=False)
+        if image is None:
+            self.__anchor = next_index
+            self.__clock.restart()
+            return
+        self.__index = next_index
+        self.__show(image)
+        self.__prefetch()
+        self.positionChanged.emit(self.position())
+        measured = self.__meter.add(next_index)
+        if measured is not None:
+            self.rate_measured.emit(self.__rate, measured / self.__fps)
+
+    def __prefetch(self) -> None:
+        """
+        현재 위치부터 재생 방향으로 readahead 만큼의 프레임을 디코딩 요청
+        범위를 벗어난 대기 중인 요청은 취소하여 탐색 직후의 프레임이 먼저 디코딩되도록 함
+        배속 재생은 표시할 간격의 프레임만 요청
+        """
+        count = self.__readahead
+        if self.__frame_bytes:
+            # 미리 읽은 프레임이 캐시에서 밀려나지 않도록 캐시 용량의 절반까지만 읽음
+            count = min(count, max(2, self.__cache.max_bytes // self.__frame_bytes // 2))
+        step = self.__step
+        stop = self.__index + count * step
+        window = range(self.__index, max(-1, min(stop, len(self.__seq))), step)
+        with self.__lock:
+            for idx, future in list(self.__futures.items()):
+                if idx not in window and future.cancel():
+                    del self.__futures[idx]
+            for idx in window:
+                if idx in self.__futures or (self.__clip, idx) in self.__cache:
+                    continue
+                self.__futures[idx] = self.__executor.submit(
+                    self.__decode, idx, self.__clip, self.__generation
+                )
+
+    def __cancel_pending(self) -> None:
+        with self.__lock:
+            for future in self.__futures.values():
+                future.cancel()
+            self.__futures.clear()
+
+    def __decode(self, idx: int, clip: str, generation: int) -> None:
+        """
+        워커 스레드에서 프레임을 읽어 캐시에 저장
+        디스크 캐시에 있으면 디코딩하지 않고 읽어오며,
+        Qt가 지원하는 형식은 QImageReader로, 그 외(exr, dpx 등)는 ffmpeg로 디코딩
+        """
+        try:
+            seq = self.__seq
+            if generation != self.__generation or seq is None:
+                return
+            image = self.__cache.get(clip, idx)
+            if image is not None:
+                self.__frame_bytes = image.sizeInBytes()
+                self.frame_loaded.emit(idx)
+                return
+            path = seq.frame_path(seq.frames[idx])
+            if self.__qt_readable:
+                reader = QtGui.QImageReader(path)
+                size = reader.size()
+                if self.__decode_width and size.width() > self.__decode_width:
+                    reader.setScaledSize(
+                        QtCore.QSize(
+                            self.__decode_width,
+                            round(size.height() * self.__decode_width / size.width()),
+                        )
+                    )
+                image = reader.read()
+            else:
+                image = NP_Utils.NP_Utils.read_frame_image(path, self.__decode_width)
+            if image is None or image.isNull() or generation != self.__generation:
+                return
+            self.__frame_bytes = image.sizeInBytes()
+            self.__cache.put(clip, idx, image)
+            self.frame_loaded.emit(idx)
+        finally:
+            with self.__lock:
+                if generation == self.__generation:
+                    self.__futures.pop(idx, None)
+
+    @QtCore.Slot(int)
+    def __slot_frame_loaded(self, idx: int) -> None:
+        """
+        탐색, 정지 상태에서 기다리던 프레임의 디코딩이 끝나면 표시
+        """
+        if idx != self.__index or self.__shown == idx:
+            return
+        image = self.__cache.get(self.__clip, idx, spill=False)
+        if image is not None:
+            self.__show(image)
@@ -0,0 +1,467 @@
+#!/usr/bin/env python
+# encoding=utf-8
+
+# author        :   Juno Park
+# created date  :   2026.10.18
+# modified date :   2026.10.18
+# description   :   JKL 셔틀(역재생, 배속, 슬로우 모션)로 영상을 재생하는 플레이어
+#                   역재생은 GOP 단위로 정방향 디코딩하여 공용 프레임 캐시에 저장한 뒤 거꾸로 표시하고,
+#                   배속 재생은 표시하지 않을 프레임을 변환, 전송하지 않음
+
+import math
+import threading
+import time
+import collections
+from concurrent import futures
+
+import ffmpeg
+from PySide2 import QtCore, QtGui, QtMultimedia
+from NP_libs import NP_Utils
+from NP_libs.system import frame_cache as frame_cache_lib
+
+
+class RateMeter:
+    # 실제로 표시한 프레임으로 실제 재생 속도를 계산 (목표 속도와 비교하여 표시)
+    def __init__(self, window: float = 1.0, interval: float = 0.25):
+        """
+        :param window: 속도를 계산할 최근 구간(초)
+        :param interval: 측정값을 반환하는 간격(초)
+        """
+        self.__window = window
+        self.__interval = interval
+        self.__samples = collections.deque()  # -> (시간, 프레임)
+        self.__last_report = 0.0
+
+    def reset(self) -> None:
+        self.__samples.clear()
+        self.__last_report = time.perf_counter()
+
+    def add(self, frame: int) -> float or None:
+        """
+        :param frame: 표시한 프레임
+        :return: 초당 이동한 프레임 수 (역방향은 음수), 측정 간격이 지나지 않았으면 None
+        """
+        now = time.perf_counter()
+        self.__samples.append((now, frame))
+        while len(self.__samples) > 2 and now - self.__samples[0][0] > self.__window:
+            self.__samples.popleft()
+        if now - self.__last_report < self.__interval or len(self.__samples) < 2:
+            return None
+        self.__last_report = now
+        (start, first), (end, last) = self.__samples[0], self.__samples[-1]
+        if end <= start:
+            return None
+        return (last - first) / (end - start)
+
+
+class ShuttlePlayer(QtCore.QObject):
+    # QMediaPlayer와 같은 이름의 시그널
+    stateChanged = QtCore.Signal(object)  # -> QMediaPlayer.State
+    positionChanged = QtCore.Signal("qint64")
+    durationChanged = QtCore.Signal("qint64")
+    frame_changed = QtCore.Signal(QtGui.QImage)
+    frame_loaded = QtCore.Signal(int)  # -> 디코딩이 끝난 프레임의 인덱스 (워커 스레드에서 발생)
+    rate_measured = QtCore.Signal(float, float)  # -> (목표 속도, 실제 속도)
+    finished = QtCore.Signal()  # -> 재생 방향의 마지막 프레임에 도달, 일시정지하기 직전에 발생
+
+    MAX_RATE = 4.0
+    # 정방향에서 한 번에 디코딩할 재생 시간(초)
+    CHUNK_SECONDS = 1.0
+    # 역방향에서 한 번에 캐시에 저장할 최대 프레임 수, 이보다 긴 GOP는 나누어 디코딩
+    MAX_GOP_FRAMES = 48
+
+    def __init__(
+        self,
+        decode_width: int = None,
+        frame_cache: frame_cache_lib.FrameCache = None,
+        parent=None,
+    ):
+        """
+        :param decode_width: 디코딩할 너비, None이면 원본 크기
+        :param frame_cache: 디코딩한 프레임을 저장할 캐시, None이면 뷰어들이 함께 사용하는 공용 캐시
+        """
+        super().__init__(parent)
+        self.__decode_width = decode_width
+        if frame_cache is None:
+            frame_cache = frame_cache_lib.SingletonFrameCache()
+        self.__cache = frame_cache
+        self.__path = None
+        self.__clip = None
+        self.__fps = 0.0
+        self.__frame_count = 0
+        self.__size = (0, 0)
+        self.__scaled = False
+        self.__frame_index = None
+        self.__state = QtMultimedia.QMediaPlayer.StoppedState
+        self.__rate = 1.0
+        self.__step = 1  # -> 배속 재생에서 표시하는 프레임의 간격
+        self.__index = 0
+        self.__shown = -1
+        self.__frontier = None  # -> 재생 방향으로 디코딩을 요청한 경계
+
+        # 디코딩은 한 스레드에서 요청한 순서대로 처리
+        self.__executor = futures.ThreadPoolExecutor(max_workers=1)
+        self.__futures = list()
+        self.__process = None
+        self.__generation = 0  # -> 속도, 위치가 바뀌면 이전 요청의 결과를 버림
+        self.__lock = threading.Lock()
+
+        # 재생 시간은 타이머의 간격 대신 경과 시간으로 계산하여 누적 오차를 없앰
+        self.__meter = RateMeter()
+        self.__clock = QtCore.QElapsedTimer()
+        self.__anchor = 0
+        self.__timer = QtCore.QTimer(self)
+        self.__timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self.__timer.timeout.connect(self.__tick)
+        self.frame_loaded.connect(self.__slot_frame_loaded)
+
+    def setMedia(self, file_path: str) -> bool:
+        """
+        :param file_path: 재생할 영상 경로
+        :return: 영상 정보를 읽으면 True
+        """
+        self.clear()
+        try:
+            info = NP_Utils.NP_Utils.get_media_info(file_path)
+        except (OSError, StopIteration, ffmpeg.Error) as err:
+            print(f"\033[31mERROR: 영상 정보를 읽을 수 없음 >> {file_path}: {err}\033[0m")
+            self.durationChanged.emit(0)
+            return False
+        if not info.frame_count or not info.fps:
+            self.durationChanged.emit(0)
+            return False
+        width, height = info.width, info.height
+        if self.__decode_width and width > self.__decode_width:
+            height = round(height * self.__decode_width / width / 2) * 2
+            width = self.__decode_width
+        self.__scaled = (width, height) != (info.width, info.height)
+        self.__size = (width, height)
+        self.__path = file_path
+        self.__clip = frame_cache_lib.FrameCache.clip_key(
+            file_path, width if self.__scaled else None
+        )
+        self.__fps = info.fps
+        self.__frame_count = info.frame_count
+        self.__frame_index = NP_Utils.NP_Utils.get_frame_index(file_path, build=False)
+        if self.__frame_index is not None and self.__frame_index.frame_count:
+            self.__frame_count = self.__frame_index.frame_count
+        else:
+            self.__frame_index = None
+        self.__timer.setInterval(max(1, int(1000 / self.__fps / 4)))
+        self.durationChanged.emit(self.duration())
+        return True
+
+    def setVideoOutput(self, view) -> None:
+        """
+        :param view: set_image 슬롯을 가진 위젯 (sequence_player.FrameView)
+        """
+        self.frame_changed.connect(view.set_image)
+
+    @property
+    def path(self) -> str or None:
+        return self.__path
+
+    @property
+    def fps(self) -> float:
+        return self.__fps
+
+    @property
+    def frame_count(self) -> int:
+        return self.__frame_count
+
+    def playbackRate(self) -> float:
+        return self.__rate
+
+    def setPlaybackRate(self, rate: float) -> None:
+        """
+        :param rate: 재생 속도, 음수이면 역재생 (0.25 ~ 4배)
+        속도가 바뀌면 진행 중인 디코딩을 취소하고 현재 프레임부터 새 방향, 간격으로 디코딩
+        """
+        rate = math.copysign(max(0.25, min(abs(rate), self.MAX_RATE)), rate)
+        if rate == self.__rate:
+            return
+        self.__rate = rate
+        self.__step = max(1, int(abs(rate)))
+        self.__cancel()
+        self.__restart_clock()
+        if self.__state == QtMultimedia.QMediaPlayer.PlayingState:
+            self.__schedule()
+
+    def state(self) -> QtMultimedia.QMediaPlayer.State:
+        return self.__state
+
+    def position(self) -> int:
+        """
+        :return: 현재 프레임의 위치(ms)
+        """
+        if not self.__fps:
+            return 0
+        if self.__frame_index is not None:
+            return self.__frame_index.position_of(self.__index)
+        return int(round(self.__index * 1000 / self.__fps))
+
+    def duration(self) -> int:
+        """
+        :return: 영상의 길이(ms)
+        """
+        if not self.__fps:
+            return 0
+        if self.__frame_index is not None:
+            last = self.__frame_index.time_of(self.__frame_count - 1)
+            return int(round((last + 1 / self.__fps) * 1000))
+        return int(round(self.__frame_count * 1000 / self.__fps))
+
+    def current_frame(self) -> int:
+        return self.__index
+
+    def play(self) -> None:
+        if self.__path is None:
+            return
+        self.__restart_clock()
+        self.__schedule()
+        self.__timer.start()
+        self.__set_state(QtMultimedia.QMediaPlayer.PlayingState)
+
+    def pause(self) -> None:
+        if self.__path is None:
+            return
+        self.__timer.stop()
+        self.__cancel()
+        self.__set_state(QtMultimedia.QMediaPlayer.PausedState)
+
+    def stop(self) -> None:
+        self.__timer.stop()
+        self.__cancel()
+        self.__index = 0
+        self.__set_state(QtMultimedia.QMediaPlayer.StoppedState)
+
+    def setPosition(self, position: int) -> None:
+        """
+        :param position: 이동할 위치(ms)
+        캐시에 프레임이 없으면 해당 프레임만 디코딩하여 표시
+        """
+        if self.__path is None:
+            return
+        if self.__frame_index is not None:
+            index = self.__frame_index.frame_at_position(position)
+        else:
+            index = int(position * self.__fps / 1000)
+        self.__index = max(0, min(index, self.__frame_count - 1))
+        self.__cancel()
+        self.__restart_clock()
+        image = self.__cache.get(self.__clip, self.__index, spill=False)
+        if image is not None:
+            self.__show(image)
+        elif self.__state == QtMultimedia.QMediaPlayer.PlayingState:
+            self.__schedule()
+        else:
+            self.__submit(self.__index, self.__index + 1, 1)
+        self.positionChanged.emit(self.position())
+
+    def clear(self) -> None:
+        """
+        디코딩을 취소하고 영상을 닫음 (디코딩한 프레임은 다른 뷰어가 사용할 수 있도록 캐시에 유지)
+        """
+        self.__timer.stop()
+        self.__cancel()
+        self.__path = None
+        self.__clip = None
+        self.__frame_index = None
+        self.__frame_count = 0
+        self.__index = 0
+        self.__shown = -1
+        self.__set_state(QtMultimedia.QMediaPlayer.StoppedState)
+
+    def release(self) -> None:
+        self.clear()
+        self.__executor.shutdown(wait=False)
+
+    def __set_state(self, state: QtMultimedia.QMediaPlayer.State) -> None:
+        if self.__state != state:
+            self.__state = state
+            self.stateChanged.emit(state)
+
+    def __restart_clock(self) -> None:
+        self.__anchor = self.__index
+        self.__clock.restart()
+        self.__meter.reset()
+
+    def __show(self, image: QtGui.QImage) -> None:
+        self.__shown = self.__index
+        self.frame_changed.emit(image)
+
+    def __due(self) -> int:
+        """
+        :return: 경과 시간과 속도로 계산한 지금 표시할 프레임
+        """
+        elapsed = self.__clock.elapsed() / 1000 * self.__rate
+        if self.__frame_index is not None:
+            due = self.__frame_index.frame_at(
+                max(0.0, self.__frame_index.time_of(self.__anchor) + elapsed)
+            )
+        else:
+            due = self.__anchor + elapsed * self.__fps
+            due = math.floor(due) if self.__rate > 0 else math.ceil(due)
+        return max(0, min(due, self.__frame_count - 1))
+
+    def __tick(self) -> None:
+        """
+        표시할 시간이 된 프레임을 캐시에서 꺼내 표시
+        배속 재생은 표시할 시간의 프레임부터 현재 프레임 방향으로 간격 안에서 디코딩한 프레임을 찾고,
+        디코딩이 늦어진 경우 프레임을 유지한 뒤 그 시점부터 다시 시간을 계산 (실제 속도가 낮아짐)
+        """
+        forward = self.__rate > 0
+        if self.__index == (self.__frame_count - 1 if forward else 0):
+            self.finished.emit()
+            self.pause()
+            return
+        due = self.__due()
+        if (due - self.__index) * (1 if forward else -1) <= 0:
+            return
+        image = None
+        for index in range(due, self.__index, -1 if forward else 1)[: self.__step]:
+            image = self.__cache.get(self.__clip, index, spill=False)
+            if image is not None:
+                break
+        if image is None:
+            self.__anchor = self.__index
+            self.__clock.restart()
+            return
+        self.__index = index
+        self.__show(image)
+        self.__schedule()
+        self.positionChanged.emit(self.position())
+        measured = self.__meter.add(index)
+        if measured is not None:
+            self.rate_measured.emit(self.__rate, measured / self.__fps)
+
+    def __schedule(self) -> None:
+        """
+        재생 방향으로 두 구간 앞까지 디코딩을 요청
+        정방향은 CHUNK_SECONDS 동안 표시할 구간, 역방향은 현재 위치 이전의 키프레임부터의 GOP
+        """
+        forward = self.__rate > 0
+        if self.__frontier is None:
+            self.__frontier = self.__index if forward else self.__index + 1
+        span = max(1, round(self.__fps * self.CHUNK_SECONDS)) * self.__step
+        if forward:
+            while (
+                self.__frontier < self.__frame_count
+                and self.__frontier - self.__index < span * 2
+            ):
+                end = min(self.__frame_count, self.__frontier + span)
+                self.__submit(self.__frontier, end, self.__step)
+                self.__frontier = end
+        else:
+            while self.__frontier > 0 and self.__index - self.__frontier < span * 2:
+                end = self.__frontier
+                start = max(0, end - self.MAX_GOP_FRAMES)
+                if self.__frame_index is not None:
+                    start = max(start, self.__frame_index.keyframe_before(end - 1))
+                self.__submit(start, end, self.__step)
+                self.__frontier = start
+
+    def __submit(self, start: int, end: int, step: int) -> None:
+        with self.__lock:
+            self.__futures = [f for f in self.__futures if not f.done()]
+            self.__futures.append(
+                self.__executor.submit(
+                    self.__decode,
+                    (self.__path, self.__clip, self.__frame_index),
+                    start,
+                    end,
+                    step,
+                    self.__generation,
+                )
+            )
+
+    def __cancel(self) -> None:
+        """
+        대기 중인 디코딩 요청을 취소하고 실행 중인 ffmpeg를 종료
+        """
+        with self.__lock:
+            self.__generation += 1
+            for future in self.__futures:
+                future.cancel()
+            self.__futures.clear()
+            if self.__process is not None:
+                self.__process.kill()
+                self.__process = None
+        self.__frontier = None
+
+    def __decode(
+        self, media: tuple, start: int, end: int, step: int, generation: int
+    ) -> None:
+        """
+        :param media: 요청할 때의 (영상 경로, 클립 키, FrameIndex)
+        워커 스레드, start부터 end 이전까지 step 간격의 프레임을 디코딩하여 캐시에 저장
+        ffmpeg가 이전 키프레임부터 디코딩하여 start 이전의 프레임을 버리며,
+        select 필터로 간격에 해당하지 않는 프레임은 크기 변환, RGB 변환, 전송을 하지 않음
+        """
+        path, clip, frame_index = media
+        if generation != self.__generation:
+            return
+        wanted = [idx for idx in range(start, end) if idx % step == 0]
+        if not wanted or all(
+            self.__cache.get(clip, idx) is not None for idx in wanted
+        ):
+            for idx in wanted:
+                self.frame_loaded.emit(idx)
+            return
+        if frame_index is not None:
+            seek = frame_index.time_of(start)
+        else:
+            seek = start / self.__fps
+        stream = NP_Utils.NP_Utils.media_input(path, seek=seek)
+        if step > 1:
+            stream = stream.filter("select", f"not(mod(n+{start},{step}))")
+        if self.__scaled:
+            stream = stream.filter("scale", *self.__size)
+        width, height = self.__size
+        # 프레임을 복제, 삭제하지 않아 출력 프레임이 요청한 인덱스와 1:1로 대응
+        process = (
+            stream.output(
+                "pipe:",
+                format="rawvideo",
+                pix_fmt="rgb24",
+                vsync="passthrough",
+                **{"frames:v": len(wanted)},
+            )
+            .global_args("-loglevel", "error", "-nostdin")
+            .run_async(pipe_stdout=True)
+        )
+        with self.__lock:
+            if generation != self.__generation:
+                process.kill()
+                process.wait()
+                return
+            self.__process = process
+        try:
+            frame_size = width * height * 3
+            for idx in wanted:
+                data = process.stdout.read(frame_size)
+                if len(data) < frame_size or generation != self.__generation:
+                    break
+                image = QtGui.QImage(
+                    data, width, height, width * 3, QtGui.QImage.Format_RGB888
+                ).copy()
+                self.__cache.put(clip, idx, image)
+                self.frame_loaded.emit(idx)
+        finally:
+            process.stdout.close()
+            process.kill()
+            process.wait()
+            with self.__lock:
+                if self.__process is process:
+                    self.__process = None
+
+    @QtCore.Slot(int)
+    def __slot_frame_loaded(self, index: int) -> None:
+        """
+        탐색, 일시정지 상태에서 기다리던 프레임의 디코딩이 끝나면 표시
+        """
+        if index != self.__index or self.__shown == index or self.__clip is None:
+            return
+        image = self.__cache.get(self.__clip, index, spill=False)
+        if image is not None:
+            self.__show(image)
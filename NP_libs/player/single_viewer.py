@@ -3,60 +3,47 @@
 
 # author        :   Juno Park
 # created date  :   2024.03.03
-# modified date :   2024.03.23
+# modified date :   2026.10.18
 # description   :   Nuke_player에 삽입되는 Single_viewer 클래스
 
 
 import os.path
 import sys
 import importlib
+from concurrent import futures
+
+import ffmpeg
 
 # sys.path.append("/home/rapa/libs_nuke")
-import time
 from PySide2 import QtWidgets, QtCore, QtGui, QtMultimediaWidgets, QtMultimedia
 
 sys.path.append("/home/rapa/workspace/python/Nuke_player")
 from NP_libs.qt import library as qt_lib
 from NP_libs import NP_Utils
+from NP_libs.player import sequence_player
+from NP_libs.player import flipbook
+from NP_libs.player import shuttle
+from NP_libs.player import clock as clock_lib
+from NP_libs.system import sequence as sequence_lib
 
 importlib.reload(qt_lib)
 importlib.reload(NP_Utils)
-
-
-class Thread_Updater(QtCore.QThread):
-    # 슬라이더 업데이트를 위한 스레드
-    pos_updated = QtCore.Signal(int)
-    dur_updated = QtCore.Signal(int)
-
-    def __init__(self, player: QtMultimedia.QMediaPlayer, widget):
-        super().__init__()
-        self.player = player
-        self.widget = widget
-        self.running = True
-        self.mutex = QtCore.QMutex()
-
-    def run(self):
-        pos = 0
-        dur = 0
-        while self.running:
-            self.mutex.lock()
-            if self.player.state() == QtMultimedia.QMediaPlayer.PlayingState:
-                pos = self.player.position()
-                dur = self.player.duration()
-            self.mutex.unlock()
-            self.pos_updated.emit(pos)
-            self.dur_updated.emit(dur)
-            time.sleep(0.01)
-
-    def stop(self):
-        if self.running:
-            self.running = False
-            self.quit()
-            self.wait(10000)
-            print("\033[31m스레드 정상 종료\033[0m")
+importlib.reload(sequence_player)
+importlib.reload(flipbook)
+importlib.reload(shuttle)
+importlib.reload(clock_lib)
 
 
 class VideoWidget(QtWidgets.QWidget):
+    # 플립북이 디코딩한 프레임을 저장할 메모리의 최대 용량
+    FLIPBOOK_CACHE_BYTES = 2 * 1024**3
+    # 이전, 다음 항목을 미리 열 때 디코딩해 둘 프레임 수
+    PRELOAD_FRAMES = 24
+    # 셔틀(역재생, 배속) 재생 시 디코딩할 최대 너비, 공용 프레임 캐시에 저장되므로 크기를 제한
+    SHUTTLE_DECODE_WIDTH = 1920
+    # 워커 스레드에서 영상 정보를 미리 읽은 뒤 발생 (플레이리스트 인덱스, 경로)
+    info_prefetched = QtCore.Signal(int, str)
+
     def __init__(self, playlist: list[str] = None, parent=None):
         super().__init__(parent)
         # 경로 지정
@@ -73,6 +60,17 @@ class VideoWidget(QtWidgets.QWidget):
             self.path_lst = playlist
         self.__dp_idx = 1
         self.__NP_Util = NP_Utils.NP_Utils
+        self.__last_time = None  # -> 마지막으로 표시한 (포지션, 길이, 표시 형식)
+        # 이전, 다음 항목의 영상 정보를 읽고 첫 프레임을 디코딩해 두어 항목 전환 시 멈춤을 없앰
+        self.__prefetch_pool = futures.ThreadPoolExecutor(max_workers=2)
+        self.__preloaded = dict()  # -> {플레이리스트 인덱스: 미리 열어둔 FlipbookPlayer}
+        self.__transition_clock = QtCore.QElapsedTimer()
+        self.__transition_pending = False
+        self.__transition_ms = None  # -> 마지막 항목 전환에 걸린 시간(ms)
+        # {영상 경로: FrameIndex}, 정확한 프레임 번호와 프레임 단위 이동에 사용
+        self.__frame_indexes = dict()
+        self.__rate = 1.0  # -> JKL 셔틀의 재생 속도, 음수이면 역재생
+        self.__shuttle_active = False  # -> 영상을 셔틀 플레이어로 재생 중인지 여부
 
         # Set UI
         self.setWindowTitle("Single Viewer")
@@ -87,12 +85,11 @@ class VideoWidget(QtWidgets.QWidget):
         self.__init_ui()
         self.__connections()
         self.current_fps = self.__get_current_video_fps()
+        self.__prefetch_neighbors()
 
-        # Set Thread
-        self.__slider_updater = Thread_Updater(self.__player, self)
-        self.__slider_updater.pos_updated.connect(self.__update_slider_position)
-        self.__slider_updater.dur_updated.connect(self.__slot_label_info)
-        self.__slider_updater.start()
+        # 슬라이더와 시간 표시는 공용 타이머가 재생 중일 때만 갱신
+        self.__clock = clock_lib.SingletonPlaybackClock()
+        self.__clock.register(self)
 
     def __get_playlist(self):
         """
@@ -130,10 +127,25 @@ class VideoWidget(QtWidgets.QWidget):
         self.__add_play_lst(self.path_lst)
         self.__player.setPlaylist(self.__play_lst)
 
+        # 이미지 시퀀스는 변환하지 않고 디스크에서 바로 읽어 재생
+        self.__seq_player = sequence_player.SequencePlayer(parent=self)
+        # 영상을 한 번만 디코딩하여 메모리에서 재생 (NumPy가 없으면 QMediaPlayer로 재생)
+        self.__flipbook = self.__new_flipbook()
+        # 영상의 역재생, 배속, 슬로우 모션 (시퀀스는 SequencePlayer가 직접 처리)
+        self.__shuttle = shuttle.ShuttlePlayer(
+            decode_width=self.SHUTTLE_DECODE_WIDTH, parent=self
+        )
+
         # 위젯 설정
         v_widget = QtMultimediaWidgets.QVideoWidget()
-        v_widget.setMinimumSize(800, 450)
         v_widget.setStyleSheet("background-color: rgb(0, 0, 0);")
+        self.__frame_view = sequence_player.FrameView()
+        # 현재 항목이 영상이면 v_widget, 시퀀스면 frame_view를 표시
+        self.__stack = QtWidgets.QStackedWidget()
+        self.__stack.setMinimumSize(800, 450)
+        self.__stack.addWidget(v_widget)
+        self.__stack.addWidget(self.__frame_view)
+        self.__v_widget = v_widget
 
         # fonts
         font = QtGui.QFont("Sans Serif", 8)
@@ -149,10 +161,13 @@ class VideoWidget(QtWidgets.QWidget):
         self.__btn_prev = QtWidgets.QPushButton()
         self.__btn_loop = QtWidgets.QPushButton()
         self.__btn_mode = QtWidgets.QPushButton("time")
+        self.__btn_flipbook = QtWidgets.QPushButton("RAM")
         self.__btn_fullscreen = QtWidgets.QPushButton()
         self.__btn_mode.setFont(font)
+        self.__btn_flipbook.setFont(font)
         self.__btn_loop.setFixedSize(35, 25)
         self.__btn_mode.setFixedSize(35, 25)
+        self.__btn_flipbook.setFixedSize(35, 25)
         self.__btn_fullscreen.setFixedSize(25, 25)
         self.__btn_open.setFocusPolicy(QtCore.Qt.NoFocus)
         self.__btn_play.setFocusPolicy(QtCore.Qt.NoFocus)
@@ -161,6 +176,7 @@ class VideoWidget(QtWidgets.QWidget):
         self.__btn_stop.setFocusPolicy(QtCore.Qt.NoFocus)
         self.__btn_loop.setFocusPolicy(QtCore.Qt.NoFocus)
         self.__btn_mode.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.__btn_flipbook.setFocusPolicy(QtCore.Qt.NoFocus)
         self.__btn_fullscreen.setFocusPolicy(QtCore.Qt.NoFocus)
         self.__btn_open.setIcon(
             self.style().standardIcon(QtWidgets.QStyle.SP_DirOpenIcon)
@@ -188,6 +204,11 @@ class VideoWidget(QtWidgets.QWidget):
 
         self.__btn_loop.setCheckable(True)
         self.__btn_loop.setChecked(False)
+        self.__btn_flipbook.setCheckable(True)
+        # 플립북은 오디오가 없고 영상마다 메모리를 많이 사용하므로 필요할 때만 켜서 사용
+        self.__btn_flipbook.setChecked(False)
+        self.__btn_flipbook.setEnabled(flipbook.FlipbookPlayer.available())
+        self.__btn_flipbook.setToolTip("Play From RAM (Flipbook)")
 
         # slider
         self.__slider = QtWidgets.QSlider(QtCore.Qt.Horizontal)
@@ -212,6 +233,12 @@ class VideoWidget(QtWidgets.QWidget):
         )
         self.__label_dp_idx = QtWidgets.QLabel(f"1 / {len(self.path_lst)}")
         self.__label_dp_idx.setFont(font2)
+        self.__label_transition = QtWidgets.QLabel()
+        self.__label_transition.setFont(font)
+        self.__label_transition.setToolTip("Clip Transition Time")
+        self.__label_rate = QtWidgets.QLabel()
+        self.__label_rate.setFont(font)
+        self.__label_rate.setToolTip("Shuttle Rate: Target (Actual)")
 
         # frame
         self.__overlay_frame = QtWidgets.QFrame()
@@ -232,24 +259,31 @@ class VideoWidget(QtWidgets.QWidget):
         hbox.addWidget(self.__label_remain_time)
         hbox.addWidget(self.__btn_loop)
         hbox.addWidget(self.__btn_mode)
+        hbox.addWidget(self.__btn_flipbook)
         hbox.addWidget(self.__btn_fullscreen)
         hbox_2 = QtWidgets.QHBoxLayout()
         hbox_2.addWidget(self.__label_filename)
         hbox_2.addItem(self.h_spacer)
+        hbox_2.addWidget(self.__label_rate)
+        hbox_2.addWidget(self.__label_transition)
         hbox_2.addWidget(self.__label_dp_idx)
 
         vbox = QtWidgets.QVBoxLayout()
         vbox.addLayout(hbox_2)
-        vbox.addWidget(v_widget)
+        vbox.addWidget(self.__stack)
         vbox.addLayout(hbox)
         vbox.addWidget(self.__overlay_frame)
 
         self.__player.setVideoOutput(v_widget)
+        self.__seq_player.setVideoOutput(self.__frame_view)
+        self.__flipbook.setVideoOutput(self.__frame_view)
+        self.__shuttle.setVideoOutput(self.__frame_view)
         self.__overlay_frame.raise_()
 
         self.setLayout(vbox)
 
         self.__update_file_path_label()
+        self.__switch_player()
 
     def __connections(self) -> None:
         """
@@ -262,31 +296,51 @@ class VideoWidget(QtWidgets.QWidget):
         self.__btn_prev.clicked.connect(self.__slot_prev_video)
         self.__btn_mode.clicked.connect(self.__slot_dp_mode)
         self.__btn_fullscreen.clicked.connect(self.__slot_fullscreen)
-
-        # player
-        self.__player.stateChanged.connect(self.__slot_state_changed)
-        self.__player.positionChanged.connect(self.__slot_pos_changed)
-        self.__player.durationChanged.connect(self.__slot_duration_changed)
+        self.__btn_flipbook.toggled.connect(self.__slot_flipbook_toggled)
+
+        # player (플립북은 생성할 때 연결)
+        for player in [self.__player, self.__seq_player, self.__shuttle]:
+            player.stateChanged.connect(self.__slot_state_changed)
+            player.positionChanged.connect(self.__slot_pos_changed)
+            player.durationChanged.connect(self.__slot_duration_changed)
+        for player in [self.__seq_player, self.__shuttle]:
+            player.rate_measured.connect(self.__slot_rate_measured)
+        self.__player.mediaStatusChanged.connect(self.__slot_media_status_changed)
+        self.__seq_player.frame_changed.connect(self.__slot_frame_shown)
+        self.info_prefetched.connect(self.__slot_info_prefetched)
 
         # slider
         self.__slider.sliderMoved.connect(self.__slot_slider_moved)
 
         # playlist
         self.__play_lst.currentIndexChanged.connect(self.__update_file_path_label)
+        self.__play_lst.currentIndexChanged.connect(self.__switch_player)
+        self.__play_lst.currentIndexChanged.connect(self.__prefetch_neighbors)
 
     def keyPressEvent(self, event: QtGui.QKeyEvent) -> None:
         """
         :param event: 키보드 입력 이벤트
         :return: 키보드 입력에 따른 이벤트 처리
         """
-        if event.key() in [QtCore.Qt.Key_Space, QtCore.Qt.Key_Up, QtCore.Qt.Key_K]:
+        slow = bool(event.modifiers() & QtCore.Qt.ShiftModifier)
+        if event.key() in [QtCore.Qt.Key_Space, QtCore.Qt.Key_Up]:
             self.__slot_play_video()
-        elif event.key() in [QtCore.Qt.Key_Right, QtCore.Qt.Key_L]:
+        elif event.key() == QtCore.Qt.Key_K:
+            self.__end_shuttle(play=False)
+        elif event.key() == QtCore.Qt.Key_L:
+            self.__slot_shuttle(1, slow)
+        elif event.key() == QtCore.Qt.Key_J:
+            self.__slot_shuttle(-1, slow)
+        elif event.key() == QtCore.Qt.Key_Right:
             self.__slot_next_video()
-        elif event.key() in [QtCore.Qt.Key_Left, QtCore.Qt.Key_J]:
+        elif event.key() == QtCore.Qt.Key_Left:
             self.__slot_prev_video()
         elif event.key() in [QtCore.Qt.Key_Down, QtCore.Qt.Key_Q]:
             self.__slot_stop_video()
+        elif event.key() == QtCore.Qt.Key_Comma:
+            self.__slot_step_frame(-1)
+        elif event.key() == QtCore.Qt.Key_Period:
+            self.__slot_step_frame(1)
         elif event.key() == QtCore.Qt.Key_R:
             self.__btn_loop.click()
         elif event.key() == QtCore.Qt.Key_V:
@@ -341,31 +395,318 @@ class VideoWidget(QtWidgets.QWidget):
 
     def closeEvent(self, event):
         """
-        UI 종료 시 플레이어를 정지하고 슬라이더 업데이트 스레드를 종료
+        UI 종료 시 플레이어를 정지하고 공용 타이머에서 등록 해제
         """
-        if self.__player.state() in [
-            QtMultimedia.QMediaPlayer.PlayingState,
-            QtMultimedia.QMediaPlayer.PausedState,
-            QtMultimedia.QMediaPlayer.StoppedState,
-        ]:
-            self.__player.stop()
-            self.__slider_updater.stop()
-            self.__slider_updater.wait()
+        self.__player.stop()
+        self.__clock.unregister(self)
+        self.__seq_player.release()
+        self.__flipbook.release()
+        self.__shuttle.release()
+        for preloaded in self.__preloaded.values():
+            preloaded.release()
+        self.__preloaded.clear()
+        self.__prefetch_pool.shutdown(wait=False)
         event.accept()
 
+    def clock_tick(self) -> bool:
+        """
+        공용 타이머가 호출, 재생 중인 경우에만 슬라이더와 시간 표시를 갱신
+        :return: 재생 중이면 True (재생 중인 뷰어가 없으면 공용 타이머가 멈춤)
+        """
+        if self.__current_player().state() != QtMultimedia.QMediaPlayer.PlayingState:
+            return False
+        self.__refresh_time()
+        return True
+
+    def __refresh_time(self) -> None:
+        """
+        포지션, 길이, 표시 형식 중 바뀐 값이 있을 때만 슬라이더와 시간 표시를 갱신
+        """
+        player = self.__current_player()
+        current = (player.position(), player.duration(), self.__btn_mode.text())
+        if current == self.__last_time:
+            return
+        self.__last_time = current
+        self.__slider.setValue(current[0])
+        self.__slot_label_info()
+
+    def __current_player(self):
+        """
+        :return: 영상을 셔틀로 재생 중이면 ShuttlePlayer, 그 외에는 현재 항목의 플레이어
+        """
+        if self.__shuttle_active:
+            return self.__shuttle
+        return self.__base_player()
+
+    def __base_player(self):
+        """
+        :return: 플레이리스트의 현재 항목이 시퀀스이면 SequencePlayer,
+        영상이면 플립북 사용 여부에 따라 FlipbookPlayer 혹은 QMediaPlayer
+        """
+        if self.path_lst and sequence_lib.is_pattern(
+            self.path_lst[max(0, self.__play_lst.currentIndex())]
+        ):
+            return self.__seq_player
+        if self.__btn_flipbook.isChecked():
+            return self.__flipbook
+        return self.__player
+
+    def __switch_player(self) -> None:
+        """
+        현재 항목에 맞는 플레이어와 화면으로 전환하고, 재생 중이었다면 이어서 재생
+        """
+        self.__reset_shuttle()
+        idx = max(0, self.__play_lst.currentIndex())
+        playing = any(
+            p.state() == QtMultimedia.QMediaPlayer.PlayingState
+            for p in [self.__player, self.__seq_player, self.__flipbook]
+        )
+        player = self.__current_player()
+        # 미리 열어둔 플립북이 있으면 교체하여 정보 읽기와 첫 프레임 디코딩을 생략
+        preloaded = None
+        if player is self.__flipbook:
+            preloaded = self.__preloaded.pop(idx, None)
+        if preloaded is not None:
+            self.__flipbook.setVideoOutput(None)
+            self.__flipbook.release()
+            self.__flipbook.deleteLater()
+            self.__flipbook = player = preloaded
+            self.__flipbook.setVideoOutput(self.__frame_view)
+        others = [
+            p
+            for p in [self.__player, self.__seq_player, self.__flipbook]
+            if p is not player
+        ]
+        for p in others:
+            p.stop()
+        # 플립북이 사용하던 메모리는 다른 플레이어로 전환하면 바로 해제
+        if player is not self.__flipbook:
+            self.__flipbook.clear()
+        if player is self.__player:
+            self.__stack.setCurrentWidget(self.__v_widget)
+        else:
+            if preloaded is not None:
+                player.setPosition(0)
+            else:
+                player.setMedia(self.path_lst[idx])
+            self.__stack.setCurrentWidget(self.__frame_view)
+        self.__slider.setRange(0, player.duration())
+        if playing:
+            player.play()
+
+    def __slot_shuttle(self, direction: int, slow: bool = False) -> None:
+        """
+        :param direction: 1이면 L(정방향), -1이면 J(역방향)
+        :param slow: Shift를 누른 경우 슬로우 모션
+        같은 방향을 반복해서 누르면 1, 2, 4배(슬로우 모션은 0.5, 0.25배)로 빨라지고,
+        정지 상태이거나 반대 방향을 누르면 해당 방향의 1배(0.5배)부터 시작
+        """
+        state = self.__current_player().state()
+        rate = self.__rate if state == QtMultimedia.QMediaPlayer.PlayingState else 0.0
+        if slow:
+            speed = 0.25 if rate == direction * 0.5 else 0.5
+        elif rate * direction >= 1:
+            speed = min(abs(rate) * 2, shuttle.ShuttlePlayer.MAX_RATE)
+        else:
+            speed = 1.0
+        self.__set_rate(direction * speed)
+
+    def __set_rate(self, rate: float) -> None:
+        """
+        :param rate: 재생 속도, 음수이면 역재생
+        시퀀스는 SequencePlayer의 속도를 바꾸고,
+        영상은 1배 정방향이 아니면 현재 위치부터 셔틀 플레이어로 전환하여 재생
+        """
+        if rate == 1.0:
+            self.__end_shuttle(play=True)
+            return
+        base = self.__base_player()
+        self.__rate = rate
+        self.__label_rate.setStyleSheet("")
+        self.__label_rate.setText(f"{rate:g}x")
+        if base is self.__seq_player:
+            base.setPlaybackRate(rate)
+            base.play()
+            return
+        if not self.__shuttle_active:
+            pos = base.position()
+            base.pause()
+            path = self.path_lst[max(0, self.__play_lst.currentIndex())]
+            if self.__shuttle.path != path and not self.__shuttle.setMedia(path):
+                self.__rate = 1.0
+                self.__label_rate.clear()
+                return
+            self.__shuttle_active = True
+            self.__stack.setCurrentWidget(self.__frame_view)
+            self.__shuttle.setPosition(pos)
+        self.__shuttle.setPlaybackRate(rate)
+        self.__shuttle.play()
+
+    def __end_shuttle(self, play: bool) -> None:
+        """
+        :param play: True이면 1배로 이어서 재생, False이면 일시정지
+        셔틀 재생을 끝내고 셔틀의 현재 위치부터 현재 항목의 플레이어로 되돌림
+        """
+        base = self.__base_player()
+        if self.__shuttle_active:
+            pos = self.__shuttle.position()
+            self.__shuttle_active = False
+            self.__shuttle.pause()
+            base.setPosition(pos)
+            if base is self.__player:
+                self.__stack.setCurrentWidget(self.__v_widget)
+        self.__reset_shuttle()
+        if play:
+            base.play()
+        else:
+            base.pause()
+
+    def __reset_shuttle(self) -> None:
+        """
+        재생 속도를 1배로 되돌리고 셔틀 플레이어를 닫음 (항목 전환 시)
+        """
+        if self.__shuttle_active:
+            self.__shuttle_active = False
+            self.__shuttle.clear()
+        self.__seq_player.setPlaybackRate(1.0)
+        self.__rate = 1.0
+        self.__label_rate.clear()
+
+    def __slot_rate_measured(self, target: float, actual: float) -> None:
+        """
+        :param target: 목표 재생 속도
+        :param actual: 실제로 표시한 프레임으로 계산한 재생 속도
+        디코딩이 목표 속도를 따라가지 못하면 붉은색으로 표시
+        """
+        if not self.__is_current_sender() or self.__rate == 1.0:
+            return
+        late = abs(actual - target) > abs(target) * 0.1
+        self.__label_rate.setStyleSheet("color: rgb(255, 90, 90);" if late else "")
+        self.__label_rate.setText(f"{target:g}x ({actual:.2f}x)")
+
+    def __new_flipbook(self) -> flipbook.FlipbookPlayer:
+        """
+        :return: 시그널을 연결한 FlipbookPlayer, 화면 출력은 현재 항목의 플립북만 연결
+        """
+        player = flipbook.FlipbookPlayer(
+            cache_bytes=self.FLIPBOOK_CACHE_BYTES, parent=self
+        )
+        player.stateChanged.connect(self.__slot_state_changed)
+        player.positionChanged.connect(self.__slot_pos_changed)
+        player.durationChanged.connect(self.__slot_duration_changed)
+        player.frame_changed.connect(self.__slot_frame_shown)
+        player.finished.connect(self.__slot_flipbook_finished)
+        return player
+
+    @property
+    def transition_ms(self) -> float or None:
+        """
+        :return: 마지막 항목 전환에서 버튼을 누른 뒤 새 항목의 첫 프레임이 나오기까지 걸린 시간(ms)
+        """
+        return self.__transition_ms
+
+    def __begin_transition(self) -> None:
+        self.__transition_clock.restart()
+        self.__transition_pending = True
+
+    def __end_transition(self) -> None:
+        """
+        새 항목의 첫 프레임이 표시되면 전환 시간을 기록하고 UI에 표시
+        """
+        if not self.__transition_pending:
+            return
+        self.__transition_pending = False
+        self.__transition_ms = self.__transition_clock.nsecsElapsed() / 1e6
+        self.__label_transition.setText(f"{self.__transition_ms:.1f} ms")
+
+    def __prefetch_neighbors(self) -> None:
+        """
+        현재, 이전, 다음 항목의 영상 정보와 프레임 인덱스를 워커 스레드에서 읽고,
+        플립북 재생 중이면 이전, 다음 항목의 플립북을 미리 열어 첫 프레임을 디코딩
+        """
+        idx = max(0, self.__play_lst.currentIndex())
+        wanted = {i for i in (idx - 1, idx + 1) if 0 <= i < len(self.path_lst)}
+        use_flipbook = self.__btn_flipbook.isChecked()
+        for i in list(self.__preloaded):
+            if i not in wanted or not use_flipbook:
+                self.__preloaded.pop(i).release()
+        for i in sorted(wanted | {idx}, key=lambda i: i != idx):
+            if i not in self.__preloaded or self.path_lst[i] not in self.__frame_indexes:
+                self.__prefetch_pool.submit(self.__prefetch_info, i, self.path_lst[i])
+
+    def __prefetch_info(self, idx: int, file_path: str) -> None:
+        """
+        워커 스레드, 영상 정보를 캐시에 저장하여 항목 전환 시 ffprobe를 실행하지 않도록 함
+        프레임 인덱스는 ingest에서 만들어지지 않은 경우 정보를 전달한 뒤에 만듦
+        """
+        try:
+            self.__NP_Util.get_media_info(file_path)
+        except (OSError, StopIteration, ffmpeg.Error) as err:
+            print(f"\033[31mERROR: 영상 정보를 미리 읽을 수 없음 >> {file_path}: {err}\033[0m")
+            return
+        self.info_prefetched.emit(idx, file_path)
+        if file_path in self.__frame_indexes:
+            return
+        try:
+            index = self.__NP_Util.get_frame_index(file_path)
+        except (OSError, ffmpeg.Error) as err:
+            print(f"\033[31mERROR: 프레임 인덱스를 만들 수 없음 >> {file_path}: {err}\033[0m")
+            return
+        if index is not None and index.frame_count:
+            self.__frame_indexes[file_path] = index
+
+    def __slot_info_prefetched(self, idx: int, file_path: str) -> None:
+        """
+        :param idx: 정보를 읽은 항목의 플레이리스트 인덱스
+        :param file_path: 정보를 읽은 항목의 경로
+        현재 항목이면 기본값 대신 읽은 fps를 사용하고,
+        여전히 이웃한 항목이고 플립북 재생 중이면 플립북을 미리 열어둠
+        """
+        current = max(0, self.__play_lst.currentIndex())
+        if idx == current and self.path_lst[idx] == file_path:
+            self.current_fps = self.__get_current_video_fps()
+            self.__slot_label_info()
+            return
+        if (
+            abs(idx - current) != 1
+            or idx in self.__preloaded
+            or not self.__btn_flipbook.isChecked()
+            or sequence_lib.is_pattern(file_path)
+            or self.path_lst[idx] != file_path
+        ):
+            return
+        player = self.__new_flipbook()
+        if player.setMedia(file_path, preload=self.PRELOAD_FRAMES):
+            self.__preloaded[idx] = player
+        else:
+            player.deleteLater()
+
+    def __is_current_sender(self) -> bool:
+        """
+        :return: 시그널을 보낸 플레이어가 현재 항목의 플레이어이면 True
+        시퀀스 항목에서 빈 미디어를 가진 QMediaPlayer가 보내는 시그널을 무시하기 위해 사용
+        """
+        sender = self.sender()
+        return sender is None or sender is self.__current_player()
+
     def __get_current_video_fps(self) -> float:
         """
         :return: 현재 재생 중인 영상의 프레임 정보를 소수점 아래 3자리까지 반환
+        QMediaPlayer로 재생하는 영상은 미리 읽은 정보만 사용하고 (GUI 스레드에서 ffprobe를 실행하지 않음),
+        아직 읽지 못했으면 기본값을 반환한 뒤 미리 읽기가 끝나면 갱신 (__slot_info_prefetched)
         """
+        if self.__current_player() is not self.__player:
+            return self.__current_player().fps
         current_media = self.__player.currentMedia()
         # 재생 중인 미디어가 있는지 확인
         if current_media.isNull():
             print("\033[31mERROR: 현재 미디어가 없음\033[0m")
             return 0
-        else:
-            current_url = current_media.canonicalUrl().toLocalFile()
-            fps = round(self.__NP_Util.get_video_fps(current_url), 3)
-            return fps
+        current_url = current_media.canonicalUrl().toLocalFile()
+        info = self.__NP_Util.get_cached_media_info(current_url)
+        if info is None or not info.fps:
+            return sequence_lib.DEFAULT_FPS
+        return round(info.fps, 3)
 
     def __add_play_lst(self, playlist: list[str]) -> None:
         """
@@ -373,6 +714,13 @@ class VideoWidget(QtWidgets.QWidget):
         리스트로 받은 파일 경로가 로컬에 존재하는 파일인지 확인하여 플레이리스트에 추가
         """
         for f_path in playlist:
+            # 시퀀스는 SequencePlayer가 재생하므로 인덱스를 맞추기 위한 빈 미디어를 추가
+            if sequence_lib.is_pattern(f_path):
+                if sequence_lib.find_sequence(f_path) is None:
+                    print(f"\033[31mERROR: {f_path}가 존재하지 않음\033[0m")
+                    return
+                self.__play_lst.addMedia(QtMultimedia.QMediaContent())
+                continue
             # 파일이 존재하는지 검증
             if not os.path.exists(f_path):
                 print(f"\033[31mERROR: {f_path}가 존재하지 않음\033[0m")
@@ -387,14 +735,6 @@ class VideoWidget(QtWidgets.QWidget):
             self.__play_lst.addMedia(QtMultimedia.QMediaContent(url))
         print(f"\033[32m플레이 리스트: {playlist}\033[0m")
 
-    @QtCore.Slot(int)
-    def __update_slider_position(self, position: int) -> None:
-        """
-        :param position: 플레이어의 현재 포지션
-        플레이어가 재생 중일 때 슬라이더의 값을 업데이트
-        """
-        self.__slider.setValue(position)
-
     def __update_file_path_label(self) -> None:
         """
         현재 재생 중인 파일의 경로를 UI에 업데이트
@@ -419,6 +759,7 @@ class VideoWidget(QtWidgets.QWidget):
             self.__btn_mode.setText("time")
         else:
             self.__btn_mode.setText("fps")
+        self.__refresh_time()
 
     def __slot_next_video(self) -> None:
         """
@@ -429,66 +770,124 @@ class VideoWidget(QtWidgets.QWidget):
         if not self.__play_lst.currentIndex() < len(self.path_lst) - 1:
             print("\033[31mERROR: 재생 목록의 마지막 영상입니다.\033[0m")
             return
+        self.__begin_transition()
         self.__play_lst.setCurrentIndex(current_idx + 1)
         self.current_fps = self.__get_current_video_fps()
         self.__dp_idx += 1
         self.__label_dp_idx.setText(f"{self.__dp_idx} / {len(self.path_lst)}")
-        self.__player.setPosition(0)
+        self.__current_player().setPosition(0)
 
     def __slot_prev_video(self) -> None:
         """
         플레이리스트의 이전 영상을 재생
         """
+        if self.__rate != 1.0:
+            self.__end_shuttle(play=False)
         current_idx = self.__play_lst.currentIndex()
-        current_pos: int = self.__player.position()
+        player = self.__current_player()
+        current_pos: int = player.position()
         current_time: QtCore.QTime = QtCore.QTime(0, 0).addMSecs(current_pos)
         # 현재 영상이 플레이 리스트의 첫 번째인 경우 에러 발생
         if not self.__play_lst.currentIndex() > 0:
             # 현재 재생 시점이 일정 시간이 지난 경우 현재 영상을 처음부터 재생
             if 0 < current_time.second():
-                self.__player.stop()
-                self.__player.play()
+                player.stop()
+                player.play()
             else:
                 print("\033[31mERROR: 재생 목록의 첫 번째 영상입니다.\033[0m")
-                self.__player.setPosition(0)
-                self.__player.pause()
+                player.setPosition(0)
+                player.pause()
                 self.__slider.setValue(0)
         else:
             # 현재 재생 시점이 일정 시간이 지난 경우 현재 영상을 처음부터 재생
             if 0 < current_time.second():
-                self.__player.stop()
-                self.__player.play()
+                player.stop()
+                player.play()
                 return
             else:
                 # 플레이리스트의 이전 영상을 재생하고 UI 업데이트
+                self.__begin_transition()
                 self.__play_lst.setCurrentIndex(current_idx - 1)
                 self.current_fps = self.__get_current_video_fps()
                 self.__dp_idx -= 1
                 self.__label_dp_idx.setText(f"{self.__dp_idx} / {len(self.path_lst)}")
 
+    def __slot_flipbook_toggled(self) -> None:
+        """
+        플립북 버튼을 누르면 현재 위치를 유지한 채 플립북과 QMediaPlayer를 전환
+        """
+        pos = self.__current_player().position()
+        self.__switch_player()
+        self.__prefetch_neighbors()
+        self.current_fps = self.__get_current_video_fps()
+        self.__current_player().setPosition(pos)
+
+    def __slot_step_frame(self, frames: int) -> None:
+        """
+        :param frames: 이동할 프레임 수, 음수이면 이전 프레임
+        플립북, 시퀀스는 프레임 인덱스로 바로 이동하고,
+        QMediaPlayer는 프레임 인덱스가 있으면 해당 프레임의 표시 시간으로 이동 (없으면 fps로 계산)
+        """
+        if self.__rate != 1.0:
+            self.__end_shuttle(play=False)
+        player = self.__current_player()
+        if player is not self.__player:
+            player.step(frames)
+            return
+        if player.state() == QtMultimedia.QMediaPlayer.PlayingState:
+            player.pause()
+        index = self.__current_frame_index()
+        if index is not None:
+            player.setPosition(index.step_position(player.position(), frames))
+        elif self.current_fps:
+            pos = player.position() + round(frames * 1000 / self.current_fps)
+            player.setPosition(max(0, min(pos, player.duration())))
+
+    def __current_frame_index(self):
+        """
+        :return: QMediaPlayer로 재생 중인 현재 항목의 FrameIndex, 없으면 None
+        """
+        if not self.path_lst:
+            return None
+        return self.__frame_indexes.get(
+            self.path_lst[max(0, self.__play_lst.currentIndex())]
+        )
+
     def __slot_stop_video(self) -> None:
         """
         stop 버튼이 클릭된 경우 player의 포지션을 0으로 만들고 정지
         """
-        self.__player.setPosition(0)
-        self.__player.stop()
+        if self.__rate != 1.0:
+            self.__end_shuttle(play=False)
+        player = self.__current_player()
+        player.setPosition(0)
+        player.stop()
 
     def __slot_play_video(self) -> None:
         """
         play버튼을 클릭한 경우 player가 재생 중이면 일시정지, 그렇지 않으면 재생
+        셔틀 재생 중이면 셔틀을 끝내고 현재 위치에서 일시정지 (정지 상태였다면 1배로 재생)
         """
-        if self.__player.state() == QtMultimedia.QMediaPlayer.PlayingState:
-            self.__player.pause()
+        player = self.__current_player()
+        if self.__rate != 1.0:
+            playing = player.state() == QtMultimedia.QMediaPlayer.PlayingState
+            self.__end_shuttle(play=not playing)
+            return
+        if player.state() == QtMultimedia.QMediaPlayer.PlayingState:
+            player.pause()
         else:
-            self.__player.play()
+            player.play()
 
     def __slot_state_changed(self, ste) -> None:
         """
         :param ste: 현재 플레이어의 상태 (재생 or 일시정지 or 정지)
         :return:
         """
+        if not self.__is_current_sender():
+            return
         # 재생 중에는 play 아이콘을 pause아이콘으로 변경
         if ste == QtMultimedia.QMediaPlayer.PlayingState:
+            self.__clock.wake()
             self.__btn_play.setIcon(
                 self.style().standardIcon(QtWidgets.QStyle.SP_MediaPause)
             )
@@ -500,32 +899,67 @@ class VideoWidget(QtWidgets.QWidget):
         # 영상이 정지되었을 때 loop 버튼이 체크 상태라면 영상을 처음부터 다시 재생
         if ste == QtMultimedia.QMediaPlayer.StoppedState:
             if self.__btn_loop.isChecked():
-                self.__player.setPosition(0)
-                self.__player.play()
+                self.__current_player().setPosition(0)
+                self.__current_player().play()
                 self.__btn_play.setIcon(
                     self.style().standardIcon(QtWidgets.QStyle.SP_MediaPause)
                 )
 
+    def __slot_frame_shown(self) -> None:
+        """
+        시퀀스, 플립북의 프레임이 표시되면 항목 전환 시간 측정을 종료
+        """
+        if self.__is_current_sender():
+            self.__end_transition()
+
+    def __slot_media_status_changed(self, status) -> None:
+        """
+        :param status: QMediaPlayer의 미디어 상태
+        QMediaPlayer가 새 항목을 읽어 첫 프레임을 표시할 수 있게 되면 항목 전환 시간 측정을 종료
+        """
+        if not self.__is_current_sender():
+            return
+        if status in [
+            QtMultimedia.QMediaPlayer.LoadedMedia,
+            QtMultimedia.QMediaPlayer.BufferedMedia,
+        ]:
+            self.__end_transition()
+
+    def __slot_flipbook_finished(self) -> None:
+        """
+        플립북이 마지막 프레임에 도달하면 반복 재생이 아닌 경우 다음 항목으로 끊김 없이 이어서 재생
+        """
+        if not self.__is_current_sender() or self.__btn_loop.isChecked():
+            return
+        if self.__play_lst.currentIndex() < len(self.path_lst) - 1:
+            self.__slot_next_video()
+
     def __slot_pos_changed(self, pos) -> None:
         """
         :param pos: player의 position값
         현재 영상의 재생 구간이 바뀔 경우 slider도 그에 맞게 업데이트
         """
+        if not self.__is_current_sender():
+            return
         self.__slider.setValue(pos)
+        self.__refresh_time()
 
     def __slot_duration_changed(self, duration) -> None:
         """
         :param duration: 영상의 길이
         현재 재생 중인 영상이 바뀔 경우 slider의 범위를 재설정
         """
+        if not self.__is_current_sender():
+            return
         self.__slider.setRange(0, duration)
+        self.__refresh_time()
 
     def __slot_slider_moved(self, pos) -> None:
         """
         :param pos: slider가 이동한 위치의 position값
         슬라이더를 조작하면 영상의 재생 구간을 업데이트
         """
-        self.__player.setPosition(pos)
+        self.__current_player().setPosition(pos)
 
     def __slot_label_info(self) -> None:
         """
@@ -533,8 +967,9 @@ class VideoWidget(QtWidgets.QWidget):
         표시 형식 변경시 시간 대신 fps를 표시
         """
         # 플레이어의 포지션 값
-        total_pos = self.__player.duration()
-        current_pos = self.__player.position()
+        player = self.__current_player()
+        total_pos = player.duration()
+        current_pos = player.position()
         remain_pos = total_pos - current_pos + 1000
 
         # 포지션 값을 QTime으로 변환
@@ -542,9 +977,17 @@ class VideoWidget(QtWidgets.QWidget):
         current_time = QtCore.QTime(0, 0).addMSecs(current_pos)
         remain_time = QtCore.QTime(0, 0).addMSecs(remain_pos)
 
-        # 포지션 값을 프레임 단위로 변환
-        total_frames = int((total_pos / 1000) * self.current_fps)
-        current_frames = int((current_pos / 1000) * self.current_fps)
+        # 포지션 값을 프레임 단위로 변환, 플립북과 프레임 인덱스가 있는 영상은 정확한 프레임 번호를 사용
+        index = self.__current_frame_index()
+        if player in [self.__flipbook, self.__shuttle]:
+            total_frames = player.frame_count
+            current_frames = player.current_frame()
+        elif player is self.__player and index is not None:
+            total_frames = index.frame_count
+            current_frames = index.frame_at_position(current_pos)
+        else:
+            total_frames = int((total_pos / 1000) * self.current_fps)
+            current_frames = int((current_pos / 1000) * self.current_fps)
         remain_frames = total_frames - current_frames
 
         # QTime값을 시간:분:초 형식으로 변환
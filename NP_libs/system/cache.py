@@ -0,0 +1,453 @@
+#!/usr/bin/env python
+# encoding=utf-8
+
+# author        :   Juno Park
+# created date  :   2026.10.18
+# modified date :   2026.10.18
+# description   :   원본 파일의 절대 경로, 크기, 수정 시간을 키로 사용하는 디스크 캐시
+#                   키마다 ~/.NP_cache 아래에 디렉토리를 만들어 썸네일 등의 파일을 저장하고,
+#                   설정한 용량을 넘으면 가장 오래 사용하지 않은 항목부터 삭제함(LRU)
+#                   프록시는 ~/.NP_cache/proxies 아래에 별도의 용량으로 저장하여 썸네일, 인덱스를 밀어내지 않음
+
+import os
+import json
+import math
+import bisect
+import typing
+import shutil
+import hashlib
+import threading
+import collections
+
+from NP_libs.algorithm import library as algo_lib
+from NP_libs.system import sequence as sequence_lib
+
+
+class MediaInfo(typing.NamedTuple):
+    # ffprobe 한 번으로 얻는 영상 정보
+    fps: float
+    width: int
+    height: int
+    duration: float
+    codec: str
+    pix_fmt: str
+    frame_count: int
+
+    @property
+    def pixel(self) -> int:
+        return self.width * self.height
+
+    @property
+    def is_high_resolution(self) -> bool:
+        """
+        :return: UHD(4K) 이상의 해상도이면 True
+        """
+        return self.pixel > 8294000 or (self.width > 3000 and self.height > 2000)
+
+    @classmethod
+    def from_probe(cls, probe: dict) -> "MediaInfo":
+        """
+        :param probe: ffprobe의 json 출력(-show_streams -show_format)을 읽은 딕셔너리
+        :return: 첫 번째 비디오 스트림의 정보
+        """
+        video_stream = next(
+            stream for stream in probe["streams"] if stream["codec_type"] == "video"
+        )
+        numerator, denominator = map(int, video_stream["avg_frame_rate"].split("/"))
+        fps = numerator / denominator if denominator else 0.0
+        duration = float(
+            video_stream.get("duration") or probe["format"].get("duration") or 0
+        )
+        # 컨테이너에 프레임 수가 기록되지 않은 경우 길이와 fps로 계산
+        frame_count = int(video_stream.get("nb_frames") or round(duration * fps))
+        return cls(
+            fps=fps,
+            width=int(video_stream["width"]),
+            height=int(video_stream["height"]),
+            duration=duration,
+            codec=video_stream.get("codec_name", ""),
+            pix_fmt=video_stream.get("pix_fmt", ""),
+            frame_count=frame_count,
+        )
+
+    def for_sequence(self, frame_count: int, fps: float) -> "MediaInfo":
+        """
+        :param frame_count: 시퀀스의 프레임 수
+        :param fps: 재생할 fps
+        :return: 첫 프레임의 probe 정보에 시퀀스의 길이와 fps를 적용한 정보
+        """
+        return self._replace(fps=fps, frame_count=frame_count, duration=frame_count / fps)
+
+
+class FrameIndex:
+    """
+    ffprobe의 패킷 정보(한 번의 읽기, 디코딩 없음)로 만든 프레임별 시간과 키프레임 위치
+    가변 프레임레이트(VFR) 영상에서도 위치(ms)와 프레임 번호를 정확히 변환함
+    """
+
+    def __init__(self, pts: list[float], keyframes: list[int]):
+        """
+        :param pts: 첫 프레임을 0으로 한 프레임별 표시 시간(초), 표시 순서로 정렬
+        :param keyframes: 키프레임의 프레임 인덱스, 오름차순
+        """
+        self.__pts = pts
+        self.__keyframes = keyframes
+
+    @classmethod
+    def from_packets(cls, packets: list[dict]) -> "FrameIndex":
+        """
+        :param packets: ffprobe -show_entries packet=pts_time,flags 의 packets 항목
+        :return: 표시 시간 순서로 정렬한 프레임 인덱스
+        """
+        frames = []
+        for packet in packets:
+            pts_time = packet.get("pts_time")
+            if pts_time in [None, "N/A"]:
+                continue
+            frames.append((float(pts_time), "K" in packet.get("flags", "")))
+        frames.sort()
+        start = frames[0][0] if frames else 0.0
+        return cls(
+            [pts - start for pts, _ in frames],
+            [idx for idx, (_, key) in enumerate(frames) if key],
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FrameIndex":
+        return cls(data["pts"], data["keyframes"])
+
+    def to_dict(self) -> dict:
+        return {"pts": self.__pts, "keyframes": self.__keyframes}
+
+    @property
+    def frame_count(self) -> int:
+        return len(self.__pts)
+
+    def time_of(self, index: int) -> float:
+        """
+        :return: 해당 프레임의 표시 시간(초)
+        """
+        if not self.__pts:
+            return 0.0
+        return self.__pts[max(0, min(index, len(self.__pts) - 1))]
+
+    def frame_at(self, seconds: float) -> int:
+        """
+        :return: 해당 시간에 표시되는 프레임의 인덱스
+        """
+        index = bisect.bisect_right(self.__pts, seconds + 1e-6) - 1
+        return max(0, min(index, len(self.__pts) - 1))
+
+    def position_of(self, index: int) -> int:
+        """
+        :return: 해당 프레임으로 이동할 때 사용할 위치(ms), 올림하여 이전 프레임에 걸리지 않도록 함
+        """
+        return math.ceil(round(self.time_of(index) * 1000, 3))
+
+    def frame_at_position(self, position: int) -> int:
+        """
+        :param position: 플레이어의 위치(ms)
+        """
+        return self.frame_at(position / 1000)
+
+    def keyframe_before(self, index: int) -> int:
+        """
+        :return: 해당 프레임 이전(포함)의 가장 가까운 키프레임 인덱스
+        """
+        pos = bisect.bisect_right(self.__keyframes, index) - 1
+        return self.__keyframes[pos] if pos >= 0 else 0
+
+    def step_position(self, position: int, frames: int) -> int:
+        """
+        :param position: 현재 위치(ms)
+        :param frames: 이동할 프레임 수, 음수이면 이전 프레임
+        :return: 이동할 프레임의 위치(ms)
+        """
+        return self.position_of(self.frame_at_position(position) + frames)
+
+
+class MediaCache:
+    # 아이콘 크기(F1 ~ F3)에 맞춰 추출하는 썸네일의 너비
+    THUMBNAIL_LEVELS = (180, 240, 360)
+    # 마우스 위치로 탐색할 필름스트립 (한 장의 이미지에 가로로 이어 붙인 프레임)
+    FILMSTRIP = "filmstrip.jpg"
+    FILMSTRIP_FRAMES = 10
+    FILMSTRIP_WIDTH = 240
+    # 영상 정보를 저장하는 파일
+    MEDIA_INFO = "meta.json"
+    # 프레임별 시간과 키프레임 위치를 저장하는 파일
+    FRAME_INDEX = "index.json"
+    # 멀티 뷰어에서 고해상도 영상 대신 재생하는 프록시의 너비
+    PROXY_WIDTH = 960
+
+    def __init__(self, cache_dir: str = None, max_bytes: int = 1024**3):
+        """
+        :param cache_dir: 캐시를 저장할 디렉토리 (기본값: ~/.NP_cache)
+        :param max_bytes: 캐시가 사용할 수 있는 최대 용량 (기본값: 1GB)
+        """
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.expanduser("~"), ".NP_cache")
+        self.__cache_dir = cache_dir
+        self.__max_bytes = max_bytes
+        self.__lock = threading.Lock()
+        # {키: 항목의 용량}, 가장 오래 사용하지 않은 항목이 앞에 위치
+        self.__entries = collections.OrderedDict()
+        self.__total_bytes = 0
+        # {키: MediaInfo}, 같은 프로세스에서는 파일도 다시 읽지 않음
+        self.__media_info = dict()
+        self.__frame_index = dict()  # -> {키: FrameIndex}
+
+        os.makedirs(self.__cache_dir, exist_ok=True)
+        self.__load_entries()
+
+    @staticmethod
+    def make_key(file_path: str) -> str:
+        """
+        :param file_path: 원본 파일 경로
+        :return: 절대 경로, 파일 크기, 수정 시간으로 만든 해시 키
+        파일이 수정되면 키가 바뀌므로 이전 캐시는 사용되지 않고 LRU에 의해 삭제됨
+        printf 형식의 시퀀스 경로는 프레임이 추가, 삭제될 때 바뀌는 디렉토리의 정보를 사용
+        """
+        if sequence_lib.is_pattern(file_path):
+            stat = os.stat(os.path.dirname(file_path))
+        else:
+            stat = os.stat(file_path)
+        src = f"{os.path.abspath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+        return hashlib.sha1(src.encode("utf8")).hexdigest()
+
+    @property
+    def cache_dir(self) -> str:
+        return self.__cache_dir
+
+    @property
+    def max_bytes(self) -> int:
+        return self.__max_bytes
+
+    @property
+    def total_bytes(self) -> int:
+        return self.__total_bytes
+
+    def set_max_bytes(self, max_bytes: int) -> None:
+        """
+        :param max_bytes: 캐시가 사용할 수 있는 최대 용량
+        용량을 줄인 경우 즉시 초과분을 삭제
+        """
+        with self.__lock:
+            self.__max_bytes = max_bytes
+            self.__evict()
+
+    @staticmethod
+    def thumbnail_name(level: int) -> str:
+        """
+        :param level: 썸네일의 너비
+        :return: 캐시 항목 내의 썸네일 파일명
+        """
+        return f"thumbnail_{level}.jpg"
+
+    @staticmethod
+    def proxy_name(width: int) -> str:
+        """
+        :param width: 프록시의 너비
+        :return: 캐시 항목 내의 프록시 파일명
+        """
+        return f"proxy_{width}.mp4"
+
+    def get_thumbnails(self, key: str) -> dict or None:
+        """
+        :return: 모든 해상도의 썸네일이 존재하면 {너비: 경로}, 하나라도 없으면 None
+        """
+        thumbs = dict()
+        for level in self.THUMBNAIL_LEVELS:
+            path = self.file_path(key, self.thumbnail_name(level))
+            if not os.path.exists(path):
+                return None
+            thumbs[level] = path
+        self.touch(key)
+        return thumbs
+
+    def get_media_info(self, key: str) -> MediaInfo or None:
+        """
+        :return: 캐시에 저장된 영상 정보, 존재하지 않으면 None
+        """
+        info = self.__media_info.get(key)
+        if info is not None:
+            return info
+        path = self.get(key, self.MEDIA_INFO)
+        if path is None:
+            return None
+        try:
+            with open(path, "r", encoding="utf8") as fp:
+                info = MediaInfo(**json.load(fp))
+        except (OSError, ValueError, TypeError):
+            return None
+        self.__media_info[key] = info
+        return info
+
+    def put_media_info(self, key: str, info: MediaInfo) -> None:
+        """
+        :param info: 저장할 영상 정보
+        다른 프로세스(뷰어)에서도 읽을 수 있도록 json 파일로 저장
+        """
+        self.__media_info[key] = info
+        temp_path = self.temp_path(key, self.MEDIA_INFO)
+        with open(temp_path, "w", encoding="utf8") as fp:
+            json.dump(info._asdict(), fp)
+        self.put(key, self.MEDIA_INFO, temp_path)
+
+    def get_frame_index(self, key: str) -> FrameIndex or None:
+        """
+        :return: 캐시에 저장된 프레임 인덱스, 존재하지 않으면 None
+        """
+        index = self.__frame_index.get(key)
+        if index is not None:
+            return index
+        path = self.get(key, self.FRAME_INDEX)
+        if path is None:
+            return None
+        try:
+            with open(path, "r", encoding="utf8") as fp:
+                index = FrameIndex.from_dict(json.load(fp))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        self.__frame_index[key] = index
+        return index
+
+    def put_frame_index(self, key: str, index: FrameIndex) -> None:
+        """
+        :param index: 저장할 프레임 인덱스
+        """
+        self.__frame_index[key] = index
+        temp_path = self.temp_path(key, self.FRAME_INDEX)
+        with open(temp_path, "w", encoding="utf8") as fp:
+            json.dump(index.to_dict(), fp)
+        self.put(key, self.FRAME_INDEX, temp_path)
+
+    def file_path(self, key: str, name: str) -> str:
+        """
+        :return: 캐시 항목 내의 파일 경로 (존재 여부와 관계없음)
+        """
+        return os.path.join(self.__cache_dir, key, name)
+
+    def temp_path(self, key: str, name: str) -> str:
+        """
+        :return: put()으로 저장하기 전 임시로 작성할 파일 경로
+        ffmpeg가 확장자로 형식을 판단하므로 확장자는 유지함
+        """
+        os.makedirs(os.path.join(self.__cache_dir, key), exist_ok=True)
+        stem, ext = os.path.splitext(name)
+        return self.file_path(key, f"{stem}.part{ext}")
+
+    def get(self, key: str, name: str) -> str or None:
+        """
+        :return: 캐시에 파일이 존재하면 경로를, 그렇지 않으면 None을 반환
+        """
+        path = self.file_path(key, name)
+        if not os.path.exists(path):
+            return None
+        self.touch(key)
+        return path
+
+    def put(self, key: str, name: str, temp_path: str) -> str:
+        """
+        :param temp_path: temp_path()로 받은 경로에 작성을 마친 파일
+        :return: 캐시에 저장된 파일 경로
+        임시 파일을 원자적으로 교체한 뒤 용량을 계산하고 초과분을 삭제
+        """
+        path = self.file_path(key, name)
+        with self.__lock:
+            old_size = os.path.getsize(path) if os.path.exists(path) else 0
+            os.replace(temp_path, path)
+            delta = os.path.getsize(path) - old_size
+            self.__entries[key] = self.__entries.pop(key, 0) + delta
+            self.__total_bytes += delta
+            self.__evict(keep=key)
+        return path
+
+    def touch(self, key: str) -> None:
+        """
+        항목을 가장 최근에 사용한 것으로 표시
+        다음 세션에서도 순서가 유지되도록 디렉토리의 수정 시간도 갱신함
+        """
+        with self.__lock:
+            if key in self.__entries:
+                self.__entries.move_to_end(key)
+        try:
+            os.utime(os.path.join(self.__cache_dir, key))
+        except OSError:
+            pass
+
+    def remove(self, key: str) -> None:
+        """
+        항목을 캐시에서 삭제
+        """
+        with self.__lock:
+            self.__total_bytes -= self.__entries.pop(key, 0)
+            self.__media_info.pop(key, None)
+            self.__frame_index.pop(key, None)
+            shutil.rmtree(os.path.join(self.__cache_dir, key), ignore_errors=True)
+
+    def __evict(self, keep: str = None) -> None:
+        """
+        :param keep: 방금 저장되어 삭제하지 않을 키
+        최대 용량을 넘으면 가장 오래 사용하지 않은 항목부터 삭제
+        """
+        for key in list(self.__entries.keys()):
+            if self.__total_bytes <= self.__max_bytes:
+                break
+            if key == keep:
+                continue
+            self.__total_bytes -= self.__entries.pop(key)
+            self.__media_info.pop(key, None)
+            self.__frame_index.pop(key, None)
+            shutil.rmtree(os.path.join(self.__cache_dir, key), ignore_errors=True)
+
+    def __load_entries(self) -> None:
+        """
+        캐시 디렉토리를 읽어 항목별 용량과 사용 순서(수정 시간)를 복원
+        """
+        entries = []
+        with os.scandir(self.__cache_dir) as it:
+            for entry in it:
+                # 키가 아닌 디렉토리는 다른 캐시(프록시, 프레임 캐시)가 관리하므로 제외
+                if not entry.is_dir(follow_symlinks=False) or not self.__is_key(entry.name):
+                    continue
+                size = 0
+                with os.scandir(entry.path) as files:
+                    for f in files:
+                        if f.is_file(follow_symlinks=False):
+                            size += f.stat().st_size
+                entries.append((entry.stat().st_mtime, entry.name, size))
+        for _, key, size in sorted(entries):
+            self.__entries[key] = size
+            self.__total_bytes += size
+        self.__evict()
+
+    @staticmethod
+    def __is_key(name: str) -> bool:
+        """
+        :return: make_key()로 만든 키(sha1)의 형식이면 True
+        """
+        return len(name) == 40 and all(c in "0123456789abcdef" for c in name)
+
+
+class ProxyCache(MediaCache):
+    # 캐시 디렉토리 아래에 프록시를 저장할 디렉토리
+    DIR_NAME = "proxies"
+
+    def __init__(self, cache_dir: str = None, max_bytes: int = 8 * 1024**3):
+        """
+        :param cache_dir: 프록시를 저장할 디렉토리 (기본값: ~/.NP_cache/proxies)
+        :param max_bytes: 프록시가 사용할 수 있는 최대 용량 (기본값: 8GB)
+        프록시는 썸네일보다 훨씬 크므로 썸네일, 영상 정보, 인덱스와 용량을 따로 관리
+        """
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.expanduser("~"), ".NP_cache", self.DIR_NAME)
+        super().__init__(cache_dir, max_bytes)
+
+
+@algo_lib.singleton
+class SingletonMediaCache(MediaCache): ...
+
+
+@algo_lib.singleton
+class SingletonProxyCache(ProxyCache): ...
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# encoding=utf-8
+
+# author        :   Juno Park
+# created date  :   2026.10.18
+# modified date :   2026.10.18
+# description   :   등록된 영상을 패널을 닫은 뒤에도 유지하기 위한 SQLite 카탈로그
+#                   영상 경로, 샷 이름, probe 정보, 시퀀스 정보를 저장하며
+#                   패널을 열 때 디렉토리를 다시 탐색하거나 probe하지 않고 한 번의 쿼리로 복원함
+
+import os
+import time
+import typing
+import sqlite3
+
+from NP_libs.system import cache as cache_lib
+
+
+class CatalogEntry(typing.NamedTuple):
+    path: str
+    shot: str
+    info: cache_lib.MediaInfo or None  # -> probe 전이면 None
+    sequence_dir: str or None  # -> 이미지 시퀀스를 변환한 영상인 경우 원본 디렉토리
+
+
+class MediaCatalog:
+    __SCHEMA = """
+        CREATE TABLE IF NOT EXISTS clips (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            path TEXT NOT NULL UNIQUE,
+            shot TEXT NOT NULL,
+            fps REAL,
+            width INTEGER,
+            height INTEGER,
+            duration REAL,
+            codec TEXT,
+            pix_fmt TEXT,
+            frame_count INTEGER,
+            sequence_dir TEXT,
+            added REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_clips_shot ON clips (shot);
+    """
+    __COLUMNS = (
+        "path, shot, fps, width, height, duration, codec, pix_fmt, "
+        "frame_count, sequence_dir"
+    )
+
+    def __init__(self, db_path: str = None):
+        """
+        :param db_path: 카탈로그 파일 경로 (기본값: ~/.NP_cache/catalog.db)
+        """
+        if db_path is None:
+            db_path = os.path.join(os.path.expanduser("~"), ".NP_cache", "catalog.db")
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.__db_path = db_path
+        self.__conn = sqlite3.connect(db_path)
+        self.__conn.execute("PRAGMA journal_mode=WAL")
+        self.__conn.executescript(self.__SCHEMA)
+        self.__conn.commit()
+
+    @property
+    def db_path(self) -> str:
+        return self.__db_path
+
+    @staticmethod
+    def shot_name(file_path: str, sequence_dir: str = None) -> str:
+        """
+        :return: 파일명(시퀀스는 원본 디렉토리명)에서 확장자를 제외한 이름
+        """
+        if sequence_dir is not None:
+            return os.path.basename(os.path.normpath(sequence_dir))
+        return os.path.splitext(os.path.basename(file_path))[0]
+
+    def add(self, file_paths: list[str], sequence_dir: str = None) -> None:
+        """
+        :param file_paths: 등록된 파일 경로가 담긴 리스트
+        :param sequence_dir: 이미지 시퀀스를 변환한 영상인 경우 원본 디렉토리
+        이미 등록된 경로는 무시하며, 하나의 트랜잭션으로 저장
+        """
+        rows = []
+        now = time.time()
+        # 캐시 키는 파일의 크기, 수정 시간으로 만들어지므로 저장하지 않고 사용할 때 계산
+        for f_path in file_paths:
+            rows.append((f_path, self.shot_name(f_path, sequence_dir), sequence_dir, now))
+        with self.__conn:
+            self.__conn.executemany(
+                "INSERT OR IGNORE INTO clips (path, shot, sequence_dir, added) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+
+    def set_media_info(self, file_path: str, info: cache_lib.MediaInfo) -> None:
+        """
+        :param info: 파일의 probe 정보
+        """
+        with self.__conn:
+            self.__conn.execute(
+                "UPDATE clips SET fps = ?, width = ?, height = ?, duration = ?, "
+                "codec = ?, pix_fmt = ?, frame_count = ? WHERE path = ?",
+                (*info, file_path),
+            )
+
+    def remove(self, file_paths: list[str]) -> None:
+        """
+        :param file_paths: 등록을 해제할 파일 경로가 담긴 리스트
+        """
+        with self.__conn:
+            self.__conn.executemany(
+                "DELETE FROM clips WHERE path = ?", [(f,) for f in file_paths]
+            )
+
+    def load(self) -> list[CatalogEntry]:
+        """
+        :return: 등록된 순서대로 정렬된 모든 항목
+        """
+        cursor = self.__conn.execute(f"SELECT {self.__COLUMNS} FROM clips ORDER BY id")
+        return [self.__to_entry(row) for row in cursor]
+
+    def find_by_shot(self, shot: str) -> list[CatalogEntry]:
+        """
+        :param shot: 찾을 샷 이름, 앞부분만 입력해도 됨 ex) "SH010"
+        :return: 샷 이름이 일치하는 항목
+        """
+        cursor = self.__conn.execute(
+            f"SELECT {self.__COLUMNS} FROM clips WHERE shot >= ? AND shot < ? ORDER BY id",
+            (shot, shot + "\uffff"),
+        )
+        return [self.__to_entry(row) for row in cursor]
+
+    def close(self) -> None:
+        self.__conn.close()
+
+    @staticmethod
+    def __to_entry(row: tuple) -> CatalogEntry:
+        path, shot, *info, sequence_dir = row
+        media_info = None if info[0] is None else cache_lib.MediaInfo(*info)
+        return CatalogEntry(path, shot, media_info, sequence_dir)
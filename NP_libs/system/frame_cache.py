@@ -0,0 +1,397 @@
+#!/usr/bin/env python
+# encoding=utf-8
+
+# author        :   Juno Park
+# created date  :   2026.10.18
+# modified date :   2026.10.18
+# description   :   디코딩한 프레임(QImage)을 저장하는 2단계 캐시
+#                   메모리에서는 설정한 용량(MB)을 넘으면 가장 오래 사용하지 않은 프레임부터 내보내고,
+#                   디스크 단계를 사용하면 내보낸 프레임을 ~/.NP_cache/frames 아래의 raw 파일에 기록한 뒤
+#                   mmap으로 다시 읽어 디코딩 없이 메모리로 올림
+#                   디스크 단계는 패널을 닫아도 유지되며, 여러 뷰어 프로세스가 함께 사용하므로
+#                   용량은 디렉토리의 실제 사용량을 기준으로 제한함
+
+import os
+import mmap
+import time
+import threading
+import collections
+
+from PySide2 import QtGui
+from NP_libs.algorithm import library as algo_lib
+from NP_libs.system import cache as cache_lib
+
+
+def disk_usage(stat: os.stat_result) -> int:
+    """
+    :return: 파일이 디스크에서 실제로 차지하는 용량
+    프레임은 인덱스 위치에 기록하므로 파일 중간이 비어 있을 수 있어 파일 크기 대신 할당된 블록을 사용
+    """
+    blocks = getattr(stat, "st_blocks", None)
+    return stat.st_size if blocks is None else blocks * 512
+
+
+class SpillFile:
+    def __init__(
+        self,
+        path: str,
+        width: int,
+        height: int,
+        bytes_per_line: int,
+        image_format: int,
+    ):
+        """
+        :param path: 프레임을 기록할 raw 파일 경로 (옆에 .idx 파일로 기록 여부를 저장)
+        :param width: 프레임의 너비
+        :param height: 프레임의 높이
+        :param bytes_per_line: 한 줄의 바이트 수
+        :param image_format: QImage.Format 값
+        한 클립의 프레임을 고정 크기의 칸으로 하나의 파일에 저장, 인덱스 i의 프레임은 i번째 칸
+        """
+        self.__path = path
+        self.__width = width
+        self.__height = height
+        self.__bytes_per_line = bytes_per_line
+        self.__format = QtGui.QImage.Format(image_format)
+        self.__frame_bytes = bytes_per_line * height
+        self.__fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        self.__index_fd = os.open(f"{path}.idx", os.O_RDWR | os.O_CREAT, 0o644)
+        size = os.fstat(self.__index_fd).st_size
+        self.__present = bytearray(os.pread(self.__index_fd, size, 0))
+        self.__map = None
+        self.__mapped_size = 0
+
+    @staticmethod
+    def file_name(clip: str, image: QtGui.QImage) -> str:
+        """
+        :return: 클립 키와 프레임의 형식을 담은 파일명 ex) <키>.960x540.2880.13.raw
+        """
+        return (
+            f"{clip}.{image.width()}x{image.height()}."
+            f"{image.bytesPerLine()}.{int(image.format())}.raw"
+        )
+
+    @classmethod
+    def from_path(cls, path: str) -> "SpillFile":
+        """
+        :param path: file_name으로 만든 파일의 경로
+        """
+        _, size, bytes_per_line, image_format, _ = os.path.basename(path).split(".")
+        width, height = map(int, size.split("x"))
+        return cls(path, width, height, int(bytes_per_line), int(image_format))
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @property
+    def size(self) -> int:
+        """
+        :return: raw 파일과 .idx 파일의 디스크 용량
+        """
+        return disk_usage(os.fstat(self.__fd)) + disk_usage(os.fstat(self.__index_fd))
+
+    def matches(self, image: QtGui.QImage) -> bool:
+        """
+        :return: 프레임의 크기와 형식이 파일의 칸과 같으면 True
+        """
+        return (
+            image.width() == self.__width
+            and image.height() == self.__height
+            and image.bytesPerLine() == self.__bytes_per_line
+            and image.format() == self.__format
+        )
+
+    def has(self, index: int) -> bool:
+        return index < len(self.__present) and self.__present[index] == 1
+
+    def read(self, index: int) -> QtGui.QImage or None:
+        """
+        :return: mmap으로 읽은 프레임의 복사본, 기록되지 않은 프레임이면 None
+        """
+        if not self.has(index):
+            return None
+        start = index * self.__frame_bytes
+        end = start + self.__frame_bytes
+        if end > self.__mapped_size:
+            # 파일이 커진 경우 다시 매핑
+            size = os.fstat(self.__fd).st_size
+            if size < end:
+                return None
+            if self.__map is not None:
+                self.__map.close()
+            self.__map = mmap.mmap(self.__fd, size, access=mmap.ACCESS_READ)
+            self.__mapped_size = size
+        data = self.__map[start:end]
+        return QtGui.QImage(
+            data, self.__width, self.__height, self.__bytes_per_line, self.__format
+        ).copy()
+
+    def write(self, index: int, image: QtGui.QImage) -> int:
+        """
+        :return: 기록하여 늘어난 디스크 용량
+        """
+        before = self.size
+        data = bytes(image.constBits())[: self.__frame_bytes]
+        os.pwrite(self.__fd, data, index * self.__frame_bytes)
+        if index >= len(self.__present):
+            self.__present.extend(bytes(index + 1 - len(self.__present)))
+        self.__present[index] = 1
+        os.pwrite(self.__index_fd, b"\x01", index)
+        return self.size - before
+
+    def close(self) -> None:
+        if self.__map is not None:
+            self.__map.close()
+            self.__map = None
+            self.__mapped_size = 0
+        os.close(self.__fd)
+        os.close(self.__index_fd)
+
+    def remove(self) -> None:
+        self.close()
+        remove_files(self.__path)
+
+
+def remove_files(path: str) -> None:
+    """
+    :param path: 삭제할 raw 파일 경로, .idx 파일도 함께 삭제
+    다른 프로세스가 먼저 삭제한 경우는 무시
+    """
+    for file_path in [path, f"{path}.idx"]:
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass
+
+
+class FrameCache:
+    # 동시에 열어둘 디스크 단계 파일의 수
+    MAX_OPEN_FILES = 16
+    # 다른 프로세스가 기록, 삭제한 파일을 반영하기 위해 디스크 사용량을 다시 읽는 간격(초)
+    RESCAN_SECONDS = 1.0
+
+    def __init__(
+        self, max_mb: int = 1024, spill_dir: str = None, spill_mb: int = 4096
+    ):
+        """
+        :param max_mb: 메모리에 저장할 프레임의 최대 용량(MB)
+        :param spill_dir: 디스크 단계의 디렉토리 (기본값: ~/.NP_cache/frames)
+        :param spill_mb: 디스크 단계의 최대 용량(MB), 0이면 디스크 단계를 사용하지 않음
+        같은 디렉토리를 사용하는 모든 프로세스의 파일을 합한 용량
+        """
+        if spill_dir is None:
+            spill_dir = os.path.join(os.path.expanduser("~"), ".NP_cache", "frames")
+        self.__ram = algo_lib.LRUCache(max_mb * 1024**2)
+        self.__spill_dir = spill_dir
+        self.__spill_max = spill_mb * 1024**2
+        self.__lock = threading.Lock()
+        # {클립 키: raw 파일 경로}, 가장 오래 사용하지 않은 클립이 앞에 위치
+        self.__spill_paths = collections.OrderedDict()
+        self.__spill_sizes = dict()  # -> {클립 키: 디스크 용량}
+        self.__spill_bytes = 0
+        self.__scanned = 0.0  # -> 마지막으로 디스크 사용량을 읽은 시간
+        self.__open_files = collections.OrderedDict()  # -> {클립 키: SpillFile}
+        if self.spill_enabled:
+            os.makedirs(self.__spill_dir, exist_ok=True)
+            with self.__lock:
+                self.__scan_spill_files()
+                self.__evict_spill()
+
+    @staticmethod
+    def clip_key(file_path: str, width: int = None) -> str:
+        """
+        :param file_path: 원본 영상 또는 printf 형식의 시퀀스 경로
+        :param width: 디코딩한 너비, None이면 원본 크기
+        :return: 원본이 수정되면 바뀌는 클립 키 (디코딩 크기별로 구분)
+        """
+        return f"{cache_lib.MediaCache.make_key(file_path)}_{width or 0}"
+
+    @property
+    def max_bytes(self) -> int:
+        return self.__ram.max_bytes
+
+    @property
+    def total_bytes(self) -> int:
+        return self.__ram.total_bytes
+
+    @property
+    def spill_enabled(self) -> bool:
+        return self.__spill_max > 0
+
+    @property
+    def spill_bytes(self) -> int:
+        return self.__spill_bytes
+
+    def set_max_mb(self, max_mb: int) -> None:
+        """
+        :param max_mb: 메모리에 저장할 프레임의 최대 용량(MB), 줄인 경우 초과분을 디스크 단계로 내보냄
+        """
+        self.__spill_evicted(self.__ram.set_max_bytes(max_mb * 1024**2))
+
+    def __contains__(self, key: tuple) -> bool:
+        """
+        :param key: (클립 키, 프레임 인덱스)
+        :return: 메모리에 있으면 True
+        """
+        return key in self.__ram
+
+    def get(
+        self, clip: str, index: int, spill: bool = True
+    ) -> QtGui.QImage or None:
+        """
+        :param clip: 클립 키
+        :param index: 프레임 인덱스
+        :param spill: False이면 메모리만 확인 (GUI 스레드에서 디스크를 읽지 않도록 함)
+        :return: 저장된 프레임, 디스크 단계에서 찾은 프레임은 메모리로 올린 뒤 반환
+        """
+        image = self.__ram.get((clip, index))
+        if image is not None or not spill or not self.spill_enabled:
+            return image
+        with self.__lock:
+            spill_file = self.__open_spill(clip)
+            image = spill_file.read(index) if spill_file is not None else None
+        if image is not None:
+            self.__spill_evicted(
+                self.__ram.put((clip, index), image, image.sizeInBytes())
+            )
+        return image
+
+    def put(self, clip: str, index: int, image: QtGui.QImage) -> None:
+        """
+        :param clip: 클립 키
+        :param index: 프레임 인덱스
+        :param image: 디코딩한 프레임
+        메모리의 용량을 넘어 밀려난 프레임은 디스크 단계에 기록
+        """
+        self.__spill_evicted(self.__ram.put((clip, index), image, image.sizeInBytes()))
+
+    def clear(self) -> None:
+        """
+        메모리의 프레임을 모두 삭제 (디스크 단계는 유지)
+        """
+        self.__ram.clear()
+
+    def __spill_evicted(self, evicted: list) -> None:
+        """
+        :param evicted: 메모리에서 밀려난 ((클립 키, 프레임 인덱스), QImage) 리스트
+        """
+        if not self.spill_enabled or not evicted:
+            return
+        with self.__lock:
+            if time.monotonic() - self.__scanned > self.RESCAN_SECONDS:
+                self.__scan_spill_files()
+            for (clip, index), image in evicted:
+                spill_file = self.__open_spill(clip, image)
+                if spill_file is None or spill_file.has(index):
+                    continue
+                if not spill_file.matches(image):
+                    continue
+                # 다른 클립을 지워도 용량이 부족하면 기록하지 않음
+                self.__evict_spill(keep=clip, incoming=image.sizeInBytes())
+                if self.__spill_bytes + image.sizeInBytes() > self.__spill_max:
+                    continue
+                try:
+                    added = spill_file.write(index, image)
+                except OSError as err:
+                    print(f"\033[31mERROR: 프레임을 디스크에 기록할 수 없음 >> {err}\033[0m")
+                    continue
+                self.__spill_bytes += added
+                self.__spill_sizes[clip] = self.__spill_sizes.get(clip, 0) + added
+
+    def __open_spill(self, clip: str, image: QtGui.QImage = None) -> SpillFile or None:
+        """
+        :param image: 파일이 없을 때 이 프레임의 형식으로 새로 만듦, None이면 만들지 않음
+        :return: 클립의 디스크 단계 파일
+        """
+        spill_file = self.__open_files.get(clip)
+        if spill_file is not None:
+            self.__open_files.move_to_end(clip)
+            self.__spill_paths.move_to_end(clip)
+            return spill_file
+        if self.__spill_paths.get(clip) is not None:
+            # 다른 프로세스도 사용 순서를 알 수 있도록 파일의 수정 시간을 갱신
+            try:
+                os.utime(self.__spill_paths[clip])
+            except OSError:
+                self.__spill_paths.pop(clip)
+                self.__spill_bytes -= self.__spill_sizes.pop(clip, 0)
+        path = self.__spill_paths.get(clip)
+        if path is None:
+            if image is None:
+                return None
+            path = os.path.join(self.__spill_dir, SpillFile.file_name(clip, image))
+            self.__spill_paths[clip] = path
+        try:
+            spill_file = SpillFile.from_path(path)
+        except (OSError, ValueError) as err:
+            print(f"\033[31mERROR: 디스크 캐시를 열 수 없음 >> {path}: {err}\033[0m")
+            self.__spill_paths.pop(clip, None)
+            return None
+        self.__spill_paths.move_to_end(clip)
+        self.__open_files[clip] = spill_file
+        while len(self.__open_files) > self.MAX_OPEN_FILES:
+            _, oldest = self.__open_files.popitem(last=False)
+            oldest.close()
+        return spill_file
+
+    def __evict_spill(self, keep: str = None, incoming: int = 0) -> None:
+        """
+        :param keep: 삭제하지 않을 클립 키
+        :param incoming: 새로 기록할 용량
+        디스크 단계가 용량을 넘으면 가장 오래 사용하지 않은 클립의 파일부터 삭제
+        (다른 프로세스가 기록한 파일 포함)
+        """
+        if self.__spill_bytes + incoming > self.__spill_max:
+            # 삭제하기 전에 다른 프로세스가 기록, 삭제한 파일을 반영
+            self.__scan_spill_files()
+        for clip in list(self.__spill_paths.keys()):
+            if self.__spill_bytes + incoming <= self.__spill_max:
+                break
+            if clip == keep:
+                continue
+            path = self.__spill_paths.pop(clip)
+            spill_file = self.__open_files.pop(clip, None)
+            if spill_file is not None:
+                spill_file.remove()
+            else:
+                remove_files(path)
+            self.__spill_bytes -= self.__spill_sizes.pop(clip, 0)
+
+    def __scan_spill_files(self) -> None:
+        """
+        디렉토리의 디스크 단계 파일을 수정 시간 순서로 다시 등록하여 실제 사용량을 반영
+        이전 실행과 다른 프로세스가 기록한 파일도 포함하며, 다른 프로세스가 삭제한 파일은 닫음
+        """
+        entries = []
+        with os.scandir(self.__spill_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".raw"):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                    size = disk_usage(stat)
+                    index_path = f"{entry.path}.idx"
+                    if os.path.exists(index_path):
+                        size += disk_usage(os.stat(index_path))
+                except OSError:
+                    continue
+                clip = entry.name.split(".")[0]
+                entries.append((stat.st_mtime, clip, entry.path, size))
+        self.__spill_paths.clear()
+        self.__spill_sizes.clear()
+        self.__spill_bytes = 0
+        for _, clip, path, size in sorted(entries):
+            self.__spill_paths[clip] = path
+            self.__spill_sizes[clip] = size
+            self.__spill_bytes += size
+        for clip, spill_file in list(self.__open_files.items()):
+            if self.__spill_paths.get(clip) != spill_file.path:
+                self.__open_files.pop(clip).close()
+        self.__scanned = time.monotonic()
+
+
+@algo_lib.singleton
+class SingletonFrameCache(FrameCache): ...
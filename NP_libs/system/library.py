@@ -1,5 +1,6 @@
 import os
 import sys
+import queue
 import shlex
 
 # import orjson
@@ -7,6 +8,7 @@ import typing
 import pathlib
 import threading
 import subprocess
+from concurrent import futures
 
 
 class System:
@@ -78,6 +80,73 @@ class System:
                             lst.append(fullpath)
         yield from lst
 
+    @staticmethod
+    def walk_files(
+        parent_dir: typing.Union[str, pathlib.Path],
+        pattern: typing.List[str],
+        max_workers: int = 8,
+        batch_size: int = 256,
+    ) -> typing.Generator[str, None, None]:
+        """
+        os.scandir로 하위 디렉토리를 여러 스레드에서 동시에 탐색하며, 찾는 즉시 파일 경로를 반환하는 제네레이터
+        DirEntry에 담긴 파일 유형을 사용하므로 파일마다 stat을 다시 호출하지 않음
+        :param parent_dir: 탐색을 시작할 디렉토리
+        :param pattern: 찾을 확장자 리스트 (대소문자 구분 없음), "*"가 포함되면 모든 파일
+        :param max_workers: 디렉토리를 동시에 탐색할 스레드 수 (NFS처럼 지연이 큰 경우 효과가 큼)
+        :param batch_size: 한 번에 전달할 파일 경로의 수
+        :return: 파일 경로(str), 디렉토리 순서는 보장하지 않음
+        """
+        match_all = "*" in pattern
+        extensions = frozenset(ext.lower() for ext in pattern)
+        results = queue.Queue()  # -> (파일 경로 리스트, 디렉토리 탐색 완료 여부)
+        stopped = threading.Event()
+        lock = threading.Lock()
+        pending = [1]  # -> 탐색이 끝나지 않은 디렉토리 수
+        executor = futures.ThreadPoolExecutor(max_workers=max(1, max_workers))
+
+        def scan(dir_path: str) -> None:
+            files = []
+            try:
+                with os.scandir(dir_path) as it:
+                    for entry in it:
+                        if stopped.is_set():
+                            break
+                        try:
+                            # 심볼릭 링크 디렉토리는 순환을 막기 위해 따라가지 않음
+                            if entry.is_dir(follow_symlinks=False):
+                                with lock:
+                                    pending[0] += 1
+                                executor.submit(scan, entry.path)
+                            elif entry.is_file():
+                                if match_all or (
+                                    os.path.splitext(entry.name)[1].lower() in extensions
+                                ):
+                                    files.append(entry.path)
+                                    if len(files) >= batch_size:
+                                        results.put((files, False))
+                                        files = []
+                        except OSError:
+                            continue
+            except OSError as err:
+                sys.stderr.write(f"{dir_path} 디렉토리를 읽을 수 없습니다. {err}\n")
+            finally:
+                results.put((files, True))
+
+        executor.submit(scan, os.fspath(parent_dir))
+        try:
+            while True:
+                files, done = results.get()
+                yield from files
+                if done:
+                    with lock:
+                        pending[0] -= 1
+                        if not pending[0]:
+                            break
+        finally:
+            # 탐색 도중 제네레이터가 닫혀도 남은 작업을 취소
+            stopped.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
     @staticmethod
     def open_with_terminal(cmd: str) -> str:
         return "gnome-terminal -e 'bash -c \"{command}; cd $OLDPATH; exec bash\"' &".format(
@@ -0,0 +1,317 @@
+#!/usr/bin/env python
+# encoding=utf-8
+
+# author        :   Juno Park
+# created date  :   2026.10.18
+# modified date :   2026.10.18
+# description   :   asyncio 이벤트 루프를 별도의 QThread에서 실행하여 ffprobe, ffmpeg 프로세스를
+#                   동시 실행 개수 제한 안에서 여러 개 실행하고, 결과를 Qt 시그널로 전달하는 클래스
+#                   GUI 스레드는 작업을 추가하기만 하므로 수백 개의 파일을 probe해도 멈추지 않음
+#                   고해상도 영상의 프록시도 같은 루프에서 별도의 개수 제한으로 생성함
+#                   영상은 probe 후 패킷 정보로 프레임 인덱스를 만들어 뷰어의 프레임 단위 이동에 사용
+
+import os
+import json
+import typing
+import asyncio
+import itertools
+import threading
+import concurrent.futures
+
+from PySide2 import QtCore
+from NP_libs.system import cache as cache_lib
+from NP_libs.system import sequence as sequence_lib
+
+
+class ProcessResult(typing.NamedTuple):
+    # 실행이 끝난 프로세스의 결과
+    job_id: int
+    args: list
+    returncode: int
+    stdout: bytes
+    stderr: bytes
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0
+
+
+class AsyncProcessRunner(QtCore.QThread):
+    process_finished = QtCore.Signal(object)  # -> ProcessResult
+    probe_finished = QtCore.Signal(str, object)  # -> (영상 경로, MediaInfo 또는 None)
+    proxy_finished = QtCore.Signal(str, object)  # -> (영상 경로, 프록시 경로 또는 None)
+
+    def __init__(
+        self,
+        max_concurrency: int = 16,
+        media_cache: cache_lib.MediaCache = None,
+        max_proxy_jobs: int = 2,
+        proxy_cache: cache_lib.ProxyCache = None,
+    ):
+        """
+        :param max_concurrency: 동시에 실행할 프로세스의 최대 개수
+        :param media_cache: probe 결과를 저장할 캐시 (기본값: SingletonMediaCache)
+        :param max_proxy_jobs: 동시에 생성할 프록시의 최대 개수 (인코딩은 CPU를 많이 사용함)
+        :param proxy_cache: 프록시를 저장할 캐시 (기본값: SingletonProxyCache)
+        """
+        super().__init__()
+        self.__max_concurrency = max(1, max_concurrency)
+        self.__max_proxy_jobs = max(1, max_proxy_jobs)
+        self.__media_cache = media_cache or cache_lib.SingletonMediaCache()
+        self.__proxy_cache = proxy_cache or cache_lib.SingletonProxyCache()
+        self.__loop = None
+        self.__semaphore = None
+        self.__proxy_semaphore = None
+        self.__proxy_jobs = set()  # -> 생성 중인 (영상 경로, 너비), 루프 스레드에서만 사용
+        self.__procs = set()  # -> 실행 중인 프로세스, 루프 스레드에서만 사용
+        self.__ready = threading.Event()  # -> 이벤트 루프가 준비되면 작업 추가 가능
+        self.__job_ids = itertools.count()
+
+    def run(self):
+        self.__loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.__loop)
+        self.__semaphore = asyncio.Semaphore(self.__max_concurrency)
+        self.__proxy_semaphore = asyncio.Semaphore(self.__max_proxy_jobs)
+        self.__ready.set()
+        self.__loop.run_forever()
+
+        # 종료 시 실행 중인 작업을 취소하고 루프 정리
+        tasks = asyncio.all_tasks(self.__loop)
+        for task in tasks:
+            task.cancel()
+        self.__loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        self.__loop.close()
+
+    def submit(self, args: list[str]) -> int:
+        """
+        :param args: 실행할 명령어 ex) ["ffmpeg", "-i", ...]
+        :return: process_finished 시그널의 결과와 매칭할 작업 번호
+        어느 스레드에서 호출해도 됨
+        """
+        job_id = next(self.__job_ids)
+        self.__call(self.__run_process, job_id, list(args))
+        return job_id
+
+    def probe(self, file_paths: list[str]) -> None:
+        """
+        :param file_paths: 영상 정보를 추출할 파일 경로가 담긴 리스트
+        캐시에 없는 파일만 ffprobe를 실행하고, 결과는 캐시에 저장한 뒤 probe_finished로 전달
+        """
+        for f_path in file_paths:
+            self.__call(self.__probe, f_path)
+
+    def make_proxies(
+        self, file_paths: list[str], width: int = cache_lib.MediaCache.PROXY_WIDTH
+    ) -> None:
+        """
+        :param file_paths: 프록시를 생성할 영상 경로가 담긴 리스트
+        :param width: 프록시의 너비 (멀티 뷰어의 타일 크기)
+        캐시에 없는 영상만 생성하며, 결과는 캐시에 저장한 뒤 proxy_finished로 전달
+        """
+        for f_path in file_paths:
+            self.__call(self.__proxy, f_path, width)
+
+    def stop(self):
+        """
+        대기, 실행 중인 작업을 취소하고 실행 중인 프로세스를 종료한 뒤 이벤트 루프를 정지
+        """
+        if self.__loop is not None and self.__loop.is_running():
+            future = asyncio.run_coroutine_threadsafe(self.__shutdown(), self.__loop)
+            try:
+                future.result(10)
+            except concurrent.futures.TimeoutError:
+                print("\033[31mERROR: 프로세스 종료 시간 초과\033[0m")
+                self.__loop.call_soon_threadsafe(self.__loop.stop)
+        self.wait(10000)
+
+    async def __shutdown(self) -> None:
+        tasks = [
+            task
+            for task in asyncio.all_tasks(self.__loop)
+            if task is not asyncio.current_task()
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # 취소되기 전에 시작된 프로세스가 남아 있으면 종료
+        for proc in list(self.__procs):
+            await self.__kill(proc)
+        self.__loop.stop()
+
+    @staticmethod
+    async def __kill(proc: asyncio.subprocess.Process) -> None:
+        if proc.returncode is None:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+        await proc.wait()
+
+    def __call(self, coro_func, *args) -> None:
+        """
+        다른 스레드에서 이벤트 루프에 코루틴을 추가
+        """
+        self.__ready.wait()
+        self.__loop.call_soon_threadsafe(
+            lambda: self.__loop.create_task(coro_func(*args))
+        )
+
+    async def __exec(self, job_id: int, args: list[str]) -> ProcessResult:
+        """
+        :return: 세마포어로 동시 실행 개수를 제한하여 실행한 프로세스의 결과
+        """
+        async with self.__semaphore:
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *args,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+                self.__procs.add(proc)
+                try:
+                    stdout, stderr = await proc.communicate()
+                except asyncio.CancelledError:
+                    # 작업이 취소되면 프로세스도 종료 (패널을 닫은 뒤 인코딩이 계속되지 않도록)
+                    await self.__kill(proc)
+                    raise
+                finally:
+                    self.__procs.discard(proc)
+            except OSError as err:
+                return ProcessResult(job_id, args, -1, b"", str(err).encode("utf8"))
+        return ProcessResult(job_id, args, proc.returncode, stdout, stderr)
+
+    async def __run_process(self, job_id: int, args: list[str]) -> None:
+        result = await self.__exec(job_id, args)
+        self.process_finished.emit(result)
+
+    async def __probe(self, f_path: str) -> None:
+        info = None
+        try:
+            key = self.__media_cache.make_key(f_path)
+            info = self.__media_cache.get_media_info(key)
+            if info is None:
+                # 시퀀스는 첫 프레임을 probe한 뒤 길이를 적용
+                seq = None
+                probe_path = f_path
+                if sequence_lib.is_pattern(f_path):
+                    seq = sequence_lib.find_sequence(f_path)
+                    if seq is None:
+                        raise FileNotFoundError(f"Sequence {f_path} not found.")
+                    probe_path = seq.frame_path(seq.first)
+                result = await self.__exec(
+                    next(self.__job_ids),
+                    [
+                        "ffprobe",
+                        "-v",
+                        "error",
+                        "-print_format",
+                        "json",
+                        "-show_format",
+                        "-show_streams",
+                        probe_path,
+                    ],
+                )
+                if result.ok:
+                    info = cache_lib.MediaInfo.from_probe(json.loads(result.stdout))
+                    if seq is not None:
+                        info = info.for_sequence(len(seq), sequence_lib.DEFAULT_FPS)
+                    self.__media_cache.put_media_info(key, info)
+                else:
+                    print(f"\033[31mERROR:{f_path} >> {result.stderr.decode('utf8')}\033[0m")
+        except (OSError, ValueError, KeyError, StopIteration) as err:
+            print(f"\033[31mERROR:{f_path} >> {err}\033[0m")
+        self.probe_finished.emit(f_path, info)
+        if info is not None and not sequence_lib.is_pattern(f_path):
+            # 인덱스는 파일 전체의 패킷을 읽으므로 probe 결과를 기다리게 하지 않음
+            self.__loop.create_task(self.__index(f_path))
+
+    async def __index(self, f_path: str) -> None:
+        try:
+            key = self.__media_cache.make_key(f_path)
+            if self.__media_cache.get_frame_index(key) is not None:
+                return
+            result = await self.__exec(
+                next(self.__job_ids),
+                [
+                    "ffprobe",
+                    "-v",
+                    "error",
+                    "-select_streams",
+                    "v:0",
+                    "-show_entries",
+                    "packet=pts_time,flags",
+                    "-print_format",
+                    "json",
+                    f_path,
+                ],
+            )
+            if not result.ok:
+                print(f"\033[31mERROR:{f_path} >> {result.stderr.decode('utf8')}\033[0m")
+                return
+            packets = json.loads(result.stdout).get("packets", [])
+            self.__media_cache.put_frame_index(
+                key, cache_lib.FrameIndex.from_packets(packets)
+            )
+        except (OSError, ValueError) as err:
+            print(f"\033[31mERROR:{f_path} >> {err}\033[0m")
+
+    async def __proxy(self, f_path: str, width: int) -> None:
+        if (f_path, width) in self.__proxy_jobs:
+            return
+        self.__proxy_jobs.add((f_path, width))
+        proxy = None
+        temp_path = None
+        try:
+            key = self.__proxy_cache.make_key(f_path)
+            name = self.__proxy_cache.proxy_name(width)
+            proxy = self.__proxy_cache.get(key, name)
+            if proxy is None:
+                temp_path = self.__proxy_cache.temp_path(key, name)
+                # 짧은 GOP, B프레임 없음, fastdecode로 여러 개를 동시에 디코딩해도 부담이 적도록 인코딩
+                async with self.__proxy_semaphore:
+                    result = await self.__exec(
+                        next(self.__job_ids),
+                        [
+                            "ffmpeg",
+                            "-y",
+                            "-v",
+                            "error",
+                            "-i",
+                            f_path,
+                            "-vf",
+                            f"scale={width}:-2",
+                            "-c:v",
+                            "libx264",
+                            "-preset",
+                            "veryfast",
+                            "-tune",
+                            "fastdecode",
+                            "-g",
+                            "12",
+                            "-bf",
+                            "0",
+                            "-pix_fmt",
+                            "yuv420p",
+                            "-c:a",
+                            "aac",
+                            "-movflags",
+                            "+faststart",
+                            temp_path,
+                        ],
+                    )
+                if result.ok:
+                    proxy = self.__proxy_cache.put(key, name, temp_path)
+                else:
+                    print(f"\033[31mERROR:{f_path} >> {result.stderr.decode('utf8')}\033[0m")
+                    if os.path.exists(temp_path):
+                        os.remove(temp_path)
+        except asyncio.CancelledError:
+            # 중단된 인코딩의 임시 파일 삭제
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        except OSError as err:
+            print(f"\033[31mERROR:{f_path} >> {err}\033[0m")
+        finally:
+            self.__proxy_jobs.discard((f_path, width))
+        self.proxy_finished.emit(f_path, proxy)
@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+# encoding=utf-8
+
+# author        :   Juno Park
+# created date  :   2026.10.18
+# modified date :   2026.10.18
+# description   :   디렉토리를 한 번의 os.scandir로 읽어 prefix.####.ext 형태의 파일을
+#                   시퀀스별로 묶어주는 파서
+#                   패딩 길이에 관계없이 인식하며 음수 프레임도 지원하고,
+#                   결과는 디렉토리의 수정 시간이 바뀌기 전까지 캐시됨
+
+import os
+import re
+import threading
+
+from NP_libs.algorithm import library as algo_lib
+
+# 확장자 바로 앞의 마지막 숫자를 프레임 번호로 사용 ex) shot_v001.1001.exr -> 1001
+_FRAME_PATTERN = re.compile(r"^(?P<prefix>.*\D)?(?P<frame>\d+)(?P<ext>\.[^.]+)$")
+# printf 형식의 시퀀스 경로 ex) shot.%04d.exr
+_PRINTF_PATTERN = re.compile(r"%0?\d*d")
+
+# 시퀀스에는 fps 정보가 없으므로 재생 및 변환에 사용하는 기본값
+DEFAULT_FPS = 24
+
+
+class Sequence:
+    def __init__(self, directory: str, prefix: str, ext: str, padding: int, frames):
+        """
+        :param directory: 시퀀스가 존재하는 디렉토리
+        :param prefix: 프레임 번호 앞의 파일명 ex) "shot_v001."
+        :param ext: 확장자 ex) ".exr"
+        :param padding: 프레임 번호의 자릿수 (printf와 같이 음수 부호도 한 자리로 계산)
+        :param frames: 존재하는 프레임 번호
+        """
+        self.__directory = directory
+        self.__prefix = prefix
+        self.__ext = ext
+        self.__padding = padding
+        self.__frames = tuple(sorted(frames))
+
+    def __len__(self) -> int:
+        return len(self.__frames)
+
+    def __repr__(self) -> str:
+        return f"Sequence({self.pattern!r}, {self.frame_range!r})"
+
+    @property
+    def directory(self) -> str:
+        return self.__directory
+
+    @property
+    def prefix(self) -> str:
+        return self.__prefix
+
+    @property
+    def ext(self) -> str:
+        return self.__ext
+
+    @property
+    def padding(self) -> int:
+        return self.__padding
+
+    @property
+    def frames(self) -> tuple:
+        return self.__frames
+
+    @property
+    def first(self) -> int:
+        return self.__frames[0]
+
+    @property
+    def last(self) -> int:
+        return self.__frames[-1]
+
+    @property
+    def name(self) -> str:
+        """
+        :return: prefix에서 구분자를 제외한 이름, prefix가 없으면 디렉토리명
+        """
+        name = self.__prefix.rstrip("._-")
+        return name or os.path.basename(os.path.normpath(self.__directory))
+
+    @property
+    def pattern(self) -> str:
+        """
+        :return: ffmpeg, Nuke에서 사용하는 printf 형식의 경로 ex) /plates/shot.%04d.exr
+        """
+        return os.path.join(
+            self.__directory, f"{self.__prefix}%0{self.__padding}d{self.__ext}"
+        )
+
+    @property
+    def frame_range(self) -> str:
+        """
+        :return: 연속된 프레임을 묶은 문자열 ex) "1001-1100,1102-1200"
+        """
+        return frames_to_range(self.__frames)
+
+    @property
+    def missing(self) -> list[int]:
+        """
+        :return: 첫 프레임과 마지막 프레임 사이에서 비어있는 프레임 번호
+        """
+        exists = set(self.__frames)
+        return [num for num in range(self.first, self.last + 1) if num not in exists]
+
+    def frame_path(self, frame: int) -> str:
+        """
+        :return: 해당 프레임의 파일 경로
+        """
+        # printf의 %0Nd와 같이 음수 부호를 포함하여 N자리로 채움 ex) %04d, -3 -> -003
+        return os.path.join(
+            self.__directory, f"{self.__prefix}{frame:0{self.__padding}d}{self.__ext}"
+        )
+
+
+def is_pattern(path: str) -> bool:
+    """
+    :return: 파일명이 printf 형식의 시퀀스 경로이면 True
+    """
+    return _PRINTF_PATTERN.search(os.path.basename(path)) is not None
+
+
+def find_sequence(pattern: str) -> Sequence or None:
+    """
+    :param pattern: printf 형식의 시퀀스 경로
+    :return: 디렉토리를 탐색하여 찾은 해당 패턴의 시퀀스, 없으면 None
+    탐색 결과는 디렉토리의 수정 시간 기준으로 캐시되므로 반복 호출해도 다시 읽지 않음
+    """
+    dir_path = os.path.dirname(pattern)
+    if not os.path.isdir(dir_path):
+        return None
+    sequences, _ = SingletonSequenceScanner().scan(dir_path)
+    for seq in sequences:
+        if seq.pattern == pattern:
+            return seq
+    return None
+
+
+def frames_to_range(frames) -> str:
+    """
+    :param frames: 정렬된 프레임 번호
+    :return: 연속된 프레임을 "시작-끝"으로 묶고 쉼표로 구분한 문자열
+    """
+    ranges = []
+    start = prev = None
+    for frame in frames:
+        if start is None:
+            start = prev = frame
+        elif frame == prev + 1:
+            prev = frame
+        else:
+            ranges.append(str(start) if start == prev else f"{start}-{prev}")
+            start = prev = frame
+    if start is not None:
+        ranges.append(str(start) if start == prev else f"{start}-{prev}")
+    return ",".join(ranges)
+
+
+def split_frame(file_name: str) -> tuple[str, int, int, str] or None:
+    """
+    :param file_name: 파일명
+    :return: (prefix, 프레임 번호, 자릿수, 확장자), 프레임 번호가 없으면 None
+    구분자(. 또는 _) 바로 뒤의 '-'는 음수 부호로 인식함 ex) plate.-0005.exr -> -5
+    printf의 %0Nd와 같이 음수 부호도 자릿수에 포함함 ex) plate.-003.exr -> 4자리
+    """
+    match = _FRAME_PATTERN.match(file_name)
+    if match is None:
+        return None
+    prefix = match.group("prefix") or ""
+    digits = match.group("frame")
+    frame = int(digits)
+    if prefix.endswith("-") and (len(prefix) == 1 or prefix[-2] in "._"):
+        prefix = prefix[:-1]
+        frame = -frame
+        digits = "-" + digits
+    return prefix, frame, len(digits), match.group("ext")
+
+
+class SequenceScanner:
+    def __init__(self, max_bytes: int = 32 * 1024**2):
+        """
+        :param max_bytes: 탐색 결과를 캐시할 최대 용량 (파일 하나당 약 100바이트로 계산)
+        """
+        # {디렉토리 경로: (수정 시간, 시퀀스 리스트, 나머지 파일 리스트)}
+        self.__cache = algo_lib.LRUCache(max_bytes)
+        self.__lock = threading.Lock()
+
+    def scan(self, dir_path: str) -> tuple[list[Sequence], list[str]]:
+        """
+        :param dir_path: 탐색할 디렉토리 경로
+        :return: (시퀀스 리스트, 시퀀스에 속하지 않는 파일명 리스트)
+        디렉토리의 수정 시간이 같으면 다시 읽지 않고 캐시된 결과를 반환
+        """
+        if not os.path.isdir(dir_path):
+            raise FileNotFoundError(f"Directory {dir_path} Not Found")
+        mtime = os.stat(dir_path).st_mtime_ns
+        cached = self.__cache.get(dir_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1], cached[2]
+
+        groups = dict()  # -> {(prefix, 확장자): [(프레임 번호, 자릿수)]}
+        others = []
+        count = 0
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                if not entry.is_file():
+                    continue
+                count += 1
+                parts = split_frame(entry.name)
+                if parts is None:
+                    others.append(entry.name)
+                    continue
+                prefix, frame, digits, ext = parts
+                groups.setdefault((prefix, ext), []).append((frame, digits))
+
+        sequences = []
+        for (prefix, ext), items in sorted(groups.items()):
+            # 자릿수가 가장 짧은 프레임을 패딩으로 사용 (패딩보다 큰 번호는 자릿수가 늘어남)
+            # 음수 프레임은 부호를 포함한 자릿수이므로 shot.-003 ~ shot.0002 -> 4자리
+            padding = min(digits for _, digits in items)
+            frames = [frame for frame, _ in items]
+            sequences.append(Sequence(dir_path, prefix, ext, padding, frames))
+
+        with self.__lock:
+            self.__cache.put(dir_path, (mtime, sequences, others), count * 100 + 100)
+        return sequences, others
+
+
+@algo_lib.singleton
+class SingletonSequenceScanner(SequenceScanner): ...
@@ -3,23 +3,26 @@
 
 # author        :   Juno Park
 # created date  :   2024.03.03
-# modified date :   2024.04.03
+# modified date :   2026.10.18
 # description   :   Nuke_player를 외부에서 실행할 수 있는 코드
 
 # TODO: closeEvent를 destroyPanel 기능으로 대체
 
 
+import heapq
 import importlib
+import itertools
 import os
 import subprocess
 import sys
+import threading
+from concurrent import futures
 
 os.environ["NUKE_INTERACTIVE"] = "1"
 try:
     import nuke
 except ModuleNotFoundError as err:
     print(f"\033[31mNuke Import Error: {err}\033[0m")
-import pathlib
 import platform
 
 # sys.path.append("/home/rapa/workspace/python/Nuke_player")
@@ -29,6 +32,10 @@ from view import NP_view
 from model import NP_model
 from NP_libs.qt import library as qt_lib
 from NP_libs.system import library as sys_lib
+from NP_libs.system import cache as cache_lib
+from NP_libs.system import process as process_lib
+from NP_libs.system import catalog as catalog_lib
+from NP_libs.system import sequence as sequence_lib
 from NP_libs import NP_Utils
 
 importlib.reload(NP_view)
@@ -36,74 +43,386 @@ importlib.reload(NP_model)
 importlib.reload(NP_Utils)
 importlib.reload(qt_lib)
 importlib.reload(sys_lib)
+importlib.reload(cache_lib)
+importlib.reload(process_lib)
+importlib.reload(catalog_lib)
+importlib.reload(sequence_lib)
 
 
 class Image_2_Video_Thread(QtCore.QThread):
     thread_finished = QtCore.Signal()
-
-    def __init__(self, file_path: str, thumbnail_dir: str, ext: str):
+    chunk_finished = QtCore.Signal(int, int)  # -> (완료된 청크 수, 전체 청크 수)
+
+    def __init__(
+        self,
+        sequences: dict,
+        thumbnail_dir: str,
+        chunked: bool = True,
+        max_workers: int = None,
+    ):
+        """
+        :param sequences: {출력할 영상 경로: 변환할 시퀀스}
+        :param chunked: True면 프레임 범위를 청크로 나누어 여러 ffmpeg 프로세스로 동시에 인코딩
+        :param max_workers: 시퀀스 하나를 인코딩할 때 동시에 실행할 ffmpeg 프로세스 수
+        """
         super().__init__()
-        self.__file_path = file_path
+        self.__sequences = sequences
         self.__thumb_dir = thumbnail_dir
-        self.__ext = ext
+        self.__chunked = chunked
+        self.__max_workers = max_workers
         self.__NP_util = NP_Utils
-        self.__name = os.path.basename(self.__file_path)
+        self.__outputs = []
+
+    @property
+    def outputs(self) -> dict:
+        """
+        :return: 정상적으로 변환된 {영상 경로: 시퀀스}
+        """
+        return {output: self.__sequences[output] for output in self.__outputs}
 
     def run(self):
         self.__dropped_dir()
         self.thread_finished.emit()
 
     def __dropped_dir(self):
-        self.__output = self.__NP_util.NP_Utils.images_to_video(
-            self.__file_path, self.__thumb_dir, self.__ext, self.__name
-        )
+        # 디렉토리 전체가 아닌 시퀀스의 패턴으로 변환하므로 여러 시퀀스를 각각 변환
+        # 시퀀스마다 청크 수가 다르므로 미리 계산하여 전체 청크 중 완료된 청크 수를 누적하여 전달
+        counts = []
+        for seq in self.__sequences.values():
+            if self.__chunked:
+                size = self.__NP_util.NP_Utils.chunk_size(
+                    seq.first, seq.last, self.__max_workers
+                )
+                counts.append(len(range(seq.first, seq.last + 1, size)))
+            else:
+                counts.append(1)
+        total = sum(counts)
+        finished = 0
+        for (output, seq), count in zip(self.__sequences.items(), counts):
+            if self.__chunked:
+
+                def progress(done, chunks, finished=finished):
+                    self.chunk_finished.emit(finished + done, total)
+
+                result = self.__NP_util.NP_Utils.sequence_to_video_chunked(
+                    seq.pattern,
+                    seq.first,
+                    seq.last,
+                    output,
+                    max_workers=self.__max_workers,
+                    progress=progress,
+                )
+            else:
+                result = self.__NP_util.NP_Utils.sequence_to_video(
+                    seq.pattern, seq.first, output
+                )
+                self.chunk_finished.emit(finished + 1, total)
+            finished += count
+            if result:
+                self.__outputs.append(output)
 
     def stop(self):
         self.quit()
         self.wait(10000)
 
     def cancel(self):
-        os.remove(self.__output)
+        for output in self.__outputs:
+            os.remove(output)
 
 
 class Extract_Tuhmbnails_Thread(QtCore.QThread):
     thumbnail_extract = QtCore.Signal()
-    thread_finished = QtCore.Signal()
-
-    def __init__(self, file_data: dict, thumbnail_dir: str):
+    # -> (영상 경로, {너비: 썸네일 경로 또는 QImage})
+    thumbnail_ready = QtCore.Signal(str, object)
+    # -> (영상 경로, {너비: 캐시에 저장된 썸네일 경로}), 메모리의 QImage를 경로로 교체하기 위해 사용
+    thumbnail_saved = QtCore.Signal(str, object)
+    queue_drained = QtCore.Signal()  # -> 대기 중인 작업을 모두 처리함
+
+    # 작업 우선순위, 화면에 보이는 아이템을 먼저 추출
+    PRIORITY_VISIBLE = 0
+    PRIORITY_BACKGROUND = 1
+
+    def __init__(
+        self,
+        thumb_cache: cache_lib.MediaCache,
+        max_workers: int = None,
+        in_memory: bool = True,
+        persist: bool = True,
+    ):
+        """
+        :param in_memory: True면 ffmpeg의 rawvideo 출력을 바로 QImage로 만들어 표시
+        :param persist: in_memory 모드에서 QImage를 백그라운드로 캐시에 저장할지 여부
+        패널이 열려 있는 동안 유지되며, enqueue()로 추가된 파일을 우선순위 순서로 추출
+        """
         super().__init__()
-        self.__file_data = file_data
-        self.__thumb_dir = thumbnail_dir
+        self.__thumb_cache = thumb_cache
         self.__NP_util = NP_Utils
-        self.__canceled = False
+        self.__stopped = False
+        # 동시에 실행할 ffmpeg 프로세스의 최대 개수 (기본값: CPU 코어 수)
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        self.__max_workers = max(1, max_workers)
+        self.__in_memory = in_memory
+        self.__persist = persist
+
+        # 우선순위 큐, (우선순위, 순번, 영상 경로)
+        # 우선순위가 바뀌면 항목을 새로 추가하고, 꺼낼 때 유효하지 않은 항목은 건너뜀
+        self.__queue = []
+        self.__seq = itertools.count()
+        self.__pending = set()  # -> 아직 추출을 시작하지 않은 영상 경로
+        self.__visible = set()  # -> 화면에 보이는 영상 경로
+        self.__cond = threading.Condition()
+
+    def enqueue(self, file_paths: list[str]) -> None:
+        """
+        :param file_paths: 썸네일을 추출할 영상 경로가 담긴 리스트
+        등록된 순서대로 백그라운드 우선순위로 추가
+        """
+        with self.__cond:
+            for f_path in file_paths:
+                if f_path in self.__pending:
+                    continue
+                self.__pending.add(f_path)
+                heapq.heappush(
+                    self.__queue,
+                    (self.PRIORITY_BACKGROUND, next(self.__seq), f_path),
+                )
+            self.__cond.notify()
+
+    def set_visible(self, file_paths: list[str]) -> None:
+        """
+        :param file_paths: 화면에 보이는 영상 경로가 위에서부터 담긴 리스트
+        보이는 아이템 중 아직 추출되지 않은 것을 큐의 맨 앞으로 올림
+        """
+        with self.__cond:
+            self.__visible = set(file_paths)
+            for f_path in file_paths:
+                if f_path in self.__pending:
+                    heapq.heappush(
+                        self.__queue,
+                        (self.PRIORITY_VISIBLE, next(self.__seq), f_path),
+                    )
+            self.__cond.notify()
+
+    def discard(self, file_paths: list[str]) -> None:
+        """
+        :param file_paths: 등록이 해제되어 추출하지 않을 영상 경로
+        """
+        with self.__cond:
+            self.__pending.difference_update(file_paths)
+
+    def pending_count(self) -> int:
+        """
+        :return: 아직 추출을 시작하지 않은 파일의 수
+        """
+        with self.__cond:
+            return len(self.__pending)
 
     def run(self):
-        for idx, f_path in self.__file_data.items():
-            if self.__canceled:
-                break
-            base_name = os.path.splitext(os.path.basename(f_path))[0]
-            file_name = os.path.join(self.__thumb_dir, base_name + ".jpg")
-            # 썸네일이 이미 존재하는 경우 넘어감
-            if os.path.exists(file_name):
+        running = set()
+        # 캐시 저장은 추출과 별도의 스레드에서 처리하여 썸네일 표시를 지연시키지 않음
+        writer = futures.ThreadPoolExecutor(max_workers=1)
+        busy = False  # -> 마지막으로 큐가 비워진 후 처리한 작업이 있는지 여부
+        with futures.ThreadPoolExecutor(max_workers=self.__max_workers) as executor:
+            while True:
+                with self.__cond:
+                    # 실행 중인 작업이 워커 수보다 적으면 우선순위가 높은 작업부터 추가
+                    while not self.__stopped and len(running) < self.__max_workers:
+                        f_path = self.__pop_job()
+                        if f_path is None:
+                            break
+                        running.add(executor.submit(self.__extract, f_path))
+                        busy = True
+                    if self.__stopped:
+                        break
+                    if not running:
+                        # 할 일이 없으면 새 작업이 추가될 때까지 대기
+                        if busy:
+                            busy = False
+                            self.queue_drained.emit()
+                        self.__cond.wait()
+                        continue
+                # 작업이 하나라도 끝나면 진행도 업데이트
+                done, running = futures.wait(
+                    running, return_when=futures.FIRST_COMPLETED
+                )
+                for job in done:
+                    f_path, key, thumbs = job.result()
+                    if thumbs is not None:
+                        self.thumbnail_ready.emit(f_path, thumbs)
+                        if key is not None and self.__in_memory and self.__persist:
+                            writer.submit(self.__save_images, f_path, key, thumbs)
+                    self.thumbnail_extract.emit()
+        writer.shutdown(wait=True)
+
+    def __pop_job(self) -> str or None:
+        """
+        :return: 다음으로 추출할 영상 경로, 없으면 None
+        이미 시작했거나 삭제된 항목, 더 이상 보이지 않는 항목의 우선순위는 건너뜀
+        """
+        while self.__queue:
+            priority, _, f_path = heapq.heappop(self.__queue)
+            if f_path not in self.__pending:
                 continue
-            # 썸네일 추출
-            try:
-                self.__NP_util.NP_Utils.extract_thumbnail(f_path, file_name, "1280x720")
-                self.thumbnail_extract.emit()
-            except Exception as err:
-                print(f"\033[31mERROR:{file_name} >> {err}\033[0m")
-        self.thread_finished.emit()
+            if priority == self.PRIORITY_VISIBLE and f_path not in self.__visible:
+                continue
+            self.__pending.discard(f_path)
+            return f_path
+        return None
+
+    def __extract(self, f_path: str) -> tuple[str, str or None, dict or None]:
+        """
+        :param f_path: 썸네일을 추출할 영상 경로
+        :return: 워커 스레드에서 추출을 마친 (영상 경로, 캐시 키, {너비: 썸네일}),
+                 캐시에 존재하면 키는 None, 추출에 실패하면 썸네일은 None
+        """
+        try:
+            key = self.__thumb_cache.make_key(f_path)
+        except OSError as err:
+            print(f"\033[31mERROR:{f_path} >> {err}\033[0m")
+            return f_path, None, None
+        # 캐시에 썸네일이 이미 존재하는 경우 ffmpeg를 실행하지 않음
+        thumbs = self.__thumb_cache.get_thumbnails(key)
+        if thumbs:
+            return f_path, None, thumbs
+        if self.__in_memory:
+            return f_path, key, self.__extract_images(f_path)
+
+        # 아이콘 크기별 썸네일을 한 번에 임시 파일로 추출한 뒤 캐시에 저장
+        temp_names = {
+            level: self.__thumb_cache.temp_path(
+                key, self.__thumb_cache.thumbnail_name(level)
+            )
+            for level in self.__thumb_cache.THUMBNAIL_LEVELS
+        }
+        try:
+            if self.__NP_util.NP_Utils.extract_thumbnail_levels(f_path, temp_names):
+                thumbs = {
+                    level: self.__thumb_cache.put(
+                        key, self.__thumb_cache.thumbnail_name(level), temp_name
+                    )
+                    for level, temp_name in temp_names.items()
+                }
+                return f_path, None, thumbs
+        except Exception as err:
+            print(f"\033[31mERROR:{f_path} >> {err}\033[0m")
+        return f_path, None, None
+
+    def __extract_images(self, f_path: str) -> dict or None:
+        """
+        :param f_path: 썸네일을 추출할 영상 경로
+        :return: {너비: QImage}, 추출에 실패하면 None
+        가장 큰 해상도만 ffmpeg로 추출하고, 나머지는 메모리에서 축소하여 만듦
+        """
+        levels = sorted(self.__thumb_cache.THUMBNAIL_LEVELS, reverse=True)
+        try:
+            image = self.__NP_util.NP_Utils.extract_thumbnail_image(f_path, levels[0])
+        except Exception as err:
+            print(f"\033[31mERROR:{f_path} >> {err}\033[0m")
+            return None
+        if image is None:
+            return None
+        thumbs = {levels[0]: image}
+        for level in levels[1:]:
+            thumbs[level] = image.scaledToWidth(level, QtCore.Qt.SmoothTransformation)
+        return thumbs
+
+    def __save_images(self, f_path: str, key: str, thumbs: dict) -> None:
+        """
+        :param f_path: 썸네일을 추출한 영상 경로
+        :param key: 썸네일을 저장할 캐시 키
+        :param thumbs: {너비: QImage}
+        다음 실행 시 ffmpeg 없이 불러올 수 있도록 jpg로 인코딩하여 캐시에 저장하고,
+        모든 해상도가 저장되면 모델이 QImage 대신 경로를 갖도록 thumbnail_saved로 전달
+        """
+        saved = dict()
+        for level, image in thumbs.items():
+            name = self.__thumb_cache.thumbnail_name(level)
+            temp_name = self.__thumb_cache.temp_path(key, name)
+            if image.save(temp_name, "JPG"):
+                saved[level] = self.__thumb_cache.put(key, name, temp_name)
+        if len(saved) == len(thumbs):
+            self.thumbnail_saved.emit(f_path, saved)
 
     def stop(self):
-        self.quit()
+        with self.__cond:
+            self.__stopped = True
+            self.__cond.notify()
         self.wait(10000)
         print("\n\033[31m백그라운드 스레드 정상 종료\033[0m")
 
     def cancel(self):
-        self.__canceled = True
+        with self.__cond:
+            self.__pending.clear()
+            self.__queue.clear()
         print(f"\033[31m파일 로드 중단\033[0m")
 
 
+class Extract_Filmstrip_Thread(QtCore.QThread):
+    filmstrip_ready = QtCore.Signal(str, str)  # -> (영상 경로, 필름스트립 경로)
+
+    def __init__(
+        self, file_data: dict, thumb_cache: cache_lib.MediaCache, max_workers: int = None
+    ):
+        super().__init__()
+        self.__file_data = file_data
+        self.__thumb_cache = thumb_cache
+        self.__NP_util = NP_Utils
+        self.__canceled = False
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        self.__max_workers = max(1, max_workers)
+
+    def run(self):
+        running = set()
+        with futures.ThreadPoolExecutor(max_workers=self.__max_workers) as executor:
+            for f_path in list(self.__file_data.values()):
+                if self.__canceled:
+                    break
+                # 실행 중인 작업이 워커 수만큼 있으면 하나가 끝날 때까지 대기
+                if len(running) >= self.__max_workers:
+                    done, running = futures.wait(
+                        running, return_when=futures.FIRST_COMPLETED
+                    )
+                    self.__emit_done(done)
+                running.add(executor.submit(self.__extract, f_path))
+            done, _ = futures.wait(running)
+            self.__emit_done(done)
+
+    def __emit_done(self, done: set) -> None:
+        for job in done:
+            f_path, filmstrip = job.result()
+            if filmstrip is not None:
+                self.filmstrip_ready.emit(f_path, filmstrip)
+
+    def __extract(self, f_path: str) -> tuple[str, str or None]:
+        """
+        :param f_path: 필름스트립을 추출할 영상 경로
+        :return: (영상 경로, 필름스트립 경로), 추출에 실패하면 필름스트립 경로는 None
+        캐시에 이미 존재하면 ffmpeg를 실행하지 않음
+        """
+        name = self.__thumb_cache.FILMSTRIP
+        try:
+            key = self.__thumb_cache.make_key(f_path)
+            filmstrip = self.__thumb_cache.get(key, name)
+            if filmstrip is not None:
+                return f_path, filmstrip
+            temp_name = self.__thumb_cache.temp_path(key, name)
+            if self.__NP_util.NP_Utils.extract_filmstrip(
+                f_path,
+                temp_name,
+                self.__thumb_cache.FILMSTRIP_FRAMES,
+                self.__thumb_cache.FILMSTRIP_WIDTH,
+            ):
+                return f_path, self.__thumb_cache.put(key, name, temp_name)
+        except Exception as err:
+            print(f"\033[31mERROR:{f_path} >> {err}\033[0m")
+        return f_path, None
+
+    def cancel(self):
+        self.__canceled = True
+
+
 class LoadingDialog(QtWidgets.QProgressDialog):
     # 파일 드롭 시 발생하는 다이얼로그
     def __init__(self, total_files: int, text: str, cancel_btn=True, parent=None):
@@ -169,18 +488,54 @@ class Nuke_Player(QtWidgets.QMainWindow):
         self.__NP_util.NP_Utils.make_dirs(self.__thumb_dir)
         self.__NP_util.NP_Utils.make_dirs(self.__sequence_dir)
 
-        self.__file_data = dict()  # {인덱스: 원본 파일 경로}의 형태로 데이터 저장
-        self.__file_lst = list()  # file_data의 value값을 리스트로 저장
-        self.__thumb_lst = list()  # 썸네일 디렉토리 내의 파일 경로를 리스트로 저장
+        # 썸네일을 동시에 추출할 워커 수
+        self.__thumb_workers = os.cpu_count() or 1
+        # 썸네일을 jpg 파일을 거치지 않고 메모리에서 바로 표시, 캐시에는 백그라운드로 저장
+        self.__thumb_in_memory = True
+        self.__thumb_persist = True
+        # 패널을 닫아도 유지되는 썸네일 캐시 (기본 용량 1GB)
+        self.__cache_budget = 1024**3
+        self.__thumb_total = 0  # -> 이번에 추출을 요청한 썸네일의 수
+        self.__thumb_done = 0  # -> 그중 처리가 끝난 썸네일의 수
+        self.__filmstrip_thread = None
+        self.__filmstrip_pending = False  # -> 추출 중에 새 파일이 등록되면 종료 후 다시 실행
+        self.__thumb_cache = cache_lib.SingletonMediaCache(max_bytes=self.__cache_budget)
+        # 멀티 뷰어의 프록시는 썸네일을 밀어내지 않도록 별도의 용량으로 저장 (기본 용량 8GB)
+        self.__proxy_budget = 8 * 1024**3
+        self.__proxy_cache = cache_lib.SingletonProxyCache(max_bytes=self.__proxy_budget)
+
+        self.__file_data = dict()  # {인덱스(모델의 row): 원본 파일 경로}의 형태로 데이터 저장
         self.__play_lst = list()  # 선택된 파일의 경로를 인덱스로 저장
         self.__play_lst_basename = list()  # 파일 경로의 basename만 저장
 
         # 모델 설정
-        self.__itemview_model = NP_model.NP_ItemModel(self.__thumb_lst, self.__file_lst)
+        self.__itemview_model = NP_model.NP_ItemModel(
+            filmstrip_frames=cache_lib.MediaCache.FILMSTRIP_FRAMES
+        )
         self.__item_listview.setModel(self.__itemview_model)
         self.__textview_model = NP_model.NP_ListModel(self.__play_lst)
         self.__text_listview.setModel(self.__textview_model)
 
+        # 패널이 열려 있는 동안 유지되는 썸네일 추출 스레드 (화면에 보이는 아이템 우선)
+        self.__thumb_thread = Extract_Tuhmbnails_Thread(
+            self.__thumb_cache,
+            self.__thumb_workers,
+            self.__thumb_in_memory,
+            self.__thumb_persist,
+        )
+        # 등록된 파일의 영상 정보를 asyncio로 동시에 probe (결과는 캐시에 저장됨)
+        self.__probe_concurrency = 16
+        self.__proc_runner = process_lib.AsyncProcessRunner(
+            self.__probe_concurrency,
+            self.__thumb_cache,
+            proxy_cache=self.__proxy_cache,
+        )
+        # 패널을 닫아도 등록된 영상 목록을 유지하는 카탈로그 (~/.NP_cache/catalog.db)
+        self.__catalog = catalog_lib.MediaCatalog()
+        self.__convert_thread = None
+        # 멀티 뷰어에서 고해상도 영상 대신 재생할 프록시의 너비
+        self.__proxy_width = cache_lib.MediaCache.PROXY_WIDTH
+
         # Init set
         self.setWindowIcon(
             QtGui.QIcon(
@@ -190,8 +545,10 @@ class Nuke_Player(QtWidgets.QMainWindow):
         self.__set_ui()
         self.__set_menu()
         self.__connection()
+        self.__restore_catalog()
 
         self.__item_listview.setIconSize(QtCore.QSize(229, 109))
+        self.__itemview_model.set_icon_size(self.__item_listview.iconSize())
 
     def __set_ui(self) -> None:
         """
@@ -277,6 +634,11 @@ class Nuke_Player(QtWidgets.QMainWindow):
         self.__check_viewer.setChecked(True)
         self.__check_viewer.setToolTip("Choose Viewer (V)")
         check_label.setToolTip("Choose Viewer (V)")
+        filmstrip_label = QtWidgets.QLabel("Filmstrip")
+        self.__check_filmstrip = QtWidgets.QCheckBox()
+        self.__check_filmstrip.setChecked(False)
+        self.__check_filmstrip.setToolTip("Scrub Items with Mouse (S)")
+        filmstrip_label.setToolTip("Scrub Items with Mouse (S)")
 
         # labels
         label_list = QtWidgets.QLabel("Selected Playlist")
@@ -296,6 +658,8 @@ class Nuke_Player(QtWidgets.QMainWindow):
         hbox_btn.addWidget(self.__btn_import)
         hbox_btn.addWidget(self.__btn_play)
 
+        hbox_checkBox.addWidget(filmstrip_label)
+        hbox_checkBox.addWidget(self.__check_filmstrip)
         hbox_checkBox.addWidget(check_label)
         hbox_checkBox.addWidget(self.__check_viewer)
 
@@ -440,6 +804,31 @@ class Nuke_Player(QtWidgets.QMainWindow):
         self.__item_listview.dragMoveEvent = self.__dragMove_items
         self.__item_listview.dropEvent = self.__drop_items
 
+        # 아이템 선택 시 시그널 발생 (모델을 교체하지 않으므로 한 번만 연결)
+        self.__item_listview.selectionModel().selectionChanged.connect(
+            self.__slot_selection_item
+        )
+
+        # 썸네일 추출 스레드의 결과를 모델에 바로 반영
+        self.__thumb_thread.thumbnail_ready.connect(self.__itemview_model.set_thumbnail)
+        # 캐시에 저장이 끝나면 메모리의 QImage를 해제하고 저장된 경로로 표시
+        self.__thumb_thread.thumbnail_saved.connect(self.__itemview_model.set_thumbnail)
+        self.__thumb_thread.thumbnail_extract.connect(self.__extract_finished)
+        self.__thumb_thread.queue_drained.connect(self.__thumbnails_drained)
+        self.__thumb_thread.start()
+        self.__proc_runner.probe_finished.connect(self.__slot_probe_finished)
+        self.__proc_runner.proxy_finished.connect(self.__slot_proxy_finished)
+        self.__proc_runner.start()
+        # 스크롤 등으로 보이는 아이템이 바뀌면 추출 우선순위 갱신
+        self.__item_listview.visible_changed.connect(self.__slot_visible_changed)
+
+        # 필름스트립 모드에서 마우스 위치에 따라 아이템의 프레임 탐색
+        self.__check_filmstrip.toggled.connect(self.__slot_filmstrip_toggled)
+        self.__item_listview.scrub.connect(
+            lambda idx, ratio: self.__itemview_model.set_scrub(idx.row(), ratio)
+        )
+        self.__item_listview.scrub_left.connect(self.__itemview_model.clear_scrub)
+
         # 우클릭 시 컨텍스트 메뉴 발생
         self.__item_listview.customContextMenuRequested.connect(self.__slot_context)
 
@@ -452,8 +841,13 @@ class Nuke_Player(QtWidgets.QMainWindow):
     def closeEvent(self, event) -> None:
         """
         :param event: 메인 UI 종료 이벤트
-        메인 UI 종료 시 임시 디렉토리 삭제
+        메인 UI 종료 시 임시 디렉토리 삭제, 썸네일 캐시는 ~/.NP_cache에 유지됨
         """
+        if self.__filmstrip_thread is not None:
+            self.__filmstrip_thread.cancel()
+        self.__thumb_thread.stop()
+        self.__proc_runner.stop()
+        self.__catalog.close()
         self.__NP_util.NP_Utils.remove_dirs(self.__thumb_dir)
 
     def keyPressEvent(self, event: QtGui.QKeyEvent) -> None:
@@ -474,6 +868,8 @@ class Nuke_Player(QtWidgets.QMainWindow):
                 self.__check_viewer.setChecked(False)
             else:
                 self.__check_viewer.setChecked(True)
+        elif event.key() == QtCore.Qt.Key_S:
+            self.__check_filmstrip.setChecked(not self.__check_filmstrip.isChecked())
         elif event.key() == QtCore.Qt.Key_I:
             self.__slot_import_on_nuke()
         elif event.key() in [
@@ -513,94 +909,229 @@ class Nuke_Player(QtWidgets.QMainWindow):
         if event.mimeData().hasUrls():
             event.setDropAction(QtCore.Qt.CopyAction)
             urls = event.mimeData().urls()
+            registered = set(self.__file_data.values())
+            new_lst = list()  # -> 이번에 새로 등록된 파일만 저장
 
             # 파일 경로 저장
-            for idx, url in enumerate(urls):
+            for url in urls:
                 file_path = url.toLocalFile()
                 url_str = url.toString()
                 # 드롭된 아이템이 디렉토리인 경우
                 if os.path.isdir(file_path):
                     self.__dropped_dir(file_path)
-                    return
+                    break
 
                 # 파일 유형이 영상이 맞는지 확인
                 elif not self.__NP_util.NP_Utils.is_file_video(url_str):
                     print(f"\033[31mERROR: '{file_path}'는 지원하지 않는 형식입니다.\033[0m")
                     ext = os.path.splitext(os.path.basename(file_path))[1]
                     self.__slot_messagebox("File Type", ext)
-                    return
+                    continue
 
                 # 파일이 이미 등록되어 있는지 확인
-                if file_path in self.__file_data.values():
-                    # print(f"\033[31mERROR: '{file_path}'가 이미 등록되었습니다.\033[0m")
+                if file_path in registered:
                     continue
+                registered.add(file_path)
+                new_lst.append(file_path)
 
-                # 딕셔너리에 {인덱스: 파일 경로}의 형태로 데이터 저장
-                if idx in self.__file_data.keys():
-                    last_idx = list(self.__file_data.keys())[-1]
-                    self.__file_data[last_idx + 1] = file_path
-                # 인덱스가 이미 존재하는 경우 파일경로 덮어쓰기
-                else:
-                    self.__file_data[idx] = file_path
-
-            # 썸네일 추출 스레드 생성 및 실행
-            self.__thumb_thread = Extract_Tuhmbnails_Thread(
-                self.__file_data, self.__thumb_dir
-            )
-            self.__thumb_thread.thumbnail_extract.connect(self.__extract_finished)
-            self.__thumb_thread.finished.connect(self.__thread_stopped)
-            self.__thumb_thread.start()
-
-            # 로딩 다이얼로그 생성 및 실행
-            self.__loading_dialog = LoadingDialog(len(urls), "파일을 로드 중입니다.")
-            self.__loading_dialog.setWindowModality(QtCore.Qt.ApplicationModal)
-            self.__loading_dialog.canceled.connect(
-                self.__thumb_thread.cancel
-            )  # -> 다이얼로그를 닫을 경우 스레드 중단
-            self.__thumb_thread.thumbnail_extract.connect(
-                self.__loading_dialog.increase_value
-            )  # -> 썸네일이 추출될 때마다 진행도 업데이트
-            self.__loading_dialog.show()
+            if not new_lst:
+                event.acceptProposedAction()
+                return
+            self.__register_files(new_lst)
+            # 썸네일은 다이얼로그 없이 백그라운드에서 추출 (보이는 아이템 우선)
+            self.__queue_thumbnails(new_lst)
 
             event.acceptProposedAction()
         else:
             event.ignore()
 
+    def __register_files(
+        self, file_paths: list[str], sequence_dir: str = None, record: bool = True
+    ) -> dict:
+        """
+        :param file_paths: 새로 등록할 파일 경로가 담긴 리스트
+        :param sequence_dir: 이미지 시퀀스를 변환한 영상인 경우 원본 디렉토리
+        :param record: 카탈로그에 저장할지 여부 (카탈로그에서 복원하는 경우 False)
+        :return: 새로 등록된 {인덱스: 파일 경로}
+        파일 데이터의 마지막 인덱스 뒤에 추가하고 모델에도 같은 순서로 row를 삽입
+        """
+        new_data = dict()
+        for f_path in file_paths:
+            new_idx = len(self.__file_data)
+            self.__file_data[new_idx] = f_path
+            new_data[new_idx] = f_path
+        self.__itemview_model.add_items(list(new_data.values()))
+        if record:
+            self.__catalog.add(file_paths, sequence_dir)
+        return new_data
+
+    def __restore_catalog(self) -> None:
+        """
+        이전에 등록했던 영상을 카탈로그에서 복원
+        디렉토리를 다시 탐색하거나 probe하지 않으며, 썸네일은 보이는 아이템부터 캐시에서 불러옴
+        """
+        entries = self.__catalog.load()
+        if not entries:
+            return
+        paths = []
+        probe_paths = []  # -> probe 정보가 저장되지 않은 항목
+        proxy_paths = []  # -> 프록시가 필요한 고해상도 항목 (캐시에 있으면 생성하지 않음)
+        removed = []
+        for entry in entries:
+            # 변환된 시퀀스는 임시 디렉토리와 함께 삭제되므로 남아있는 경우에만 복원
+            # 시퀀스 경로는 디렉토리만 확인 (프레임은 재생 시 탐색)
+            if sequence_lib.is_pattern(entry.path):
+                exists = os.path.isdir(os.path.dirname(entry.path))
+            else:
+                exists = os.path.exists(entry.path)
+            if entry.sequence_dir is not None and not exists:
+                removed.append(entry.path)
+                continue
+            paths.append(entry.path)
+            if entry.info is None:
+                probe_paths.append(entry.path)
+            elif entry.info.is_high_resolution and not sequence_lib.is_pattern(entry.path):
+                proxy_paths.append(entry.path)
+        if removed:
+            self.__catalog.remove(removed)
+        self.__register_files(paths, record=False)
+        self.__queue_thumbnails(paths, probe_paths)
+        self.__proc_runner.make_proxies(proxy_paths, self.__proxy_width)
+
+    def __queue_thumbnails(
+        self, file_paths: list[str], probe_paths: list[str] = None
+    ) -> None:
+        """
+        :param file_paths: 썸네일을 추출할 파일 경로가 담긴 리스트
+        :param probe_paths: 영상 정보를 추출할 파일 경로 (기본값: file_paths)
+        추출 스레드의 큐와 probe 큐에 추가하고, 진행 상황은 상태 표시줄에 표시
+        """
+        self.__thumb_total += len(file_paths)
+        self.__thumb_thread.enqueue(file_paths)
+        # 재생 시 다시 probe하지 않도록 등록 시점에 영상 정보를 한 번만 추출하여 저장
+        if probe_paths is None:
+            probe_paths = file_paths
+        self.__proc_runner.probe(probe_paths)
+        self.__slot_visible_changed()
+        self.__lineEdit_debug.setText(
+            f"썸네일 추출 중... ({self.__thumb_done}/{self.__thumb_total})"
+        )
+
+    def __slot_visible_changed(self) -> None:
+        """
+        현재 화면에 보이는 아이템을 썸네일 추출 큐의 맨 앞으로 올림
+        """
+        visible = [
+            self.__file_data[row]
+            for row in self.__item_listview.visible_rows()
+            if row in self.__file_data
+        ]
+        self.__thumb_thread.set_visible(visible)
+
     def __dropped_dir(self, dir_path: str) -> None:
         """
         :param dir_path: 드롭된 directory의 로컬 경로
-        디렉토리가 등록된 경우, 해당 디렉토리에 이미지 시퀀스가 존재하면 이미지 시퀀스를 영상으로 변환하여
-        임시 디렉토리에 저장함
+        디렉토리가 등록된 경우, 하위 디렉토리까지 탐색하여 영상은 그대로 등록하고
+        이미지 시퀀스는 영상으로 변환하지 않고 printf 형식의 경로로 등록하여 SequencePlayer로 바로 재생함
         """
-        # 이미지 시퀀스
-        sequence = self.__NP_util.NP_Utils.is_image_sequence(dir_path)
-        # 이미지 확장자명
-        if not len(sequence):
+        registered = set(self.__file_data.values())
+        videos = list()  # -> 이번에 새로 등록된 영상의 경로
+        seq_dirs = set()  # -> 프레임 번호가 붙은 파일이 있는 디렉토리
+        # scandir 기반의 탐색으로 하위 디렉토리를 동시에 읽으며 찾는 즉시 분류
+        for f_path in sys_lib.System.walk_files(dir_path, ["*"]):
+            if self.__NP_util.NP_Utils.is_file_video(f_path):
+                if f_path not in registered:
+                    videos.append(f_path)
+            elif sequence_lib.split_frame(os.path.basename(f_path)) is not None:
+                seq_dirs.add(os.path.dirname(f_path))
+        videos.sort()
+
+        # 디렉토리마다 한 번의 탐색으로 시퀀스를 모두 찾음 (같은 디렉토리는 캐시된 결과 사용)
+        sequences = []
+        for seq_dir in sorted(seq_dirs):
+            sequences += sequence_lib.SingletonSequenceScanner().scan(seq_dir)[0]
+        new_seqs = dict()  # -> {시퀀스의 디렉토리: 이번에 새로 등록된 시퀀스의 경로}
+        for seq in sequences:
+            # 두 장 이상의 이미지로 구성된 시퀀스만 등록
+            if len(seq) < 2 or not self.__NP_util.NP_Utils.is_file_image(
+                seq.frame_path(seq.first)
+            ):
+                continue
+            # 시퀀스에 비어있는 이미지가 있는지 확인
+            missing = seq.missing
+            if missing:
+                self.__slot_messagebox(
+                    "Missing",
+                    f"{sequence_lib.frames_to_range(missing)} 프레임"
+                    f"({seq.name}: {seq.frame_range})",
+                )
+                continue
+            # 이미 등록된 시퀀스는 제외
+            if seq.pattern in registered:
+                continue
+            new_seqs.setdefault(seq.directory, []).append(seq.pattern)
+
+        new_lst = list(videos)
+        if videos:
+            self.__register_files(videos)
+        # 시퀀스는 샷 이름을 디렉토리명으로 저장하므로 디렉토리별로 등록
+        for seq_dir, patterns in new_seqs.items():
+            self.__register_files(patterns, seq_dir)
+            new_lst += patterns
+        if not new_lst:
             return
-        ext = os.path.splitext(os.path.basename(sequence[0]))[1]
-        missing_num = self.__NP_util.NP_Utils.exist_missing_numbers(dir_path, ext)
-        # 시퀀스에 비어있는 이미지가 있는지 확인
-        if missing_num:
-            self.__slot_messagebox("Missing", missing_num)
+        self.__queue_thumbnails(new_lst)
+
+    def __slot_convert_sequences(self) -> None:
+        """
+        선택된 시퀀스를 영상으로 변환하여 등록
+        시퀀스마다 프레임 범위를 청크로 나누어 동시에 인코딩하며, 진행 상황은 청크 단위로 표시
+        """
+        if self.__convert_thread is not None and self.__convert_thread.isRunning():
+            self.__lineEdit_debug.setText("ERROR: 이미 시퀀스를 변환 중입니다")
             return
-        # 디렉토리에 시퀀스 이외의 파일이 존재하는 지 확인
-        for file in os.listdir(dir_path):
-            if file not in sequence:
-                self.__slot_messagebox("Sequence", file)
-                return
-        # 이미 등록된 디렉토리의 경우 return
-        real_path = os.path.join(
-            self.__sequence_dir, os.path.basename(dir_path) + ".mp4"
-        )
-        if real_path in self.__file_data.values():
+        registered = set(self.__file_data.values())
+        convert = dict()  # -> {출력할 영상 경로: 시퀀스}
+        for f_path in self.__play_lst:
+            if not sequence_lib.is_pattern(f_path):
+                continue
+            seq = sequence_lib.find_sequence(f_path)
+            if seq is None:
+                continue
+            # 비어있는 프레임이 있으면 ffmpeg가 해당 프레임에서 멈추므로 제외
+            missing = seq.missing
+            if missing:
+                self.__slot_messagebox(
+                    "Missing",
+                    f"{sequence_lib.frames_to_range(missing)} 프레임"
+                    f"({seq.name}: {seq.frame_range})",
+                )
+                continue
+            # 이미 변환된 시퀀스는 제외
+            output = os.path.join(self.__sequence_dir, f"{seq.name} [sequence].mp4")
+            if output in registered:
+                continue
+            convert[output] = seq
+        if not convert:
+            self.__lineEdit_debug.setText("ERROR: 변환할 시퀀스가 선택되지 않았습니다")
             return
 
         self.__loading_dialog_ = LoadingDialog(0, "시퀀스를 비디오로 변환 중입니다.", None)
         self.__loading_dialog_.show()
-        self.__convert_thread = Image_2_Video_Thread(dir_path, self.__sequence_dir, ext)
+        self.__convert_thread = Image_2_Video_Thread(convert, self.__sequence_dir)
+        self.__convert_thread.chunk_finished.connect(self.__slot_convert_progress)
         self.__convert_thread.thread_finished.connect(self.__thread_finished)
         self.__convert_thread.start()
 
+    def __slot_convert_progress(self, done: int, total: int) -> None:
+        """
+        :param done: 인코딩이 끝난 청크 수
+        :param total: 전체 청크 수
+        """
+        self.__loading_dialog_.setMaximum(total)
+        self.__loading_dialog_.setValue(done)
+        self.__lineEdit_debug.setText(f"시퀀스 변환 중... ({done}/{total})")
+
     def __thread_finished(self) -> None:
         """
         시퀀스 변환 스레드 종료 후 데이터 저장 및 썸네일 생성, UI 새로고침
@@ -609,72 +1140,93 @@ class Nuke_Player(QtWidgets.QMainWindow):
         self.__convert_thread.wait()
         self.__loading_dialog_.hide()
 
-        for file in os.listdir(self.__sequence_dir):
-            new_seq = os.path.join(self.__sequence_dir, file)
-            if not self.__file_data:
-                self.__file_data[0] = new_seq
-            else:
-                if new_seq in self.__file_data.values():
-                    continue
-                last_idx = max(self.__file_data.keys())
-                new_idx = last_idx + 1
-                self.__file_data[new_idx] = new_seq
-
-        # 썸네일 추출 스레드 생성 및 실행
-        self.__seq_thumb_thread = Extract_Tuhmbnails_Thread(
-            self.__file_data, self.__thumb_dir
-        )
-        self.__seq_thumb_thread.thumbnail_extract.connect(self.__extract_finished)
-        self.__seq_thumb_thread.finished.connect(self.__seq_thread_stopped)
-        self.__seq_thumb_thread.start()
+        registered = set(self.__file_data.values())
+        new_lst = list()  # -> 이번에 새로 등록된 영상만 저장
+        for output, seq in self.__convert_thread.outputs.items():
+            if output in registered:
+                continue
+            self.__register_files([output], seq.directory)
+            new_lst.append(output)
+        if new_lst:
+            self.__queue_thumbnails(new_lst)
 
-        # 로딩 다이얼로그 생성 및 실행
-        self.__seq_loading_dialog = LoadingDialog(0, "파일을 로드 중입니다.")
-        self.__seq_loading_dialog.setWindowModality(QtCore.Qt.ApplicationModal)
-        # self.__seq_loading_dialog.canceled.connect(
-        #     self.__seq_loading_dialog_cancel
-        # )  # -> 다이얼로그를 닫을 경우 스레드 중단
-        self.__seq_loading_dialog.show()
+    def __slot_probe_finished(
+        self, f_path: str, info: cache_lib.MediaInfo or None
+    ) -> None:
+        """
+        :param f_path: probe가 끝난 영상 경로
+        :param info: 추출된 영상 정보, 실패한 경우 None
+        다음 실행 시 다시 probe하지 않도록 카탈로그에 저장하고,
+        고해상도 영상은 멀티 뷰어에서 재생할 프록시를 백그라운드로 생성
+        """
+        if info is None:
+            return
+        self.__catalog.set_media_info(f_path, info)
+        if info.is_high_resolution and not sequence_lib.is_pattern(f_path):
+            self.__proc_runner.make_proxies([f_path], self.__proxy_width)
 
-    def __seq_thread_stopped(self) -> None:
+    def __slot_proxy_finished(self, f_path: str, proxy: str or None) -> None:
         """
-        스레드가 종료된 후 로딩 다이얼로그 숨김, 시그널 초기화
+        :param f_path: 프록시 생성이 끝난 영상 경로
+        :param proxy: 생성된 프록시 경로, 실패한 경우 None
         """
-        self.__seq_loading_dialog.hide()
+        if proxy is None:
+            print(f"\033[31mERROR: 프록시 생성 실패 >> {f_path}\033[0m")
 
-        # 아이템 선택 시 시그널 발생
-        self.__item_listview.selectionModel().selectionChanged.connect(
-            self.__slot_selection_item
-        )
+    def __thumbnails_drained(self) -> None:
+        """
+        대기 중인 썸네일을 모두 추출한 후 진행 상황 초기화 및 필름스트립 추출
+        """
+        self.__thumb_total = 0
+        self.__thumb_done = 0
+        self.__lineEdit_debug.setText("파일을 선택하세요")
+        self.__start_filmstrip()
 
-    def __thread_stopped(self) -> None:
+    def __slot_filmstrip_toggled(self, checked: bool) -> None:
         """
-        스레드가 종료된 후 로딩 다이얼로그 숨김, 시그널 초기화
+        :param checked: 필름스트립 체크박스의 상태
+        체크되면 등록된 파일의 필름스트립을 추출하고 마우스 탐색을 활성화
         """
-        self.__loading_dialog.hide()
+        self.__item_listview.set_scrub_enabled(checked)
+        if checked:
+            self.__start_filmstrip()
 
-        # 아이템 선택 시 시그널 발생
-        self.__item_listview.selectionModel().selectionChanged.connect(
-            self.__slot_selection_item
+    def __start_filmstrip(self) -> None:
+        """
+        필름스트립 모드인 경우 등록된 모든 파일의 필름스트립을 백그라운드에서 추출
+        캐시에 존재하는 필름스트립은 바로 반영되므로 이미 추출된 파일은 다시 추출하지 않음
+        """
+        if not self.__check_filmstrip.isChecked() or not self.__file_data:
+            return
+        if self.__filmstrip_thread is not None and self.__filmstrip_thread.isRunning():
+            self.__filmstrip_pending = True
+            return
+        self.__filmstrip_pending = False
+        self.__filmstrip_thread = Extract_Filmstrip_Thread(
+            dict(self.__file_data), self.__thumb_cache, self.__thumb_workers
+        )
+        self.__filmstrip_thread.filmstrip_ready.connect(
+            self.__itemview_model.set_filmstrip
         )
+        self.__filmstrip_thread.finished.connect(self.__filmstrip_stopped)
+        self.__filmstrip_thread.start()
+
+    def __filmstrip_stopped(self) -> None:
+        """
+        추출 중에 새로 등록된 파일이 있으면 다시 실행
+        """
+        if self.__filmstrip_pending:
+            self.__start_filmstrip()
 
     def __extract_finished(self) -> None:
         """
-        썸네일이 추출될 때마다 모델을 업데이트하고 UI를 새로고침 함
+        썸네일이 추출될 때마다 상태 표시를 갱신
+        모델은 thumbnail_ready 시그널로 해당 row만 갱신되므로 다시 만들지 않음
         """
-        # 썸네일 디렉토리의 파일 검색 후 모델 새로고침
-        self.__thumb_lst = list(
-            map(
-                lambda x: x.as_posix(),
-                sys_lib.System.get_files_lst(pathlib.Path(self.__thumb_dir), ".jpg"),
-            )
+        self.__thumb_done += 1
+        self.__lineEdit_debug.setText(
+            f"썸네일 추출 중... ({self.__thumb_done}/{self.__thumb_total})"
         )
-        self.__file_lst = list(self.__file_data.values())
-        self.__itemview_model = NP_model.NP_ItemModel(self.__thumb_lst, self.__file_lst)
-        self.__item_listview.setModel(self.__itemview_model)
-
-        # 로딩 바 종료
-        self.__lineEdit_debug.setText("파일을 선택하세요")
 
     def __slot_del_file(self) -> None:
         """
@@ -686,43 +1238,39 @@ class Nuke_Player(QtWidgets.QMainWindow):
             self.__lineEdit_debug.setText("ERROR: 삭제할 파일이 선택되지 않았습니다")
             self.__slot_messagebox("Delete")
             return
-        selected_idx = self.__item_listview.selectedIndexes()
-        for f_path in self.__play_lst[:]:
+        # 뒤쪽 row부터 삭제해야 앞쪽 row의 인덱스가 바뀌지 않음
+        selected_rows = sorted(
+            {idx.row() for idx in self.__item_listview.selectedIndexes()}, reverse=True
+        )
+        # 선택 초기화 (선택 해제 시그널로 플레이 리스트도 함께 정리됨)
+        self.__item_listview.clearSelection()
+        for row in selected_rows:
+            f_path = self.__file_data.get(row)
+            # 파일이 등록되어 있는지 검증
+            if f_path is None:
+                self.__lineEdit_debug.setText("ERROR: 삭제할 파일이 존재하지 않습니다")
+                self.__slot_messagebox("File")
+                return
             # 리스트에 추가
             del_lst.append(os.path.basename(f_path))
-            # 썸네일 삭제
-            thumbs = os.path.splitext(os.path.basename(f_path))[0] + ".jpg"
-            thumbs_path = os.path.join(self.__thumb_dir, thumbs)
             dir_path = os.path.join(
                 self.__sequence_dir,
                 os.path.splitext(os.path.basename(f_path))[0] + ".mp4",
             )
-            # 파일이 존재하는지 검증
-            if not os.path.exists(thumbs_path):
-                self.__lineEdit_debug.setText("ERROR: 삭제할 파일이 존재하지 않습니다")
-                self.__slot_messagebox("File")
-                return
-            # 썸네일 제거
-            os.remove(thumbs_path)
+            # 아직 추출되지 않은 썸네일은 추출하지 않고, 카탈로그에서도 제거
+            self.__thumb_thread.discard([f_path])
+            self.__catalog.remove([f_path])
+            # 썸네일은 다음에 다시 사용할 수 있도록 캐시에 남겨두고 변환된 시퀀스만 제거
             if os.path.exists(dir_path):
                 os.remove(dir_path)
-            # 썸네일 리스트 초기화
-            self.__thumb_lst.remove(thumbs_path)
-            # 파일 데이터 초기화
+            # 모델 Row값 삭제
+            self.__itemview_model.removeRow(row)
+            # 파일 데이터 초기화 (인덱스가 모델의 row와 같도록 재부여됨)
             self.__file_data = self.__NP_util.NP_Utils.delete_key_from_value(
                 self.__file_data, f_path
             )
-            # 파일 리스트 초기화
-            self.__file_lst = list(self.__file_data.values())
-            for idx in selected_idx:
-                # 모델 Row값 삭제
-                self.__itemview_model.removeRow(idx.row())
-                # 선택 초기화
-                self.__item_listview.clearSelection()
-                # 플레이 리스트 초기화
-                self.__play_lst.clear()
-                # UI 새로고침
-                self.__itemview_model.layoutChanged.emit()
+        # 플레이 리스트 초기화
+        self.__play_lst.clear()
         self.__lineEdit_debug.setText(f"{len(del_lst)}개 항목 삭제됨")
 
     def __slot_chg_text_idx(self, move: str) -> None:
@@ -837,7 +1385,8 @@ class Nuke_Player(QtWidgets.QMainWindow):
             box = self.__NP_util.QuestionMessageBox(self.__icon_error)
             box.setWindowTitle("Resolution Warning")
             box.setText(
-                "\n고해상도 영상을 멀티 뷰어로 재생할 경우 프레임 드랍이 발생할 수 있습니다." "\n싱글 뷰어로 재생하는 것을 권장합니다."
+                "\n고해상도 영상의 프록시를 생성 중입니다."
+                "\n완료 전에 멀티 뷰어로 재생할 경우 프레임 드랍이 발생할 수 있습니다."
             )
             res = box.exec_()
             if res:
@@ -867,13 +1416,18 @@ class Nuke_Player(QtWidgets.QMainWindow):
                 "[F1 ~ F3]            아이콘 크기 조절\n"
                 "[Delete]              등록된 영상 삭제\n"
                 "[V]                      체크박스 선택/해제\n"
+                "[S]                       필름스트립 탐색 선택/해제\n"
                 "[I]                       노드 삽입\n"
                 "[Enter, P]            영상 재생\n"
                 "\n"
                 "           <Single Viewer>\n"
-                "[Up, Space, K]    재생 / 일시정지\n"
-                "[Right, L]            맨 끝으로 이동\n"
-                "[Left, J]               맨 앞으로 이동\n"
+                "[Up, Space]         재생 / 일시정지\n"
+                "[L]                       정방향 재생 (반복 입력 시 2, 4배속)\n"
+                "[J]                        역방향 재생 (반복 입력 시 2, 4배속)\n"
+                "[Shift + J, L]        슬로우 모션 (0.5, 0.25배속)\n"
+                "[K]                       일시정지\n"
+                "[, / .]                   이전 / 다음 프레임\n"
+                "[Left / Right]        이전 / 다음 영상\n"
                 "[Down, Q]           정지\n"
                 "[R]                      반복 재생\n"
                 "[V]                      표시 형식 변경\n"
@@ -885,7 +1439,8 @@ class Nuke_Player(QtWidgets.QMainWindow):
                 "[K, Down]           일시정지\n"
                 "[J, Left]               정지\n"
                 "[M]                     표시 형식 변경\n"
-                "[P]                      반복 재생"
+                "[P]                      반복 재생\n"
+                "[, / .]                   이전 / 다음 프레임"
             )
             box.exec_()
 
@@ -921,6 +1476,10 @@ class Nuke_Player(QtWidgets.QMainWindow):
             act_2 = menu.addAction("Delete")
             act_1.triggered.connect(self.__slot_menu_file1)
             act_2.triggered.connect(self.__slot_del_file)
+            # 선택된 항목 중 시퀀스가 있으면 영상 변환 메뉴 표시
+            if any(sequence_lib.is_pattern(f_path) for f_path in self.__play_lst):
+                act_3 = menu.addAction("Convert to Video")
+                act_3.triggered.connect(self.__slot_convert_sequences)
             menu.exec_(self.__item_listview.mapToGlobal(point))
 
     def __slot_menu_file1(self) -> None:
@@ -1034,18 +1593,18 @@ class Nuke_Player(QtWidgets.QMainWindow):
                 self.__slot_messagebox("Playlist")
                 return
 
-            # 4k 이상의 해상도를 가진 파일의 수 확인
+            # 프록시가 아직 없는 4k 이상의 영상 확인 (등록 시 캐시된 영상 정보를 사용)
+            # 멀티 뷰어는 프록시가 있으면 자동으로 프록시를 재생함
             over_lst = []
             for f_path in self.__play_lst:
-                (
-                    total_pixel,
-                    width,
-                    height,
-                ) = self.__NP_util.NP_Utils.get_video_resolution(f_path)
-                if total_pixel > 8294000 or (width > 3000 and height > 2000):
-                    over_lst.append(total_pixel)
-
-            # 4k 해상도의 영상을 멀티 뷰어로 재생하는 경우 알림 발생
+                info = self.__NP_util.NP_Utils.get_media_info(f_path)
+                if not info.is_high_resolution or sequence_lib.is_pattern(f_path):
+                    continue
+                if self.__NP_util.NP_Utils.get_proxy(f_path, self.__proxy_width) is None:
+                    over_lst.append(f_path)
+            self.__proc_runner.make_proxies(over_lst, self.__proxy_width)
+
+            # 프록시가 없는 4k 해상도의 영상을 멀티 뷰어로 재생하는 경우 알림 발생
             if len(over_lst) and len(self.__play_lst) > 1:
                 # 사용자가 재생을 거부했을 경우 return
                 if not self.__slot_play_alert("Resolution"):
@@ -1083,6 +1642,11 @@ class Nuke_Player(QtWidgets.QMainWindow):
         y_position = 0  # -> Y 포지션
         for v_path in self.__play_lst:
             # 스크립트가 Nuke에서 실행되지 않은 경우 예외처리
+            # 시퀀스는 프레임 범위를 함께 지정 ex) /plates/shot.%04d.exr 1001-1100
+            if sequence_lib.is_pattern(v_path):
+                seq = sequence_lib.find_sequence(v_path)
+                if seq is not None:
+                    v_path = f"{v_path} {seq.first}-{seq.last}"
             try:
                 read_node = nuke.createNode("Read")
                 read_node["file"].fromUserText(v_path)
@@ -1107,6 +1671,7 @@ class Nuke_Player(QtWidgets.QMainWindow):
         icon_w = int(main_size.width() / aspect - adjust)
         icon_h = int(main_size.height() / aspect - adjust)
         self.__item_listview.setIconSize(QtCore.QSize(icon_w, icon_h))
+        self.__itemview_model.set_icon_size(QtCore.QSize(icon_w, icon_h))
 
         # 아이콘 사이즈 별 UI 설정
         if aspect == 2:
@@ -3,45 +3,321 @@
 
 # author        :   Juno Park
 # created date  :   2024.03.03
-# modified date :   2024.03.23
+# modified date :   2026.10.18
 # description   :   mvc 패턴으로 구성된 Nuke_player의 model 역할을 하는 클래스
 #                   Item을 관리하는 ListView의 model과 Text를 관리하는 ListView의 model로 구성됨
 
 import os
 from PySide2 import QtCore, QtGui
+from NP_libs.algorithm import library as algo_lib
 
 
 class NP_ItemModel(QtCore.QAbstractListModel):  # -> Item과 관련된 데이터를 관리하는 model
-    def __init__(self, thumb_path_lst: list[str], video_path: list[str], parent=None):
+    def __init__(
+        self,
+        thumb_path_lst: list[dict] = None,
+        video_path: list[str] = None,
+        parent=None,
+        icon_cache_bytes: int = 256 * 1024**2,
+        filmstrip_frames: int = 10,
+    ):
         super().__init__(parent)
-        self.__thumb_path_lst = thumb_path_lst  # 썸네일 경로가 담긴 리스트
-        self.__video_path_lst = video_path  # 영상 경로가 담긴 리스트
+        self.__video_path_lst = list(video_path or [])  # 영상 경로가 담긴 리스트
+        # {썸네일 너비: 썸네일 경로 또는 QImage}가 담긴 리스트, 아직 추출되지 않은 항목은 None
+        self.__thumb_path_lst = list(thumb_path_lst or [])
+        self.__thumb_path_lst += [None] * (
+            len(self.__video_path_lst) - len(self.__thumb_path_lst)
+        )
+        # 필름스트립 경로가 담긴 리스트, 아직 추출되지 않은 항목은 None
+        self.__filmstrip_lst = [None] * len(self.__video_path_lst)
+        self.__filmstrip_frames = filmstrip_frames
+        self.__scrub = None  # -> 마우스로 탐색 중인 (row, 프레임 번호)
+        self.__row_map = dict()  # {영상 경로: row}, 썸네일 갱신 시 row를 찾기 위해 사용
+        self.__update_row_map()
+
+        # 디코딩 후 아이콘 크기로 축소한 QIcon 캐시, {(썸네일 키, 너비, 높이): QIcon}
+        self.__icon_cache = algo_lib.LRUCache(icon_cache_bytes)
+        self.__icon_keys = dict()  # {썸네일 키: 캐시에 저장된 키}, 무효화 시 사용
+        self.__icon_size = QtCore.QSize(229, 109)
+        self.__placeholder = None  # -> 썸네일이 추출되기 전 표시할 아이콘
 
     def data(self, index, role=QtCore.Qt.DisplayRole):
         # 아이템의 썸네일 표시
         if role == QtCore.Qt.DecorationRole:
             if 0 <= index.row() < len(self.__thumb_path_lst):
-                pixmap = QtGui.QPixmap(self.__thumb_path_lst[index.row()])
-                icon = QtGui.QIcon(pixmap)
-                return icon
-        # 아이템의 이름을 텍스트로 표시
+                # 탐색 중인 아이템은 필름스트립에서 마우스 위치의 프레임을 표시
+                if self.__scrub is not None and self.__scrub[0] == index.row():
+                    filmstrip = self.__filmstrip_lst[index.row()]
+                    if filmstrip is not None:
+                        return self.__get_frame_icon(filmstrip, self.__scrub[1])
+                thumbs = self.__thumb_path_lst[index.row()]
+                if thumbs is None:
+                    return self.__get_placeholder()
+                return self.__get_icon(self.__pick_level(thumbs))
+        # 아이템의 이름을 텍스트로 표시 (썸네일은 캐시 키로 저장되므로 원본 경로를 사용)
         elif role == QtCore.Qt.DisplayRole:
-            if 0 <= index.row() < len(self.__thumb_path_lst):
+            if 0 <= index.row() < len(self.__video_path_lst):
                 file_name = os.path.splitext(
-                    os.path.basename(self.__thumb_path_lst[index.row()])
+                    os.path.basename(self.__video_path_lst[index.row()])
                 )[0]
                 return file_name
         # 아이템의 툴팁 표시
         elif role == QtCore.Qt.ToolTipRole:
-            file_path = f"{self.__video_path_lst[index.row()]}"
-            return file_path
+            if 0 <= index.row() < len(self.__video_path_lst):
+                file_path = f"{self.__video_path_lst[index.row()]}"
+                return file_path
         return None
 
-    def rowCount(self, parent=...) -> int:
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        """
+        :return: 등록된 영상의 수를 int로 반환
+        """
+        if parent.isValid():
+            return 0
+        return len(self.__video_path_lst)
+
+    def add_items(self, video_paths: list[str]) -> None:
+        """
+        :param video_paths: 추가할 영상 경로가 담긴 리스트
+        모델을 새로 만들지 않고 마지막 row 뒤에 한 번에 삽입하여 뷰의 선택, 스크롤 상태를 유지
+        """
+        if not video_paths:
+            return
+        first = len(self.__video_path_lst)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(video_paths) - 1)
+        for row, v_path in enumerate(video_paths, first):
+            self.__video_path_lst.append(v_path)
+            self.__thumb_path_lst.append(None)
+            self.__filmstrip_lst.append(None)
+            self.__row_map[v_path] = row
+        self.endInsertRows()
+
+    def set_thumbnail(self, video_path: str, thumbs: dict) -> None:
+        """
+        :param video_path: 썸네일이 추출된 영상 경로
+        :param thumbs: 추출된 {썸네일 너비: 썸네일 경로 또는 QImage}
+        해당 row만 dataChanged로 갱신, 캐시에 저장된 경로로 교체되면 QImage와 그 아이콘은 해제됨
+        """
+        row = self.__row_map.get(video_path)
+        if row is None:
+            return
+        self.__invalidate_icon(self.__thumb_path_lst[row])
+        self.__thumb_path_lst[row] = thumbs
+        idx = self.index(row, 0)
+        self.dataChanged.emit(idx, idx, [QtCore.Qt.DecorationRole])
+
+    def set_filmstrip(self, video_path: str, filmstrip_path: str) -> None:
+        """
+        :param video_path: 필름스트립이 추출된 영상 경로
+        :param filmstrip_path: 추출된 필름스트립 경로
+        """
+        row = self.__row_map.get(video_path)
+        if row is None:
+            return
+        self.__invalidate_icon({0: self.__filmstrip_lst[row]})
+        self.__filmstrip_lst[row] = filmstrip_path
+
+    def set_scrub(self, row: int, ratio: float) -> None:
+        """
+        :param row: 마우스 아래에 있는 아이템의 row
+        :param ratio: 아이템 위에서 마우스의 가로 위치 (0~1)
+        프레임이 바뀐 경우에만 해당 row를 갱신하므로 마우스 이동 중 디코딩은 발생하지 않음
+        """
+        frame = min(int(ratio * self.__filmstrip_frames), self.__filmstrip_frames - 1)
+        scrub = (row, frame)
+        if scrub == self.__scrub:
+            return
+        prev, self.__scrub = self.__scrub, scrub
+        if prev is not None and prev[0] != row:
+            self.__emit_decoration(prev[0])
+        self.__emit_decoration(row)
+
+    def clear_scrub(self) -> None:
+        """
+        탐색을 마치고 원래 썸네일로 되돌림
+        """
+        if self.__scrub is None:
+            return
+        row = self.__scrub[0]
+        self.__scrub = None
+        self.__emit_decoration(row)
+
+    def removeRows(self, row: int, count: int, parent=QtCore.QModelIndex()) -> bool:
+        """
+        :param row: 삭제를 시작할 row
+        :param count: 삭제할 row의 수
+        :return: 정상적으로 삭제되면 True, 범위를 벗어나면 False
+        """
+        if parent.isValid() or row < 0 or row + count > len(self.__video_path_lst):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        for thumbs in self.__thumb_path_lst[row : row + count]:
+            self.__invalidate_icon(thumbs)
+        for filmstrip in self.__filmstrip_lst[row : row + count]:
+            self.__invalidate_icon({0: filmstrip})
+        del self.__video_path_lst[row : row + count]
+        del self.__thumb_path_lst[row : row + count]
+        del self.__filmstrip_lst[row : row + count]
+        self.__scrub = None
+        self.__update_row_map()
+        self.endRemoveRows()
+        return True
+
+    def set_icon_size(self, size: QtCore.QSize) -> None:
+        """
+        :param size: 뷰에 표시될 아이콘 크기
+        이후 요청되는 아이콘은 해당 크기로 축소되어 캐시됨, 이전 크기의 캐시는 예산 안에서 유지
+        """
+        if size == self.__icon_size:
+            return
+        self.__icon_size = QtCore.QSize(size)
+        if self.rowCount():
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(self.rowCount() - 1, 0),
+                [QtCore.Qt.DecorationRole],
+            )
+
+    def video_path(self, row: int) -> str or None:
+        """
+        :return: 해당 row의 영상 경로, 존재하지 않으면 None
+        """
+        if 0 <= row < len(self.__video_path_lst):
+            return self.__video_path_lst[row]
+        return None
+
+    def __pick_level(self, thumbs: dict) -> str or QtGui.QImage:
+        """
+        :param thumbs: {썸네일 너비: 썸네일 경로 또는 QImage}
+        :return: 현재 아이콘 너비보다 크거나 같은 것 중 가장 작은 썸네일,
+                 아이콘이 모든 썸네일보다 크면 가장 큰 썸네일
+        """
+        levels = sorted(thumbs.keys())
+        for level in levels:
+            if level >= self.__icon_size.width():
+                return thumbs[level]
+        return thumbs[levels[-1]]
+
+    @staticmethod
+    def __thumb_key(thumb: str or QtGui.QImage) -> str or int:
+        """
+        :return: 썸네일 경로, QImage인 경우 이미지마다 고유한 cacheKey
+        """
+        if isinstance(thumb, QtGui.QImage):
+            return thumb.cacheKey()
+        return thumb
+
+    def __get_icon(self, thumb: str or QtGui.QImage) -> QtGui.QIcon:
+        """
+        :param thumb: 썸네일 경로 또는 메모리에서 추출된 QImage
+        :return: 현재 아이콘 크기로 축소된 QIcon
+        캐시에 없는 경우에만 디스크에서 읽어 디코딩하므로 다시 그릴 때 디스크를 읽지 않음
+        """
+        thumb_key = self.__thumb_key(thumb)
+        key = (thumb_key, self.__icon_size.width(), self.__icon_size.height())
+        icon = self.__icon_cache.get(key)
+        if icon is not None:
+            return icon
+        if isinstance(thumb, QtGui.QImage):
+            pixmap = QtGui.QPixmap.fromImage(thumb)
+        else:
+            pixmap = QtGui.QPixmap(thumb)
+        if not pixmap.isNull():
+            pixmap = pixmap.scaled(
+                self.__icon_size,
+                QtCore.Qt.KeepAspectRatio,
+                QtCore.Qt.SmoothTransformation,
+            )
+        icon = QtGui.QIcon(pixmap)
+        nbytes = pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+        self.__put_icon(key, icon, nbytes)
+        return icon
+
+    def __get_placeholder(self) -> QtGui.QIcon:
+        """
+        :return: 현재 아이콘 크기(16:9)로 만든 회색 아이콘
+        썸네일이 도착하기 전에도 아이템의 크기와 배치가 바뀌지 않도록 같은 크기로 표시
+        """
+        width = self.__icon_size.width()
+        height = min(self.__icon_size.height(), width * 9 // 16)
+        if self.__placeholder is None or self.__placeholder[0] != (width, height):
+            pixmap = QtGui.QPixmap(max(width, 1), max(height, 1))
+            pixmap.fill(QtGui.QColor(50, 50, 50))
+            self.__placeholder = ((width, height), QtGui.QIcon(pixmap))
+        return self.__placeholder[1]
+
+    def __get_frame_icon(self, filmstrip_path: str, frame: int) -> QtGui.QIcon:
+        """
+        :param filmstrip_path: 필름스트립 경로
+        :param frame: 필름스트립에서 잘라낼 프레임 번호
+        :return: 현재 아이콘 크기로 축소된 해당 프레임의 QIcon
+        필름스트립은 한 번만 디코딩하여 캐시하고, 이후에는 메모리에서 잘라내기만 함
+        """
+        size = (self.__icon_size.width(), self.__icon_size.height())
+        key = (filmstrip_path, frame) + size
+        icon = self.__icon_cache.get(key)
+        if icon is not None:
+            return icon
+        image_key = (filmstrip_path, -1, 0, 0)
+        image = self.__icon_cache.get(image_key)
+        if image is None:
+            image = QtGui.QImage(filmstrip_path)
+            self.__put_icon(image_key, image, image.sizeInBytes())
+        tile_width = image.width() // self.__filmstrip_frames
+        pixmap = QtGui.QPixmap.fromImage(
+            image.copy(tile_width * frame, 0, tile_width, image.height())
+        )
+        if not pixmap.isNull():
+            pixmap = pixmap.scaled(
+                self.__icon_size,
+                QtCore.Qt.KeepAspectRatio,
+                QtCore.Qt.SmoothTransformation,
+            )
+        icon = QtGui.QIcon(pixmap)
+        nbytes = pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+        self.__put_icon(key, icon, nbytes)
+        return icon
+
+    def __put_icon(self, key: tuple, value, nbytes: int) -> None:
+        """
+        :param key: (썸네일 키 또는 필름스트립 경로, ...) 형식의 캐시 키
+        캐시에 저장하고, 용량을 넘어 삭제된 항목은 무효화용 키 목록에서도 제거
+        """
+        self.__icon_keys.setdefault(key[0], set()).add(key)
+        for evicted, _ in self.__icon_cache.put(key, value, nbytes):
+            keys = self.__icon_keys.get(evicted[0])
+            if keys is None:
+                continue
+            keys.discard(evicted)
+            if not keys:
+                del self.__icon_keys[evicted[0]]
+
+    def __emit_decoration(self, row: int) -> None:
+        """
+        :param row: 아이콘을 다시 그릴 row
+        """
+        if 0 <= row < self.rowCount():
+            idx = self.index(row, 0)
+            self.dataChanged.emit(idx, idx, [QtCore.Qt.DecorationRole])
+
+    def __invalidate_icon(self, thumbs: dict or None) -> None:
+        """
+        :param thumbs: 캐시에서 제거할 {썸네일 너비: 썸네일 경로 또는 QImage}
+        삭제되거나 교체된 썸네일의 아이콘을 모든 해상도, 크기에 대해 캐시에서 제거
+        """
+        if thumbs is None:
+            return
+        for thumb in thumbs.values():
+            for key in self.__icon_keys.pop(self.__thumb_key(thumb), ()):
+                self.__icon_cache.pop(key)
+
+    def __update_row_map(self) -> None:
         """
-        :return: 썸네일의 수를  int로 반환
+        row가 삭제되어 인덱스가 바뀐 경우 {영상 경로: row}를 다시 구성
         """
-        return len(self.__thumb_path_lst)
+        self.__row_map = {
+            v_path: row for row, v_path in enumerate(self.__video_path_lst)
+        }
 
 
 class NP_ListModel(QtCore.QAbstractListModel):  # -> 플레이리스트를 관리하는 model
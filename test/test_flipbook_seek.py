@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# encoding=utf-8
+
+# author        :   Juno Park
+# created date  :   2026.10.18
+# modified date :   2026.10.18
+# description   :   링보다 긴 영상에서 FlipbookPlayer가 링의 용량보다 멀리 뒤로 탐색했을 때
+#                   덮어쓴 프레임을 다시 디코딩하여 표시하는지 확인
+#                   (디코더가 링이 가득 찬 채로 기다리면 프레임이 표시되지 않고 멈춤)
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import ffmpeg
+from PySide2 import QtCore
+from NP_libs.player import flipbook
+
+width, height, fps, seconds = 320, 240, 24, 10  # -> 테스트용 영상 (240프레임)
+capacity = 48  # -> 링에 들어가는 프레임 수
+timeout = 10  # -> 프레임이 표시될 때까지 기다리는 시간(초)
+
+if not flipbook.FlipbookPlayer.available():
+    print("NumPy가 없어 FlipbookPlayer를 사용할 수 없음")
+    sys.exit()
+
+app = QtCore.QCoreApplication(sys.argv)
+temp_dir = tempfile.mkdtemp(prefix="NP_bench_")
+clip = os.path.join(temp_dir, "testsrc.mp4")
+ffmpeg.input(
+    f"testsrc=size={width}x{height}:rate={fps}:duration={seconds}", format="lavfi"
+).output(clip, pix_fmt="yuv420p").run(quiet=True, overwrite_output=True)
+
+player = flipbook.FlipbookPlayer(
+    clip, cache_bytes=capacity * width * height * 3
+)
+shown = list()
+player.frame_changed.connect(lambda image: shown.append(player.current_frame()))
+
+
+def wait_for(index: int) -> bool:
+    # 이벤트를 처리하며 해당 프레임이 표시될 때까지 기다림
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        app.processEvents()
+        if shown and shown[-1] == index:
+            return True
+        time.sleep(0.005)
+    return False
+
+
+# 링의 용량보다 멀리 재생하여 앞쪽 프레임이 덮어써지도록 함
+player.play()
+deadline = time.perf_counter() + timeout
+while player.current_frame() < capacity * 2 and time.perf_counter() < deadline:
+    app.processEvents()
+    time.sleep(0.005)
+player.pause()
+last = player.current_frame()
+print(f"재생 위치: {last} 프레임 (링 용량 {capacity} 프레임)")
+
+failed = 0
+for target in [last - capacity - 1, 10, 0]:
+    player.step(target - player.current_frame())
+    ok = wait_for(target)
+    failed += not ok
+    print(f"{last:4d} -> {target:4d} 프레임 탐색  {'OK' if ok else 'FAIL (멈춤)'}")
+
+player.release()
+shutil.rmtree(temp_dir)
+print("PASS" if not failed else f"FAIL: {failed}")
@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# encoding=utf-8
+
+# author        :   Juno Park
+# created date  :   2026.10.18
+# modified date :   2026.10.18
+# description   :   음수 프레임이 포함된 시퀀스의 패딩 확인
+#                   Nuke, ffmpeg의 %04d는 음수 부호도 한 자리로 계산하므로
+#                   shot.-003.exr ~ shot.0002.exr은 패딩 4의 시퀀스로 인식되어야 함
+
+import os
+import sys
+import shutil
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from NP_libs.system import sequence as sequence_lib
+
+cases = [
+    # (프레임 번호, printf 패딩, 기대하는 패턴의 패딩)
+    (range(-3, 3), 4, 4),
+    (range(-12, -5), 4, 4),
+    (range(-5, 6), 1, 1),
+    (range(1001, 1011), 4, 4),
+]
+
+failed = 0
+for frames, width, expected in cases:
+    temp_dir = tempfile.mkdtemp(prefix="NP_seq_")
+    for frame in frames:
+        open(os.path.join(temp_dir, f"shot.{frame:0{width}d}.exr"), "w").close()
+    sequences, others = sequence_lib.SequenceScanner().scan(temp_dir)
+    seq = sequences[0] if len(sequences) == 1 else None
+    ok = (
+        seq is not None
+        and not others
+        and seq.padding == expected
+        and seq.frames == tuple(frames)
+        and all(os.path.isfile(seq.frame_path(frame)) for frame in frames)
+        and seq.pattern.endswith(f"shot.%0{expected}d.exr")
+    )
+    failed += not ok
+    print(f"{frames.start:5d} ~ {frames.stop - 1:5d} (%0{width}d)  {seq!r}  {'OK' if ok else 'FAIL'}")
+    shutil.rmtree(temp_dir)
+
+print("PASS" if not failed else f"FAIL: {failed}")
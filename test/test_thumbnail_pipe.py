@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# encoding=utf-8
+
+# author        :   Juno Park
+# created date  :   2026.10.18
+# modified date :   2026.10.18
+# description   :   jpg 파일을 거치는 썸네일 추출과 rawvideo 파이프를 통한 썸네일 추출 시간 비교
+#                   두 방식 모든 해상도의 QImage를 얻을 때까지의 시간을 측정함
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import pathlib
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from PySide2 import QtCore, QtGui
+from NP_libs.system import library as sys_lib
+from NP_libs.system import cache as cache_lib
+from NP_libs import NP_Utils
+
+video_dir = "/home/rapa/Downloads/plates"  # -> 테스트용 영상이 담긴 디렉토리
+levels = sorted(cache_lib.MediaCache.THUMBNAIL_LEVELS, reverse=True)
+
+videos = [
+    f.as_posix()
+    for f in sys_lib.System.get_files(pathlib.Path(video_dir), [".mov", ".mp4", ".MOV"])
+]
+print(f"영상 수: {len(videos)}")
+
+
+def jpeg_round_trip(video_path: str, out_dir: str) -> dict:
+    # ffmpeg가 jpg로 인코딩하여 디스크에 쓰고, 다시 읽어 디코딩
+    paths = {level: os.path.join(out_dir, f"thumbnail_{level}.jpg") for level in levels}
+    NP_Utils.NP_Utils.extract_thumbnail_levels(video_path, paths)
+    return {level: QtGui.QImage(path) for level, path in paths.items()}
+
+
+def raw_pipe(video_path: str, out_dir: str) -> dict:
+    # ffmpeg의 rgb24 출력을 바로 QImage로 만들고, 작은 해상도는 메모리에서 축소
+    image = NP_Utils.NP_Utils.extract_thumbnail_image(video_path, levels[0])
+    thumbs = {levels[0]: image}
+    for level in levels[1:]:
+        thumbs[level] = image.scaledToWidth(level, QtCore.Qt.SmoothTransformation)
+    return thumbs
+
+
+base_time = None
+for name, func in [("jpeg round-trip", jpeg_round_trip), ("rawvideo pipe", raw_pipe)]:
+    out_dir = tempfile.mkdtemp(prefix="NP_bench_")
+    start = time.perf_counter()
+    for video in videos:
+        func(video, out_dir)
+    elapsed = time.perf_counter() - start
+    shutil.rmtree(out_dir)
+    if base_time is None:
+        base_time = elapsed
+    print(
+        f"{name:<16} {elapsed:8.2f}s  "
+        f"{elapsed / max(len(videos), 1) * 1000:7.1f} ms/clip  x{base_time / elapsed:.2f}"
+    )
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# encoding=utf-8
+
+# author        :   Juno Park
+# created date  :   2026.10.18
+# modified date :   2026.10.18
+# description   :   워커 수에 따른 썸네일 추출 시간 측정
+#                   Extract_Tuhmbnails_Thread의 큐가 빌 때까지의 벽시계 시간을 비교함
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import pathlib
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from PySide2 import QtCore
+from NP_libs.system import library as sys_lib
+from NP_libs.system import cache as cache_lib
+import main_ex
+
+video_dir = "/home/rapa/Downloads/plates"  # -> 테스트용 영상이 담긴 디렉토리
+worker_counts = [1, 2, 4, 8, 16, 32]
+
+videos = [
+    f.as_posix()
+    for f in sys_lib.System.get_files(pathlib.Path(video_dir), [".mov", ".mp4", ".MOV"])
+]
+print(f"영상 수: {len(videos)}")
+app = QtCore.QCoreApplication(sys.argv)  # -> queue_drained 시그널을 받기 위한 이벤트 루프
+
+base_time = None
+for workers in worker_counts:
+    thumb_dir = tempfile.mkdtemp(prefix="NP_bench_")  # -> 매번 빈 캐시에서 시작
+    thumb_cache = cache_lib.MediaCache(thumb_dir)
+    thread = main_ex.Extract_Tuhmbnails_Thread(thumb_cache, workers)
+    loop = QtCore.QEventLoop()
+    thread.queue_drained.connect(loop.quit)  # -> 큐가 비면 측정 종료
+    start = time.perf_counter()
+    thread.enqueue(videos)
+    thread.start()
+    loop.exec_()
+    elapsed = time.perf_counter() - start
+    thread.stop()
+    shutil.rmtree(thumb_dir)
+    if base_time is None:
+        base_time = elapsed
+    print(
+        f"workers={workers:>2}  {elapsed:8.2f}s  "
+        f"{len(videos) / elapsed:6.1f} clips/s  x{base_time / elapsed:.2f}"
+    )
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# encoding=utf-8
+
+# author        :   Juno Park
+# created date  :   2026.10.18
+# modified date :   2026.10.18
+# description   :   멀티 뷰어 타일의 디코딩 속도 비교
+#                   원본 크기로 디코딩한 뒤 화면에서 축소하는 방식과 ffmpeg가 타일 크기로 축소하여
+#                   파이프로 넘겨주는 방식을 같은 수의 타일로 동시에 디코딩하여 타일당 fps를 측정함
+
+import os
+import sys
+import math
+import time
+import pathlib
+import threading
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import ffmpeg
+from PySide2 import QtCore, QtGui
+from NP_libs.system import library as sys_lib
+from NP_libs import NP_Utils
+
+video_dir = "/home/rapa/Downloads/plates"  # -> 테스트용 영상이 담긴 디렉토리
+screen_size = (1920, 1080)  # -> 멀티 뷰어 창의 크기
+tile_count = 9  # -> 동시에 재생하는 타일 수
+seconds = 10  # -> 방식마다 디코딩하는 시간(초)
+
+videos = [
+    f.as_posix()
+    for f in sys_lib.System.get_files(pathlib.Path(video_dir), [".mov", ".mp4", ".MOV"])
+]
+print(f"영상 수: {len(videos)}")
+if not videos:
+    sys.exit()
+
+# 멀티 뷰어와 같이 정사각형에 가까운 격자로 나눈 타일 하나의 크기
+cols = math.ceil(math.sqrt(tile_count))
+rows = math.ceil(tile_count / cols)
+tile_size = (screen_size[0] // cols, screen_size[1] // rows)
+print(f"타일 수: {tile_count}, 타일 크기: {tile_size[0]}x{tile_size[1]}")
+
+
+def decode(video_path: str, tile_decode: bool, deadline: float, result: list) -> None:
+    info = NP_Utils.NP_Utils.get_media_info(video_path)
+    width, height = info.width, info.height
+    stream = ffmpeg.input(video_path, stream_loop=-1)
+    if tile_decode:
+        # 타일 안에 들어가도록 비율을 유지하여 축소 (짝수)
+        scale = min(tile_size[0] / width, tile_size[1] / height, 1)
+        width = max(2, int(width * scale) // 2 * 2)
+        height = max(2, int(height * scale) // 2 * 2)
+        stream = stream.filter("scale", width, height)
+    process = stream.output(
+        "pipe:", format="rawvideo", pix_fmt="rgb24"
+    ).run_async(pipe_stdout=True, pipe_stderr=True, quiet=True)
+    frame_bytes = width * height * 3
+    frames = 0
+    while time.perf_counter() < deadline:
+        data = process.stdout.read(frame_bytes)
+        if len(data) < frame_bytes:
+            break
+        image = QtGui.QImage(data, width, height, width * 3, QtGui.QImage.Format_RGB888)
+        if not tile_decode:
+            # 원본 크기로 디코딩한 경우 화면에 그리기 전에 타일 크기로 축소
+            image = image.scaled(
+                tile_size[0], tile_size[1], QtCore.Qt.KeepAspectRatio,
+                QtCore.Qt.SmoothTransformation,
+            )
+        frames += 1
+    process.kill()
+    process.wait()
+    result.append(frames)
+
+
+base_fps = None
+for name, tile_decode in [("full res + scale", False), ("tile res pipe", True)]:
+    result = list()
+    deadline = time.perf_counter() + seconds
+    threads = [
+        threading.Thread(
+            target=decode, args=(videos[i % len(videos)], tile_decode, deadline, result)
+        )
+        for i in range(tile_count)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    fps = sum(result) / max(len(result), 1) / elapsed
+    if base_fps is None:
+        base_fps = fps
+    print(
+        f"{name:<18} {fps:7.1f} fps/tile  "
+        f"(min {min(result, default=0) / elapsed:.1f})  x{fps / max(base_fps, 1e-9):.2f}"
+    )
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# encoding=utf-8
+
+# author        :   Juno Park
+# created date  :   2026.10.18
+# modified date :   2026.10.18
+# description   :   System의 기존 파일 탐색 메서드 3개와 scandir 기반의 walk_files 비교
+#                   첫 번째 결과가 나올 때까지의 시간과 전체 탐색 시간을 측정함
+
+import os
+import sys
+import time
+import pathlib
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from NP_libs.system import library as sys_lib
+
+root_dir = "/home/rapa/Downloads"  # -> 탐색할 디렉토리 (NFS 경로에서 차이가 큼)
+pattern = [".mov", ".mp4", ".MOV"]
+
+walkers = [
+    ("get_files", lambda: sys_lib.System.get_files(pathlib.Path(root_dir), pattern)),
+    (
+        "get_files_lst",
+        lambda: iter(sys_lib.System.get_files_lst(pathlib.Path(root_dir), pattern)),
+    ),
+    (
+        "get_files_recursion",
+        lambda: sys_lib.System.get_files_recursion(root_dir, pattern),
+    ),
+    ("walk_files", lambda: sys_lib.System.walk_files(root_dir, pattern)),
+]
+
+base_time = None
+for name, func in walkers:
+    start = time.perf_counter()
+    first = None
+    count = 0
+    for _ in func():
+        if first is None:
+            first = time.perf_counter() - start
+        count += 1
+    elapsed = time.perf_counter() - start
+    if base_time is None:
+        base_time = elapsed
+    print(
+        f"{name:<20} {count:6d} files  first {(first or 0) * 1000:8.1f} ms  "
+        f"total {elapsed:7.2f}s  x{base_time / elapsed:.2f}"
+    )
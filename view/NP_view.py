@@ -3,7 +3,7 @@
 
 # author        :   Juno Park
 # created date  :   2024.03.03
-# modified date :   2024.03.23
+# modified date :   2026.10.18
 # description   :   mvc 패턴으로 구성된 Nuke_player의 View 역할을 하는 클래스
 #                   Item을 관리하는 ListView와 Text를 관리하는 ListView로 구성됨
 
@@ -12,8 +12,19 @@ from PySide2 import QtWidgets, QtGui, QtCore
 
 
 class NP_ItemView(QtWidgets.QListView):  # -> 아이템을 등록하고 관리하는 ListView
+    scrub = QtCore.Signal(QtCore.QModelIndex, float)  # -> (마우스 아래 아이템, 가로 위치 0~1)
+    scrub_left = QtCore.Signal()  # -> 마우스가 아이템을 벗어남
+    visible_changed = QtCore.Signal()  # -> 스크롤, 크기 변경 등으로 보이는 아이템이 바뀜
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.__scrub_enabled = False
+        # 스크롤 중 매번 발생하지 않도록 움직임이 멈춘 뒤 한 번만 visible_changed를 발생
+        self.__visible_timer = QtCore.QTimer(self)
+        self.__visible_timer.setSingleShot(True)
+        self.__visible_timer.setInterval(100)
+        self.__visible_timer.timeout.connect(self.visible_changed.emit)
+        self.verticalScrollBar().valueChanged.connect(self.__visible_timer.start)
         self.setFont(QtGui.QFont("Sans Serif", 9))
         self.setFrameShape(QtWidgets.QFrame.Panel)
         self.setFrameShadow(QtWidgets.QFrame.Sunken)
@@ -34,6 +45,51 @@ class NP_ItemView(QtWidgets.QListView):  # -> 아이템을 등록하고 관리
             "QToolTip {font-family: Sans Serif; font-size: 12px;}"
         )
 
+    def visible_rows(self) -> list[int]:
+        """
+        :return: 현재 뷰포트에 보이는 아이템의 row가 위에서부터 담긴 리스트
+        """
+        model = self.model()
+        if model is None:
+            return []
+        viewport_rect = self.viewport().rect()
+        rows = []
+        for row in range(model.rowCount()):
+            if self.visualRect(model.index(row, 0)).intersects(viewport_rect):
+                rows.append(row)
+        return rows
+
+    def updateGeometries(self) -> None:
+        # 아이템 배치가 바뀌는 경우(아이콘 크기 변경, 창 크기 변경, 아이템 추가/삭제)
+        super().updateGeometries()
+        self.__visible_timer.start()
+
+    def set_scrub_enabled(self, enabled: bool) -> None:
+        """
+        :param enabled: True면 마우스 이동 시 아이템 위의 가로 위치를 scrub 시그널로 전달
+        """
+        self.__scrub_enabled = enabled
+        self.setMouseTracking(enabled)
+        if not enabled:
+            self.scrub_left.emit()
+
+    def mouseMoveEvent(self, event: QtGui.QMouseEvent) -> None:
+        super().mouseMoveEvent(event)
+        if not self.__scrub_enabled:
+            return
+        idx = self.indexAt(event.pos())
+        if not idx.isValid():
+            self.scrub_left.emit()
+            return
+        rect = self.visualRect(idx)
+        ratio = (event.pos().x() - rect.left()) / max(rect.width(), 1)
+        self.scrub.emit(idx, min(max(ratio, 0.0), 1.0))
+
+    def leaveEvent(self, event: QtCore.QEvent) -> None:
+        super().leaveEvent(event)
+        if self.__scrub_enabled:
+            self.scrub_left.emit()
+
 
 class NP_ListView(QtWidgets.QListView):  # -> 선택된 아이템(플레이리스트)을 관리하는 ListView
     def __init__(self, parent=None):